@@ -0,0 +1,219 @@
+"""
+Local on-disk store for Alpaca stock bars with incremental refresh.
+
+Bars are kept in SQLite (TABLE 'stock_bars', one row per symbol/ timeframe/ bar timestamp) next to
+a coverage table recording which date ranges have already been fetched per symbol and timeframe
+(one row per disjoint range, ranges that overlap or touch are merged into one).
+A request only calls the API for the parts of [start, end] outside the covered ranges, everything
+else is served from disk. Coverage is tracked separately from the bars themselves because weekends
+and holidays have no bars, so gaps in the bars alone do not mean missing data.
+
+Today's bar is still forming, so coverage never extends past yesterday and a request reaching today
+always refetches from the end of the last covered range.
+
+Any object with get_stock_bars(StockBarsRequest) returning something with a .df (the
+StockHistoricalDataClient interface) can be passed as client, e.g. a local stub in tests.
+"""
+from alpaca.data import StockHistoricalDataClient
+from alpaca.data.requests import StockBarsRequest
+from alpaca.data.timeframe import TimeFrame
+import datetime
+import pandas as pd
+
+from alpaca_api.clients import get_client
+from db.sqlite.db_utils import get_connection
+
+BAR_COLUMNS = ("open", "high", "low", "close", "volume")
+
+
+class BarStore:
+    def __init__(
+            self,
+            db_path: str = "market_data.db",
+            client=None  # StockHistoricalDataClient-like, shared alpaca_api.clients client when None
+    ):
+        self.db_path = db_path
+        self._client = client
+        self.api_calls = 0
+        self._initialized = False
+
+    @property
+    def client(self):
+        if self._client is None:
+            self._client = get_client(StockHistoricalDataClient)
+        return self._client
+
+    def get_bars(
+            self,
+            symbol: str,
+            start: datetime.date,  # inclusive
+            end: datetime.date,  # inclusive
+            timeframe: TimeFrame = TimeFrame.Day
+    ) -> pd.DataFrame:
+        """
+        Returns bars between start and end (by bar date) as a DataFrame of BAR_COLUMNS
+        indexed by bar timestamp (DatetimeIndex), fetching only the dates not yet stored.
+        """
+        start, end = _as_date(start), _as_date(end)
+        self.refresh(symbol, start, end, timeframe)
+
+        rows = self._connection().execute(
+            f'''
+            SELECT timestamp, {", ".join(BAR_COLUMNS)} FROM stock_bars
+            WHERE symbol = ? AND timeframe = ? AND date BETWEEN ? AND ?
+            ORDER BY timestamp
+            ''',
+            (symbol, str(timeframe), start.isoformat(), end.isoformat())
+        ).fetchall()
+        bars = pd.DataFrame(rows, columns=("timestamp",) + BAR_COLUMNS)
+        return bars.set_index(pd.DatetimeIndex(pd.to_datetime(bars.pop("timestamp"), format="ISO8601"), name="timestamp"))
+
+    def refresh(
+            self,
+            symbol: str,
+            start: datetime.date,
+            end: datetime.date,
+            timeframe: TimeFrame = TimeFrame.Day
+    ) -> None:
+        """
+        Fetch and store whatever parts of [start, end] are not covered yet.
+        """
+        start, end = _as_date(start), _as_date(end)
+        covered = self.coverage(symbol, timeframe)
+        for missing_start, missing_end in _missing_ranges(start, end, covered):
+            self._fetch(symbol, missing_start, missing_end, timeframe)
+
+        # only completed days count as covered
+        final_end = min(end, datetime.date.today() - datetime.timedelta(days=1))
+        if final_end >= start:
+            self._set_coverage(symbol, timeframe, _merge_ranges(covered + [(start, final_end)]))
+
+    def coverage(self, symbol: str, timeframe: TimeFrame = TimeFrame.Day) -> list:
+        """
+        Disjoint (first, last) date ranges already fetched for symbol/ timeframe, in date order.
+        """
+        rows = self._connection().execute(
+            "SELECT start_date, end_date FROM stock_bar_ranges WHERE symbol = ? AND timeframe = ? ORDER BY start_date",
+            (symbol, str(timeframe))
+        ).fetchall()
+        return [(datetime.date.fromisoformat(first), datetime.date.fromisoformat(last)) for first, last in rows]
+
+    def _fetch(self, symbol: str, start: datetime.date, end: datetime.date, timeframe: TimeFrame) -> None:
+        req_params = StockBarsRequest(
+            symbol_or_symbols=symbol,
+            timeframe=timeframe,
+            start=datetime.datetime.combine(start, datetime.time()),
+            end=datetime.datetime.combine(end + datetime.timedelta(days=1), datetime.time())  # end date inclusive
+        )
+        bars = self.client.get_stock_bars(req_params).df
+        self.api_calls += 1
+        if bars.empty:  # weekends/ holidays only
+            return
+        if isinstance(bars.index, pd.MultiIndex):
+            bars = bars.droplevel("symbol" if "symbol" in bars.index.names else 0)
+
+        timestamps = pd.DatetimeIndex(pd.to_datetime(bars.index))
+        values = bars[list(BAR_COLUMNS)].to_numpy(dtype=float).tolist()
+        rows = [
+            (symbol, str(timeframe), ts.isoformat(), ts.date().isoformat(), *bar)
+            for ts, bar in zip(timestamps, values)
+        ]
+        conn = self._connection()
+        with conn:
+            conn.executemany(
+                f'''
+                INSERT OR REPLACE INTO stock_bars (symbol, timeframe, timestamp, date, {", ".join(BAR_COLUMNS)})
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+                ''',
+                rows
+            )
+
+    def _set_coverage(self, symbol: str, timeframe: TimeFrame, ranges: list) -> None:
+        conn = self._connection()
+        with conn:
+            conn.execute("DELETE FROM stock_bar_ranges WHERE symbol = ? AND timeframe = ?", (symbol, str(timeframe)))
+            conn.executemany(
+                "INSERT INTO stock_bar_ranges (symbol, timeframe, start_date, end_date) VALUES (?, ?, ?, ?)",
+                [(symbol, str(timeframe), first.isoformat(), last.isoformat()) for first, last in ranges]
+            )
+
+    def _connection(self):
+        conn = get_connection(self.db_path)
+        if not self._initialized:
+            conn.execute(
+                '''
+                CREATE TABLE IF NOT EXISTS stock_bars (
+                    symbol TEXT,
+                    timeframe TEXT,
+                    timestamp TEXT,
+                    date TEXT,
+                    open REAL,
+                    high REAL,
+                    low REAL,
+                    close REAL,
+                    volume REAL,
+                    PRIMARY KEY (symbol, timeframe, timestamp)
+                )
+                '''
+            )
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_stock_bars_date ON stock_bars (symbol, timeframe, date)")
+            conn.execute(
+                '''
+                CREATE TABLE IF NOT EXISTS stock_bar_ranges (
+                    symbol TEXT,
+                    timeframe TEXT,
+                    start_date TEXT,
+                    end_date TEXT,
+                    PRIMARY KEY (symbol, timeframe, start_date)
+                )
+                '''
+            )
+            conn.commit()
+            self._initialized = True
+        return conn
+
+
+"""
+Helper to accept dates, datetimes and "YYYY-MM-DD" strings alike.
+"""
+def _as_date(value) -> datetime.date:
+    if isinstance(value, str):
+        value = datetime.date.fromisoformat(value[:10])
+    if isinstance(value, datetime.datetime):
+        value = value.date()
+    return value
+
+
+"""
+Helper returning the sub ranges of [start, end] outside the covered ranges (disjoint, in date order),
+i.e. the gaps before, between and after the covered ranges it overlaps.
+"""
+def _missing_ranges(start: datetime.date, end: datetime.date, covered: list) -> list:
+    one_day = datetime.timedelta(days=1)
+    missing = []
+    for first, last in covered:
+        if last < start or first > end:
+            continue
+        if start < first:
+            missing.append((start, first - one_day))
+        start = last + one_day
+    if start <= end:
+        missing.append((start, end))
+    return missing
+
+
+"""
+Helper merging (first, last) date ranges that overlap or touch (next day), returns them disjoint in date order.
+"""
+def _merge_ranges(ranges: list) -> list:
+    merged = []
+    for first, last in sorted(ranges):
+        if merged and first <= merged[-1][1] + datetime.timedelta(days=1):
+            merged[-1] = (merged[-1][0], max(merged[-1][1], last))
+        else:
+            merged.append((first, last))
+    return merged
+
+
+# Shared store used by alpaca_api.options
+bar_store = BarStore()
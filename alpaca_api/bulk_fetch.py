@@ -0,0 +1,116 @@
+"""
+Concurrent multi-symbol fetching of stock bars and option chains.
+
+Requests run on a thread pool over the shared clients of alpaca_api.clients, so throughput is bounded
+by the shared RateLimiter (the API limit) rather than by serial round trips. Stock bars for many
+symbols are also packed SYMBOLS_PER_REQUEST at a time into one StockBarsRequest, which Alpaca supports
+natively; option chains are one request per underlying.
+
+Every function returns (results, errors): dicts keyed by symbol, a failing symbol lands in errors with
+its exception instead of aborting the whole refresh.
+"""
+from concurrent.futures import ThreadPoolExecutor
+
+from alpaca.data import OptionHistoricalDataClient, StockHistoricalDataClient
+from alpaca.data.requests import OptionChainRequest, StockBarsRequest
+from alpaca.data.timeframe import TimeFrame
+import datetime
+import pandas as pd
+
+from alpaca_api.bar_store import _as_date
+from alpaca_api.clients import get_client
+
+# Symbols per multi-symbol bars request
+SYMBOLS_PER_REQUEST = 100
+
+# Threads issuing requests, the rate limiter decides the actual request rate
+MAX_WORKERS = 8
+
+
+def fetch_stock_bars(
+        symbols: list,
+        start: datetime.date,
+        end: datetime.date,
+        timeframe: TimeFrame = TimeFrame.Day,
+        store=None,  # alpaca_api.bar_store.BarStore, fetch only what it does not hold yet
+        max_workers: int = MAX_WORKERS
+) -> tuple:
+    """
+    Bars DataFrame (indexed by timestamp) per symbol, start and end dates inclusive with or without store.
+    """
+    symbols = list(dict.fromkeys(symbols))
+    if store is not None:
+        return _run_concurrently(
+            {symbol: (store.get_bars, symbol, start, end, timeframe) for symbol in symbols},
+            max_workers
+        )
+
+    groups = [symbols[i:i+SYMBOLS_PER_REQUEST] for i in range(0, len(symbols), SYMBOLS_PER_REQUEST)]
+    group_results, group_errors = _run_concurrently(
+        {tuple(group): (_fetch_bars_group, group, start, end, timeframe) for group in groups},
+        max_workers
+    )
+
+    results, errors = {}, {}
+    for group, bars in group_results.items():
+        for symbol in group:
+            results[symbol] = bars.get(symbol, pd.DataFrame())
+    for group, error in group_errors.items():
+        errors.update(dict.fromkeys(group, error))
+    return results, errors
+
+
+def fetch_option_chains(
+        symbols: list,  # underlyings
+        max_workers: int = MAX_WORKERS,
+        **chain_filters  # OptionChainRequest fields, e.g. expiration_date_gte, type, strike_price_gte
+) -> tuple:
+    """
+    Option chain snapshots ({OCC symbol: snapshot}) per underlying.
+    """
+    chain_filters.setdefault("feed", "indicative")  # free plan
+    return _run_concurrently(
+        {symbol: (_fetch_option_chain, symbol, chain_filters) for symbol in dict.fromkeys(symbols)},
+        max_workers
+    )
+
+
+"""
+Helper to run {key: (fn, *args)} on a thread pool, returning ({key: result}, {key: exception}).
+"""
+def _run_concurrently(tasks: dict, max_workers: int) -> tuple:
+    results, errors = {}, {}
+    if not tasks:
+        return results, errors
+
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(tasks))) as pool:
+        futures = {key: pool.submit(fn, *args) for key, (fn, *args) in tasks.items()}
+        for key, future in futures.items():
+            try:
+                results[key] = future.result()
+            except Exception as error:
+                errors[key] = error
+    return results, errors
+
+
+def _fetch_bars_group(symbols: list, start, end, timeframe: TimeFrame) -> dict:
+    client = get_client(StockHistoricalDataClient)
+    start, end = _as_date(start), _as_date(end)
+    req_params = StockBarsRequest(
+        symbol_or_symbols=symbols,
+        timeframe=timeframe,
+        start=datetime.datetime.combine(start, datetime.time()),
+        end=datetime.datetime.combine(end + datetime.timedelta(days=1), datetime.time())  # end date inclusive, as BarStore
+    )
+    bars = client.get_stock_bars(req_params).df
+    if bars.empty:
+        return {}
+    return {
+        symbol: symbol_bars.droplevel("symbol")
+        for symbol, symbol_bars in bars.groupby(level="symbol")
+    }
+
+
+def _fetch_option_chain(symbol: str, chain_filters: dict) -> dict:
+    client = get_client(OptionHistoricalDataClient)
+    return client.get_option_chain(OptionChainRequest(underlying_symbol=symbol, **chain_filters))
@@ -0,0 +1,104 @@
+"""
+Shared Alpaca client registry with rate-limit-aware throttling.
+
+Alpaca's REST clients each hold a requests.Session, so reusing one client per (client class, API key)
+keeps HTTP connections alive across calls instead of a new TCP/ TLS handshake per function call.
+get_client returns the shared client wrapped in ThrottledClient: every API method call first takes a
+token from the process wide RateLimiter (Alpaca's free plan allows 200 requests/ minute), so concurrent
+fetches (see alpaca_api.bulk_fetch) stay within the API limit instead of failing. HTTP 429 responses
+that still occur are retried by alpaca-py's RESTClient itself (3 retries, 3 seconds apart), the only
+retry layer.
+
+The client class is passed in by the caller (e.g. alpaca_api.stocks passes its own
+StockHistoricalDataClient import), so patching that name in tests yields a fresh mock per test.
+"""
+from dotenv import load_dotenv
+import os
+import threading
+import time
+
+load_dotenv()
+
+# Alpaca free plan: 200 API calls/ minute, override with ALPACA_RATE_LIMIT
+RATE_LIMIT_CALLS = int(os.getenv("ALPACA_RATE_LIMIT", 200))
+RATE_LIMIT_PERIOD = 60.0  # seconds
+
+
+"""
+Thread-safe token bucket: up to max_calls tokens, refilled continuously at max_calls per period.
+acquire() blocks until a token is available.
+"""
+class RateLimiter:
+    def __init__(
+            self,
+            max_calls: int = RATE_LIMIT_CALLS,
+            period: float = RATE_LIMIT_PERIOD,
+            clock=time.monotonic,
+            sleep=time.sleep
+    ):
+        self.max_calls = max_calls
+        self.period = period
+        self._clock = clock
+        self._sleep = sleep
+        self._tokens = float(max_calls)
+        self._updated = clock()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        while True:
+            with self._lock:
+                now = self._clock()
+                self._tokens = min(self.max_calls, self._tokens + (now - self._updated) * self.max_calls / self.period)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) * self.period / self.max_calls
+            self._sleep(wait)
+
+
+"""
+Proxy for an Alpaca client: attribute access is forwarded, method calls are rate limited.
+"""
+class ThrottledClient:
+    def __init__(self, client, rate_limiter: RateLimiter):
+        self.client = client
+        self.rate_limiter = rate_limiter
+
+    def __getattr__(self, name):
+        attr = getattr(self.client, name)
+        if not callable(attr) or name.startswith("_"):
+            return attr
+
+        def throttled(*args, **kwargs):
+            self.rate_limiter.acquire()
+            return attr(*args, **kwargs)
+        return throttled
+
+
+rate_limiter = RateLimiter()
+_clients = {}
+_clients_lock = threading.Lock()
+
+
+def get_client(
+        client_cls,  # StockHistoricalDataClient/ OptionHistoricalDataClient
+        api_key: str = None,  # defaults to ALPACA_API_KEY
+        secret_key: str = None  # defaults to ALPACA_API_SECRET
+) -> ThrottledClient:
+    api_key = api_key or os.getenv("ALPACA_API_KEY")
+    secret_key = secret_key or os.getenv("ALPACA_API_SECRET")
+    key = (client_cls, api_key, secret_key)
+    with _clients_lock:
+        client = _clients.get(key)
+        if client is None:
+            client = _clients[key] = ThrottledClient(client_cls(api_key, secret_key), rate_limiter)
+        return client
+
+
+"""
+Drop every shared client (e.g. after rotating API keys, or between tests).
+"""
+def clear_clients() -> None:
+    with _clients_lock:
+        _clients.clear()
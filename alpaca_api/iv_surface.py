@@ -0,0 +1,244 @@
+"""
+Implied volatility surface per underlying, built from one option chain pull.
+
+Instead of a chain request plus a linear scan per contract (get_specific_contract_IV), the whole chain
+is fetched once and every contract's IV is collected in a single vectorized pass:
+    - snapshot implied_volatility where Alpaca provides it
+    - otherwise BS_vectorized_implied_volatility on the quote mid (or last trade) for all the rest at once
+    - at each strike/ expiry the out of the money side is kept (calls above spot, puts below), it is
+      the more liquid quote and free of early exercise premium
+The points are then resampled onto a (moneyness X/S x tenor days) grid:
+    - across moneyness: linear within each expiry, flat beyond the quoted strikes
+    - across tenor: linear in total variance sigma^2 * T, flat volatility beyond the quoted expiries
+IVSurface.iv interpolates the grid the same way for any contract, and get_iv_surface keeps built
+surfaces in memory for SURFACE_TTL_SECONDS so pricing a contract needs no API round trip. A build that
+fails for lack of data (API/ network errors, no usable quotes) is remembered for as long, so an
+underlying without a surface is not pulled again on every call.
+"""
+from alpaca.common.exceptions import APIError
+from alpaca.data import OptionHistoricalDataClient
+from alpaca.data.requests import OptionChainRequest
+import datetime
+import numpy as np
+import pandas as pd
+from requests.exceptions import RequestException
+import threading
+import time
+
+from alpaca_api.bar_store import bar_store
+from alpaca_api.clients import get_client
+from alpaca_api.options import parse_occ_symbols
+from alpaca_api.stocks import get_single_current_price
+from utils.common_formulas import BS_vectorized_implied_volatility, get_risk_free_rate
+from utils.enums_option import OPTION_TYPE
+
+# Default grid: strike/ spot and days to expiry
+MONEYNESS_GRID = np.round(np.arange(0.70, 1.301, 0.05), 2)
+TENOR_GRID = np.array([7, 14, 30, 60, 90, 180, 365])
+
+# Built surfaces are reused for this long before the chain is pulled again
+SURFACE_TTL_SECONDS = 900.0
+
+# Chain snapshot columns, see _chain_quotes
+QUOTE_COLUMNS = ("occ_symbol", "implied_volatility", "bid", "ask", "last")
+
+
+class NoQuotesError(ValueError):
+    pass
+
+
+# Build failures meaning no surface is available for the underlying (rather than a bug)
+SURFACE_ERRORS = (APIError, RequestException, NoQuotesError)
+
+
+class IVSurface:
+    def __init__(
+            self,
+            symbol: str,
+            spot: float,
+            moneyness: np.ndarray,  # (M,) increasing strike/ spot
+            tenors: np.ndarray,  # (T,) increasing days to expiry
+            iv: np.ndarray,  # (M, T) implied volatility grid
+            as_of: datetime.date
+    ):
+        self.symbol = symbol
+        self.spot = spot
+        self.moneyness = np.asarray(moneyness, dtype=float)
+        self.tenors = np.asarray(tenors, dtype=float)
+        self.iv_grid = np.asarray(iv, dtype=float)
+        self.as_of = as_of
+
+    def iv(
+            self,
+            X,  # strike price(s)
+            T,  # days to expiry
+            S: float = None  # spot, defaults to the spot the surface was built at
+    ):
+        """
+        Interpolated implied volatility for any strike/ expiry, X and T broadcast against each other.
+        """
+        spot = self.spot if S is None else S
+        moneyness, days = np.broadcast_arrays(np.asarray(X, dtype=float) / spot, np.asarray(T, dtype=float))
+        vols_at_tenors = _interp_rows(self.moneyness, self.iv_grid, moneyness)  # (..., T)
+        return _interp_total_variance(self.tenors, vols_at_tenors, days)[()]
+
+    def to_frame(self) -> pd.DataFrame:
+        return pd.DataFrame(
+            self.iv_grid,
+            index=pd.Index(self.moneyness, name="moneyness"),
+            columns=pd.Index(self.tenors.astype(int), name="days_to_expiry")
+        )
+
+
+def build_iv_surface(
+        symbol: str,
+        moneyness_grid: np.ndarray = MONEYNESS_GRID,
+        tenor_grid: np.ndarray = TENOR_GRID,
+        r: float = None,  # risk free rate, per expiry from get_risk_free_rate when None
+        as_of: datetime.date = None
+) -> IVSurface:
+    """
+    Pull symbol's chain (expiries up to the last grid tenor) once and build its surface.
+    """
+    as_of = as_of or datetime.date.today()
+    client = get_client(OptionHistoricalDataClient)
+    chain = client.get_option_chain(OptionChainRequest(
+        underlying_symbol=symbol,
+        expiration_date_gt=as_of,
+        expiration_date_lte=as_of + datetime.timedelta(days=int(np.max(tenor_grid))),
+        feed="indicative"  # free plan
+    ))
+    spot = float(get_single_current_price(symbol, as_of - datetime.timedelta(days=7), as_of, store=bar_store))
+    return surface_from_quotes(symbol, spot, _chain_quotes(chain), moneyness_grid, tenor_grid, r, as_of)
+
+
+def surface_from_quotes(
+        symbol: str,
+        spot: float,
+        quotes: pd.DataFrame,  # QUOTE_COLUMNS, one row per contract
+        moneyness_grid: np.ndarray = MONEYNESS_GRID,
+        tenor_grid: np.ndarray = TENOR_GRID,
+        r: float = None,
+        as_of: datetime.date = None
+) -> IVSurface:
+    """
+    Surface from already fetched chain quotes (vectorized over the whole chain).
+    """
+    as_of = as_of or datetime.date.today()
+    contracts = parse_occ_symbols(quotes["occ_symbol"].to_numpy())
+    X = contracts["strike_price"].to_numpy(dtype=float)
+    T = (contracts["expiration_date"].to_numpy(dtype="datetime64[D]") - np.datetime64(as_of, "D")).astype(float)
+    is_call = (contracts["type"] == "CALL").to_numpy()
+
+    iv = quotes["implied_volatility"].to_numpy(dtype=float, copy=True)
+    bid, ask, last = (quotes[col].to_numpy(dtype=float) for col in ("bid", "ask", "last"))
+    option_price = np.where((bid > 0) & (ask > 0), (bid + ask) / 2, last)
+
+    # solve every contract without a usable snapshot IV in one pass
+    solve = ~(iv > 0) & (option_price > 0) & (T > 0)
+    if solve.any():
+        rates = get_risk_free_rate(T[solve] / 365.0) if r is None else r
+        solved, _ = BS_vectorized_implied_volatility(
+            option_price[solve], spot, X[solve], T[solve], rates,
+            np.where(is_call[solve], OPTION_TYPE.CALL.value, OPTION_TYPE.PUT.value)
+        )
+        iv[solve] = solved
+
+    otm = is_call == (X >= spot)
+    points = pd.DataFrame({"moneyness": X / spot, "tenor": T, "iv": iv, "otm": otm})
+    points = points[(points["tenor"] > 0) & (points["iv"] > 0)]
+    # OTM side first, keep one point per strike/ expiry
+    points = points.sort_values("otm", ascending=False).drop_duplicates(["moneyness", "tenor"])
+    if points.empty:
+        raise NoQuotesError(f"No usable option quotes to build an IV surface for {symbol}")
+
+    expiry_tenors = np.sort(points["tenor"].unique())
+    moneyness_grid = np.asarray(moneyness_grid, dtype=float)
+    slices = np.empty((moneyness_grid.size, expiry_tenors.size))
+    for k, (_, expiry_points) in enumerate(points.sort_values("moneyness").groupby("tenor", sort=True)):
+        slices[:, k] = np.interp(moneyness_grid, expiry_points["moneyness"], expiry_points["iv"])
+
+    tenor_grid = np.asarray(tenor_grid, dtype=float)
+    grid = _interp_total_variance(
+        expiry_tenors,
+        np.broadcast_to(slices[:, None, :], (moneyness_grid.size, tenor_grid.size, expiry_tenors.size)),
+        np.broadcast_to(tenor_grid, (moneyness_grid.size, tenor_grid.size))
+    )
+    return IVSurface(symbol, spot, moneyness_grid, tenor_grid, grid, as_of)
+
+
+_surfaces = {}
+_surfaces_lock = threading.Lock()
+
+
+def get_iv_surface(
+        symbol: str,
+        max_age_seconds: float = SURFACE_TTL_SECONDS,
+        clock=time.monotonic
+) -> IVSurface:
+    """
+    Cached build_iv_surface, rebuilt once older than max_age_seconds.
+    A build failing with one of SURFACE_ERRORS is cached the same way and raised again until stale.
+    """
+    with _surfaces_lock:
+        entry = _surfaces.get(symbol)
+    if entry is not None and clock() - entry[1] < max_age_seconds:
+        if isinstance(entry[0], Exception):
+            raise entry[0]
+        return entry[0]
+
+    try:
+        surface = build_iv_surface(symbol)
+    except SURFACE_ERRORS as error:
+        with _surfaces_lock:
+            _surfaces[symbol] = (error, clock())
+        raise
+    with _surfaces_lock:
+        _surfaces[symbol] = (surface, clock())
+    return surface
+
+
+"""
+Helper flattening an option chain ({OCC symbol: OptionsSnapshot}) into QUOTE_COLUMNS.
+"""
+def _chain_quotes(chain: dict) -> pd.DataFrame:
+    rows = []
+    for occ_symbol, snapshot in chain.items():
+        quote, trade = snapshot.latest_quote, snapshot.latest_trade
+        rows.append((
+            occ_symbol,
+            snapshot.implied_volatility,
+            quote.bid_price if quote else None,
+            quote.ask_price if quote else None,
+            trade.price if trade else None,
+        ))
+    return pd.DataFrame(rows, columns=QUOTE_COLUMNS).astype({col: float for col in QUOTE_COLUMNS[1:]})
+
+
+"""
+Helper for linear interpolation along the first axis of grid (flat beyond the ends).
+Returns grid rows interpolated at x, shape x.shape + grid.shape[1:].
+"""
+def _interp_rows(x_known: np.ndarray, grid: np.ndarray, x) -> np.ndarray:
+    if x_known.size == 1:
+        return np.broadcast_to(grid[0], np.shape(x) + grid.shape[1:])
+    x = np.clip(x, x_known[0], x_known[-1])
+    i = np.clip(np.searchsorted(x_known, x) - 1, 0, x_known.size - 2)
+    weight = ((x - x_known[i]) / (x_known[i+1] - x_known[i]))[..., None]
+    return (1 - weight) * grid[i] + weight * grid[i+1]
+
+
+"""
+Helper interpolating volatilities quoted at tenors (last axis of vols) to days, linear in total
+variance sigma^2 * T between tenors and flat volatility beyond them.
+"""
+def _interp_total_variance(tenors: np.ndarray, vols: np.ndarray, days) -> np.ndarray:
+    if tenors.size == 1:
+        return np.broadcast_to(vols[..., 0], np.shape(days)).copy()
+    days = np.clip(days, tenors[0], tenors[-1])
+    j = np.clip(np.searchsorted(tenors, days) - 1, 0, tenors.size - 2)
+    t0, t1 = tenors[j], tenors[j+1]
+    v0 = np.take_along_axis(vols, j[..., None], axis=-1)[..., 0]
+    v1 = np.take_along_axis(vols, (j + 1)[..., None], axis=-1)[..., 0]
+    total_variance = ((t1 - days) * v0**2 * t0 + (days - t0) * v1**2 * t1) / (t1 - t0)
+    return np.sqrt(total_variance / days)
@@ -27,7 +27,11 @@ from alpaca.data.requests import (
 from alpaca.data.timeframe import TimeFrame
 from alpaca.trading.enums import ContractType
 import datetime
+import numpy as np
+import pandas as pd
 
+from alpaca_api.bar_store import bar_store
+from alpaca_api.clients import get_client
 from alpaca_api.stocks import get_recent_stock_prices, get_single_current_price
 from utils.common_formulas import annualized_volatility, price_sampling_adjustment
 from utils.enums_option import OPTION_TYPE
@@ -43,14 +47,21 @@ Convert Alpaca OCC standard option symbols to its individual components
 
 E.g. OCC symbol: AAPL250829C00170000
      Components: [AAPL][250829][C][00170000]
+
+The last 15 characters are always fixed width, so the underlying (which may contain digits,
+e.g. adjusted roots like AAPL1) is everything before them.
 """
+OCC_SUFFIX_LENGTH = 15
+
+
 def parse_occ_symbol(symbol):
-    underlying = symbol[:symbol.find('2')]  # crude split
-    year = 2000 + int(symbol[len(underlying):len(underlying)+2])
-    month = int(symbol[len(underlying)+2:len(underlying)+4])
-    day = int(symbol[len(underlying)+4:len(underlying)+6])
-    option_type = symbol[len(underlying)+6]
-    strike = int(symbol[len(underlying)+7:]) / 1000
+    underlying = symbol[:-OCC_SUFFIX_LENGTH].rstrip()  # roots may be space padded to 6 characters
+    suffix = symbol[-OCC_SUFFIX_LENGTH:]
+    year = 2000 + int(suffix[0:2])
+    month = int(suffix[2:4])
+    day = int(suffix[4:6])
+    option_type = suffix[6]
+    strike = int(suffix[7:]) / 1000
     return {
         "underlying": underlying,
         "expiration_date": datetime.date(year, month, day),
@@ -59,10 +70,92 @@ def parse_occ_symbol(symbol):
     }
 
 
+"""
+Columnar parse_occ_symbol for whole chains: one vectorized pass over a fixed width byte matrix
+instead of a dict and datetime.date per symbol.
+Returns a DataFrame with columns underlying (categorical), expiration_date (datetime64[D]),
+type (categorical "CALL"/ "PUT") and strike_price (float), one row per symbol in input order.
+"""
+def parse_occ_symbols(symbols) -> pd.DataFrame:
+    symbols = np.asarray(symbols, dtype=bytes)
+    if symbols.size == 0:
+        return pd.DataFrame({
+            "underlying": pd.Categorical([]),
+            "expiration_date": np.array([], dtype="datetime64[D]"),
+            "type": pd.Categorical([], categories=["CALL", "PUT"]),
+            "strike_price": np.array([], dtype=float),
+        })
+
+    width = symbols.dtype.itemsize
+    chars = symbols.view(np.uint8).reshape(symbols.size, width)
+    lengths = np.char.str_len(symbols)  # shorter symbols are NUL padded to width
+    invalid = (lengths <= OCC_SUFFIX_LENGTH) | (lengths > OCC_SUFFIX_LENGTH + 8)
+    if invalid.any():
+        raise ValueError(f"Invalid OCC symbol: {symbols[invalid][0].decode()}")
+
+    # every symbol's fixed width suffix (n, 15) and first 8 bytes (n, 8) are row gathers from
+    # sliding windows over the flat buffer, no per symbol slicing
+    flat = np.concatenate([chars.ravel(), np.zeros(8, dtype=np.uint8)])
+    row_start = np.arange(symbols.size) * width
+    root_lengths = lengths - OCC_SUFFIX_LENGTH
+    suffix = np.lib.stride_tricks.sliding_window_view(flat, OCC_SUFFIX_LENGTH)[row_start + root_lengths]
+    roots = np.lib.stride_tricks.sliding_window_view(flat, 8)[row_start]
+
+    digits = suffix - np.uint8(ord("0"))  # wraps around for non digits, so > 9 catches them too
+    type_char = suffix[:, 6]
+    invalid = np.any(digits[:, np.r_[0:6, 7:OCC_SUFFIX_LENGTH]] > 9, axis=1) | ((type_char != ord("C")) & (type_char != ord("P")))
+    if invalid.any():
+        raise ValueError(f"Invalid OCC symbol: {symbols[invalid][0].decode()}")
+
+    date_digits = digits[:, :6].astype(np.int64)
+    year = date_digits[:, 0] * 10 + date_digits[:, 1] + 2000
+    month = date_digits[:, 2] * 10 + date_digits[:, 3]
+    day = date_digits[:, 4] * 10 + date_digits[:, 5]
+    invalid = (month < 1) | (month > 12) | (day < 1) | (day > 31)
+    if invalid.any():
+        raise ValueError(f"Invalid OCC symbol: {symbols[invalid][0].decode()}")
+    expiry_month = (year - 1970).astype("datetime64[Y]").astype("datetime64[M]") + (month - 1).astype("timedelta64[M]")
+    expiration_date = expiry_month.astype("datetime64[D]") + (day - 1).astype("timedelta64[D]")
+    # days past the month's end (e.g. Feb 31) roll into the next month, datetime.date rejects them
+    invalid = expiration_date.astype("datetime64[M]") != expiry_month
+    if invalid.any():
+        raise ValueError(f"Invalid OCC symbol: {symbols[invalid][0].decode()}")
+    # 8 strike digits read as one little endian uint64 and combined pairwise (SWAR):
+    # 1 digit -> 2 digit -> 4 digit -> 8 digit lanes, each step multiply-add-shift on all symbols
+    strike = np.ascontiguousarray(digits[:, 7:]).view("<u8").ravel()
+    strike = ((strike * np.uint64(10)) + (strike >> np.uint64(8))) & np.uint64(0x00FF00FF00FF00FF)
+    strike = ((strike * np.uint64(100)) + (strike >> np.uint64(16))) & np.uint64(0x0000FFFF0000FFFF)
+    strike = ((strike * np.uint64(10000)) + (strike >> np.uint64(32))) & np.uint64(0x00000000FFFFFFFF)
+    strike = strike / 1000
+
+    # underlying: first 8 bytes as one little endian uint64 key per symbol, suffix bytes masked off,
+    # so the few distinct roots are factorized on integers instead of 1M strings
+    root_bits = np.uint64(8) * root_lengths.astype(np.uint64)
+    root_mask = np.where(root_lengths >= 8, ~np.uint64(0), (np.uint64(1) << root_bits) - np.uint64(1))
+    root_codes, root_keys = pd.factorize(roots.view("<u8").ravel() & root_mask)
+    # space padded roots ("F     ") collapse onto the unpadded name
+    root_names, merged_codes = np.unique(
+        [key.decode().strip() for key in np.asarray(root_keys, dtype="<u8").view("S8")], return_inverse=True
+    )
+    root_codes = merged_codes[root_codes]
+
+    return pd.DataFrame({
+        "underlying": pd.Categorical.from_codes(root_codes, root_names),
+        "expiration_date": expiration_date,
+        "type": pd.Categorical.from_codes((type_char == ord("P")).astype(np.int8), ["CALL", "PUT"]),
+        "strike_price": strike,
+    })
+
 
 """
-To obtain Implied Volatility with three layers of flow (Highest -> Lowest priorities)
+To obtain Implied Volatility with four layers of flow (Highest -> Lowest priorities)
 
+0. Interpolating the underlying's cached IV surface (alpaca_api.iv_surface.get_iv_surface)
+    - one chain pull per underlying, every later contract on it needs no API round trip
+    - the surface holds the out of the money side at each strike, so calls and puts read the same
+      IV and option_type does not apply; the contract's own snapshot IV is not looked up
+    - skipped when no surface is available (iv_surface.SURFACE_ERRORS) or the contract lies outside
+      the surface grid (moneyness beyond MONEYNESS_GRID, expiry beyond its last tenor)
 1. Pulling Real Option Contract Implied Volatility direct from option_chain snapshot
     - same underlying asset
     - similar expiration date (<= specified expiry window)
@@ -88,10 +181,11 @@ def get_specific_contract_IV(
     start = expiry_start.strftime("%Y-%m-%d")
     end = expiry_end.strftime("%Y-%m-%d")
     try:
-        client = OptionHistoricalDataClient(
-             os.getenv("ALPACA_API_KEY"),
-             os.getenv("ALPACA_API_SECRET")
-        )
+        surface_iv = _surface_IV(symbol, X, expiry_window)
+        if surface_iv:
+            return surface_iv
+
+        client = get_client(OptionHistoricalDataClient)
         
         # Find contract symbol matching strike and expiry exactly
         chain_req = OptionChainRequest(
@@ -134,7 +228,7 @@ def get_specific_contract_IV(
                         r = get_risk_free_rate(T/365.0)
                     BS_iv = BS_brent_implied_volatility(
                         option_price=option_price,
-                        S=float(get_single_current_price(symbol, expiry_start, expiry_end)),
+                        S=float(get_single_current_price(symbol, expiry_start, expiry_end, store=bar_store)),
                         X=X,
                         T=T,
                         r=r,  # todo: change to dynamic
@@ -145,11 +239,30 @@ def get_specific_contract_IV(
         
         # Attempt Fallback 2 - IV based on historical stock prices
         today = datetime.date.today()
-        prices = get_recent_stock_prices(symbol, today-datetime.timedelta(days=expiry_window), today)
+        prices = get_recent_stock_prices(symbol, today-datetime.timedelta(days=expiry_window), today, store=bar_store)
         adjusted_prices = price_sampling_adjustment(prices, sampling_freq)
         # calculate our own volatility
         fallback_vol = annualized_volatility(adjusted_prices, sampling_freq)
         
         return fallback_vol
     except Exception as e:
-            raise Exception(f"Error fetching data for ticker {symbol}: {str(e)}")
\ No newline at end of file
+            raise Exception(f"Error fetching data for ticker {symbol}: {str(e)}")
+
+
+"""
+Helper for layer 0 of get_specific_contract_IV: the contract's IV off the underlying's cached surface,
+None when there is no usable surface so the per contract layers take over.
+"""
+def _surface_IV(symbol: str, X: float, T: int):
+    # iv_surface parses chains with parse_occ_symbols from this module, so it is imported on use
+    from alpaca_api.iv_surface import SURFACE_ERRORS, get_iv_surface
+
+    try:
+        surface = get_iv_surface(symbol)
+    except SURFACE_ERRORS:
+        return None
+    # flat extrapolation beyond the grid is no estimate of this contract's IV
+    if T > surface.tenors[-1] or not surface.moneyness[0] <= X / surface.spot <= surface.moneyness[-1]:
+        return None
+    iv = float(surface.iv(X, T))
+    return iv if iv > 0 else None
@@ -22,18 +22,26 @@ from alpaca.data.timeframe import TimeFrame
 import datetime
 import pandas as pd
 
+from alpaca_api.clients import get_client
+
 load_dotenv()
 
 """
 Only takes into account daily, weekly, monthly
+Both functions read through store (alpaca_api.bar_store.BarStore) when given, which only
+fetches the dates it does not hold yet, otherwise the full window is requested from Alpaca.
 """
 def get_single_current_price(
     symbol: str,  # ticker i.e AAPL
     start: datetime.date,  # start date of date window
     end: datetime.date,  # end date of date window
-    timeframe: TimeFrame = TimeFrame.Day
+    timeframe: TimeFrame = TimeFrame.Day,
+    store=None  # BarStore
 ) -> float:
-    client = StockHistoricalDataClient(os.getenv("ALPACA_API_KEY"), os.getenv("ALPACA_API_SECRET"))
+    if store is not None:
+        return store.get_bars(symbol, start, end, timeframe)["close"].iloc[-1]
+
+    client = get_client(StockHistoricalDataClient)
     req_params = StockBarsRequest(
         symbol_or_symbols=symbol,
         timeframe=timeframe,
@@ -48,13 +56,17 @@ def get_single_current_price(
 def get_recent_stock_prices(
     symbol: str,
     start_date: datetime.date,
-    end_date: datetime.date
+    end_date: datetime.date,
+    store=None  # BarStore
 ) -> pd.Series:
     """
     Fetches daily closing stock prices from Alpaca between start_date and end_date.
     Returns a pandas Series of prices indexed by date (DateTimeIndex).
     """
-    client = StockHistoricalDataClient(os.getenv("ALPACA_API_KEY"), os.getenv("ALPACA_API_SECRET"))
+    if store is not None:
+        return store.get_bars(symbol, start_date, end_date, TimeFrame.Day)["close"]
+
+    client = get_client(StockHistoricalDataClient)
     req_params = StockBarsRequest(
         symbol_or_symbols=symbol,
         timeframe=TimeFrame.Day,
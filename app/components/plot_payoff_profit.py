@@ -1,7 +1,8 @@
 from typing import Tuple
 import numpy as np
-import matplotlib.pyplot as plt
 
+
+# Drawn fresh on every run, a shared cached Figure is not thread-safe (see plot_premium_price)
 def show_plot_payoff_profit(
         option_type: str,
         strike_price: float,
@@ -16,7 +17,10 @@ def show_plot_payoff_profit(
     payoff = np.maximum(S - CP, 0)       # Call payoff at expiry
     profit = payoff - CP                 # Net profit at expiry
 
-    fig, ax = plt.subplots(figsize=(8,5))
+    from matplotlib.figure import Figure  # matplotlib loads on the first figure, not at app start
+
+    fig = Figure(figsize=(8,5))
+    ax = fig.subplots()
     ax.plot(S, profit, label='Profit', color='dodgerblue')
     ax.axhline(0, color='black', lw=1)
     ax.axvline(X+CP, color='grey', ls='--', label='Breakeven')
@@ -1,22 +1,38 @@
 from typing import Tuple
-import matplotlib.pyplot as plt
 import numpy as np
+import streamlit as st
 
-from utils.enums_option import OPTION_MODEL, PARAMETERS
-from utils.options_formulas import call_binomial, call_blackscholes, call_simple_binomial
+from utils.enums_option import EXERCISE_STYLE, OPTION_MODEL, PARAMETERS, TREE_METHOD
+from utils.options_formulas import call_binomial, call_blackscholes, call_simple_binomial, call_trinomial
 
-def show_plot_premium_price(
+"""
+Curves are memoized by their inputs, so reruns with unchanged inputs do not re-price the curve.
+Figures are drawn fresh on every run from the cached curve: a cached Figure would be one mutable object
+shared by every session/ thread, and matplotlib drawing is not thread-safe. Figures are built on
+matplotlib.figure.Figure rather than pyplot, so they are not kept alive by pyplot's global figure
+registry and leave memory once the run is done.
+"""
+# Memoized curves, least recently used evicted beyond this
+CURVE_CACHE_SIZE = 128
+
+
+@st.cache_data(max_entries=CURVE_CACHE_SIZE, show_spinner=False)
+def premium_curve(
         option_type: str,
         option_model: str,
         S: Tuple[float, float, int],  # stock_price range
-        X: float,  # strike_price
-        T: int,  # days_to_maturity
-        r: float,  # interest_rate
-        sigma: float,  # volatility
-        q: float = 0,  # dividend
-        N: int = 100,  # int
-    ):
-    # Standardize params
+        X: float,
+        T: int,
+        r: float,
+        sigma: float,
+        q: float = 0,
+        N: int = 100,
+        exercise_style: str = EXERCISE_STYLE.EUROPEAN.value,
+        tree_method: str = TREE_METHOD.CRR.value,
+) -> np.ndarray:
+    """
+    Option premium at every stock price of the range.
+    """
     S = np.linspace(*S)
     params = {
         PARAMETERS.STRIKE_PRICE.value: X,
@@ -24,24 +40,46 @@ def show_plot_premium_price(
         PARAMETERS.INTEREST_RATE.value: r,
         PARAMETERS.VOLATILITY.value: sigma,
         PARAMETERS.DIVIDEND_YIELD.value: q,
-        PARAMETERS.TIME_STEPS.value: N
+        PARAMETERS.TIME_STEPS.value: N,
+        PARAMETERS.EXERCISE_STYLE.value: exercise_style,
+        PARAMETERS.TREE_METHOD.value: tree_method
     }
 
-    # Calculate array of premiums
     if option_model == OPTION_MODEL.BLACK_SCHOLES_MODEL.value:
-        option_premiums = call_blackscholes(option_type, S, params)
+        return call_blackscholes(option_type, S, params)
     elif option_model == OPTION_MODEL.BINOMIAL_MODEL.value:
-        option_premiums = call_binomial(option_type, S, params)
-    else:
-        option_premiums = call_simple_binomial(option_type, S, params)
-    
+        return call_binomial(option_type, S, params)
+    elif option_model == OPTION_MODEL.TRINOMIAL_MODEL.value:
+        return call_trinomial(option_type, S, params)
+    return call_simple_binomial(option_type, S, params)
+
+
+def show_plot_premium_price(
+        option_type: str,
+        option_model: str,
+        S: Tuple[float, float, int],  # stock_price range
+        X: float,  # strike_price
+        T: int,  # days_to_maturity
+        r: float,  # interest_rate
+        sigma: float,  # volatility
+        q: float = 0,  # dividend
+        N: int = 100,  # int
+        exercise_style: str = EXERCISE_STYLE.EUROPEAN.value,  # binomial/ trinomial model only
+        tree_method: str = TREE_METHOD.CRR.value,  # binomial model only
+    ):
+    option_premiums = premium_curve(option_type, option_model, S, X, T, r, sigma, q, N, exercise_style, tree_method)
+    S = np.linspace(*S)
+
     # Plot relevant graph
     if option_type == "call option":
         title = "Call Option Value vs Underlying Price"
     else:
         title = "Put Option Value vs Underlying Price"
 
-    fig, ax = plt.subplots(figsize=(8,5))
+    from matplotlib.figure import Figure  # matplotlib loads on the first figure, not at app start
+
+    fig = Figure(figsize=(8,5))
+    ax = fig.subplots()
     ax.plot(S, option_premiums, label=f"Option Value ({option_model})", color='purple')
     ax.set_title(title)
     ax.set_xlabel('Underlying Price $S$')
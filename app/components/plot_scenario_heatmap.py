@@ -0,0 +1,108 @@
+from typing import Tuple
+import numpy as np
+import streamlit as st
+
+from option_valuation.scenario_grid import PNL, ScenarioGrid, scenario_grid
+from utils.enums_option import EXERCISE_STYLE, GREEKS, TREE_METHOD
+
+"""
+Scenario grids are memoized by their inputs and hold every time slice at once, so switching the time
+slice, between P&L and price, or between Greeks only redraws the heatmap from the cached grid. Greeks
+are a separate grid (bump and reprice for the tree models), priced once on the first Greek shown; it
+holds price and P&L too. Heatmaps are one imshow of the (spot x volatility) slice, cheap to draw at
+200x200 points, so each run draws a fresh Figure rather than sharing a cached one across sessions
+(see plot_premium_price).
+"""
+# Memoized grids, least recently used evicted beyond this
+GRID_CACHE_SIZE = 16
+
+# Values with a diverging colour map centred on zero
+DIVERGING_VALUES = (PNL, GREEKS.DELTA.value, GREEKS.THETA.value, GREEKS.RHO.value)
+
+
+@st.cache_data(max_entries=GRID_CACHE_SIZE, show_spinner="Pricing scenarios...")
+def scenario_values(
+        option_type: str,
+        option_model: str,
+        S: float,  # stock_price
+        X: float,  # strike_price
+        T: int,  # days_to_expiry
+        r: float,  # interest_rate
+        sigma: float,  # volatility
+        q: float,  # dividend
+        spot_shocks: Tuple[float, float, int],  # relative spot move range
+        vol_shocks: Tuple[float, float, int],  # absolute volatility move range
+        time_shocks: Tuple[int, ...],  # days elapsed
+        greeks: bool = False,
+        N: int = 100,
+        exercise_style: str = EXERCISE_STYLE.EUROPEAN.value,
+        tree_method: str = TREE_METHOD.CRR.value,
+) -> ScenarioGrid:
+    """
+    Spot x volatility x days elapsed grid of the contract, see option_valuation.scenario_grid.
+    """
+    return scenario_grid(
+        option_model, option_type, S, X, T, r, sigma, q,
+        spot_shocks=np.linspace(*spot_shocks),
+        vol_shocks=np.linspace(*vol_shocks),
+        time_shocks=np.asarray(time_shocks, dtype=float),
+        greeks=greeks,
+        N=N,
+        exercise_style=exercise_style,
+        tree_method=tree_method,
+    )
+
+
+def show_plot_scenario_heatmap(
+        value: str,  # "price", "pnl" or a GREEKS value
+        time_index: int,  # slice of time_shocks shown
+        option_type: str,
+        option_model: str,
+        S: float,  # stock_price
+        X: float,  # strike_price
+        T: int,  # days_to_expiry
+        r: float,  # interest_rate
+        sigma: float,  # volatility
+        q: float,  # dividend
+        spot_shocks: Tuple[float, float, int],
+        vol_shocks: Tuple[float, float, int],
+        time_shocks: Tuple[int, ...],
+        greeks: bool = False,
+        N: int = 100,
+        exercise_style: str = EXERCISE_STYLE.EUROPEAN.value,
+        tree_method: str = TREE_METHOD.CRR.value,
+    ):
+    grid = scenario_values(
+        option_type, option_model, S, X, T, r, sigma, q, spot_shocks, vol_shocks, time_shocks,
+        greeks, N, exercise_style, tree_method
+    )
+    spots, vols, days = grid.coords.values()
+    values = grid[value][:, :, time_index]
+
+    if value in DIVERGING_VALUES:
+        limit = np.nanmax(np.abs(values)) or 1.0
+        colour = {"cmap": "RdYlGn", "vmin": -limit, "vmax": limit}
+    else:
+        colour = {"cmap": "viridis"}
+
+    from matplotlib.figure import Figure  # matplotlib loads on the first figure, not at app start
+
+    fig = Figure(figsize=(8,6))
+    ax = fig.subplots()
+    image = ax.imshow(
+        values.T,  # volatility on the y axis
+        origin="lower",
+        aspect="auto",
+        interpolation="nearest",
+        extent=(spots[0], spots[-1], vols[0] * 100, vols[-1] * 100),
+        **colour
+    )
+    label = value.upper() if value == PNL else value.capitalize()
+    fig.colorbar(image, ax=ax, label=label)
+    # today's spot/ volatility
+    ax.axvline(S, color='black', ls='--', lw=1)
+    ax.axhline(sigma * 100, color='black', ls='--', lw=1)
+    ax.set_title(f"{label} with {days[time_index]:.0f} Days to Expiry")
+    ax.set_xlabel('Underlying Price $S$')
+    ax.set_ylabel('Volatility (in %)')
+    return fig
@@ -1,9 +1,68 @@
 import streamlit as st
-import sqlite3
-import pandas as pd
+
+from db.sqlite.db_queries import query_runs
+from utils.enums_option import OPTION_MODEL, OPTION_TYPE
+from utils.pricing_cache import pricing_cache
+
+## ----------------------------------------------
+# Declarations
+DB_PATH = "options_calcs.db"
+PAGE_SIZES = [25, 50, 100, 500]
+## ----------------------------------------------
 
 def show_database():
-    conn = sqlite3.connect("options_calcs.db")
-    df = pd.read_sql_query("SELECT * FROM options_calcs ORDER BY timestamp DESC", conn)
-    st.dataframe(df)
-    conn.close()
\ No newline at end of file
+    filterCol, tableCol = st.columns([1, 3])
+    with filterCol:
+        st.write("Filter history")
+        model = st.selectbox(
+            "Model",
+            [model.value for model in OPTION_MODEL],
+            format_func=lambda x: x.title(),
+            index=None,
+            key="DB_model"
+        )
+        option_type = st.selectbox(
+            "Option Type",
+            [OPTION_TYPE.CALL.value, OPTION_TYPE.PUT.value],
+            format_func=lambda x: x.split(" ")[0].capitalize(),
+            index=None,
+            key="DB_option_type"
+        )
+        date_range = st.date_input("Date Range", value=[], key="DB_dates")
+        strike_min = st.number_input("Min Strike", value=None, min_value=0.0, key="DB_strike_min")
+        strike_max = st.number_input("Max Strike", value=None, min_value=0.0, key="DB_strike_max")
+        page_size = st.selectbox("Rows per page", PAGE_SIZES, index=1, key="DB_page_size")
+
+    filters = {
+        "model": model,
+        "option_type": option_type,
+        "start_date": date_range[0] if len(date_range) > 0 else None,
+        "end_date": date_range[1] if len(date_range) > 1 else None,
+        "strike_min": strike_min,
+        "strike_max": strike_max,
+    }
+
+    # cursors of the pages visited so far, reset whenever the filters change
+    if st.session_state.get("DB_filters") != (filters, page_size):
+        st.session_state["DB_filters"] = (filters, page_size)
+        st.session_state["DB_cursors"] = [None]
+    cursors = st.session_state["DB_cursors"]
+
+    page, next_cursor = query_runs(DB_PATH, page_size=page_size, after=cursors[-1], **filters)
+
+    with tableCol:
+        st.dataframe(page, hide_index=True)
+        prevCol, pageCol, nextCol = st.columns([1, 2, 1])
+        with prevCol:
+            if st.button("Previous", disabled=len(cursors) == 1, key="DB_prev"):
+                cursors.pop()
+                st.rerun()
+        with pageCol:
+            st.caption(f"Page {len(cursors)}")
+        with nextCol:
+            if st.button("Next", disabled=next_cursor is None, key="DB_next"):
+                cursors.append(next_cursor)
+                st.rerun()
+
+        st.caption("Pricing cache")
+        st.write(pricing_cache.stats())
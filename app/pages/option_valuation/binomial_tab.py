@@ -4,8 +4,8 @@ import streamlit as st
 from app.components.plot_payoff_profit import show_plot_payoff_profit
 from app.components.plot_premium_price import show_plot_premium_price
 from db.sqlite.db_utils import insert_run_to_db
-from option_valuation.binomial_model import BinomialModel
-from utils.enums_option import PARAMETERS, OPTION_MODEL, OPTION_TYPE
+from utils.enums_option import EXERCISE_STYLE, PARAMETERS, OPTION_MODEL, OPTION_TYPE, TREE_METHOD
+from utils.pricing_cache import pricing_cache
 
 ## ----------------------------------------------
 # Declarations
@@ -17,6 +17,15 @@ BM_params = {
     PARAMETERS.VOLATILITY.value: None,  # float
     PARAMETERS.DIVIDEND_YIELD.value: None,  # float
     PARAMETERS.TIME_STEPS.value: None,  # int (max 1000)
+    PARAMETERS.EXERCISE_STYLE.value: None,  # str
+    PARAMETERS.TREE_METHOD.value: None,  # str
+}
+TREE_METHOD_LABELS = {
+    TREE_METHOD.CRR.value: "Cox-Ross-Rubinstein",
+    TREE_METHOD.TIAN.value: "Tian",
+    TREE_METHOD.LEISEN_REIMER.value: "Leisen-Reimer",
+    TREE_METHOD.BBS.value: "BBS (Black-Scholes smoothing)",
+    TREE_METHOD.BBSR.value: "BBSR (smoothing + Richardson)",
 }
 ## ----------------------------------------------
 
@@ -106,17 +115,29 @@ def show_binomial_tab():
             key="BM_N"
         )
         st.caption("Higher steps result in longer loads")
+        BM_params[PARAMETERS.EXERCISE_STYLE.value] = st.selectbox(
+            "Exercise Style",
+            [EXERCISE_STYLE.EUROPEAN.value, EXERCISE_STYLE.AMERICAN.value],
+            format_func=lambda x: x.capitalize(),
+            key="BM_exercise_style"
+        )
+        BM_params[PARAMETERS.TREE_METHOD.value] = st.selectbox(
+            "Tree Method",
+            [method.value for method in TREE_METHOD],
+            format_func=lambda x: TREE_METHOD_LABELS[x],
+            key="BM_tree_method"
+        )
+        st.caption("Leisen Reimer/ BBSR reach the same accuracy with far fewer steps")
         # Output the values
         if st.button(f"Calculate {bm_option_type} Premium", key="BM_output"):
             if any(BM_params[k] is None for k in BM_params.keys()):
                 st.toast("Missing Parameter Input!")
             else:
-                # Initialize Model and store calculation
-                BM = BinomialModel(bm_option_type, BM_params)
-                BM_output = BM.calculate_price()
+                # Price through the shared cache and store calculation
+                BM_output = pricing_cache.price(OPTION_MODEL.BINOMIAL_MODEL.value, bm_option_type, BM_params)
                 if BM_output:
                     with st.spinner("Calculating..."):
-                        insert_run_to_db(OPTION_MODEL.BINOMIAL_MODEL.value, BM_params, BM_output)
+                        insert_run_to_db(OPTION_MODEL.BINOMIAL_MODEL.value, {**BM_params, "option_type": bm_option_type}, BM_output)
                         st.write(f"{bm_option_type.split(" ")[0].capitalize()} Price: {BM_output:.4f}")
 
     with rightCol:
@@ -144,6 +165,8 @@ def show_binomial_tab():
                 BM_params[PARAMETERS.INTEREST_RATE.value],
                 BM_params[PARAMETERS.VOLATILITY.value],
                 BM_params[PARAMETERS.DIVIDEND_YIELD.value],
-                N=BM_params[PARAMETERS.TIME_STEPS.value]
+                N=BM_params[PARAMETERS.TIME_STEPS.value],
+                exercise_style=BM_params[PARAMETERS.EXERCISE_STYLE.value],
+                tree_method=BM_params[PARAMETERS.TREE_METHOD.value]
             )
             st.pyplot(fig_premiumprice)
\ No newline at end of file
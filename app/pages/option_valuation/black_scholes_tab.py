@@ -5,8 +5,8 @@ import numpy as np
 from app.components.plot_payoff_profit import show_plot_payoff_profit
 from app.components.plot_premium_price import show_plot_premium_price
 from db.sqlite.db_utils import insert_run_to_db
-from option_valuation.black_scholes_model import BlackScholesModel
 from utils.enums_option import PARAMETERS, OPTION_MODEL, OPTION_TYPE
+from utils.pricing_cache import pricing_cache
 
 ## ----------------------------------------------
 # Declarations
@@ -104,12 +104,11 @@ def show_black_scholes_tab():
             if any(BSM_params[k] is None for k in BSM_params.keys()):
                 st.toast("Missing Parameter Input!")
             else:
-                # Initialize Model and store calculation
-                BSM = BlackScholesModel(bsm_option_type, BSM_params)
-                BSM_output = BSM.calculate_price()
+                # Price through the shared cache and store calculation
+                BSM_output = pricing_cache.price(OPTION_MODEL.BLACK_SCHOLES_MODEL.value, bsm_option_type, BSM_params)
                 if BSM_output:
                     with st.spinner("Calculating..."):
-                        insert_run_to_db(OPTION_MODEL.BLACK_SCHOLES_MODEL.value, BSM_params, BSM_output)
+                        insert_run_to_db(OPTION_MODEL.BLACK_SCHOLES_MODEL.value, {**BSM_params, "option_type": bsm_option_type}, BSM_output)
                         st.write(f"{bsm_option_type.split(" ")[0].capitalize()} Price: {BSM_output:.4f}")
 
     with rightCol:
@@ -3,8 +3,8 @@ import streamlit as st
 from app.components.plot_payoff_profit import show_plot_payoff_profit
 from app.components.plot_premium_price import show_plot_premium_price
 from db.sqlite.db_utils import insert_run_to_db
-from option_valuation.simple_binomial_model import SimpleBinomialModel
 from utils.enums_option import PARAMETERS, OPTION_MODEL, OPTION_TYPE
+from utils.pricing_cache import pricing_cache
 
 ## ----------------------------------------------
 # Declarations
@@ -67,12 +67,11 @@ def show_simple_binomial_tab():
             if any(SBM_params[k] is None for k in SBM_params.keys()):
                 st.toast("Missing Parameter Input!")
             else:
-                # Initialize Model and store calculation
-                SBM = SimpleBinomialModel(sbm_option_type, SBM_params)
-                SBM_output = SBM.calculate_price()
+                # Price through the shared cache and store calculation
+                SBM_output = pricing_cache.price(OPTION_MODEL.SIMPLE_BINOMIAL_MODEL.value, sbm_option_type, SBM_params)
                 if SBM_output:
                     with st.spinner("Calculating..."):
-                        insert_run_to_db(OPTION_MODEL.SIMPLE_BINOMIAL_MODEL.value, SBM_params, SBM_output)
+                        insert_run_to_db(OPTION_MODEL.SIMPLE_BINOMIAL_MODEL.value, {**SBM_params, "option_type": sbm_option_type}, SBM_output)
                         st.write(f"{sbm_option_type.capitalize()} Price: {SBM_output:.4f}")
 
     with rightCol:
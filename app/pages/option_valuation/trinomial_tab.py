@@ -0,0 +1,157 @@
+import datetime
+import streamlit as st
+
+from app.components.plot_payoff_profit import show_plot_payoff_profit
+from app.components.plot_premium_price import show_plot_premium_price
+from db.sqlite.db_utils import insert_run_to_db
+from utils.enums_option import EXERCISE_STYLE, PARAMETERS, OPTION_MODEL, OPTION_TYPE
+from utils.pricing_cache import pricing_cache
+
+## ----------------------------------------------
+# Declarations
+TM_params = {
+    PARAMETERS.STOCK_PRICE.value: None,  # float
+    PARAMETERS.STRIKE_PRICE.value: None,  # float
+    PARAMETERS.DAYS_TO_EXPIRY.value: None,  # int
+    PARAMETERS.INTEREST_RATE.value: None,  # float
+    PARAMETERS.VOLATILITY.value: None,  # float
+    PARAMETERS.DIVIDEND_YIELD.value: None,  # float
+    PARAMETERS.TIME_STEPS.value: None,  # int (max 1000)
+    PARAMETERS.EXERCISE_STYLE.value: None,  # str
+}
+## ----------------------------------------------
+
+def show_trinomial_tab():
+    leftCol, rightCol = st.columns([1, 3])
+    TM_output = None
+    with leftCol:
+        tm_option_type = st.selectbox(
+            "Option Type",
+            [OPTION_TYPE.CALL.value, OPTION_TYPE.PUT.value],
+            format_func=lambda x: x.split(" ")[0].capitalize(),
+            placeholder=" ",
+            index=None,
+            key="tm_option_type"
+        )
+        
+        # Get Parameters=
+        st.write("Enter your variables")
+        TM_params[PARAMETERS.STOCK_PRICE.value] = st.number_input(
+            "Stock Price",
+            key="TM_S",
+        )
+        TM_params[PARAMETERS.STRIKE_PRICE.value] = st.number_input(
+            "Strike Price",
+            key="TM_X",
+        )
+        days_to_expiry_selection = st.pills(
+            "Days to Expiry",
+            options=[
+                ("slider", ":material/sliders:"),
+                ("num", ":material/keyboard_keys:"),
+                ("date", ":material/date_range:")
+            ],
+            format_func=lambda x: x[1],
+            key="TM_T_mode"
+        )
+        days_to_expiry_selection = days_to_expiry_selection if days_to_expiry_selection else ("num", ":material/keyboard_keys:")
+        if days_to_expiry_selection[0] == "num":
+            TM_params[PARAMETERS.DAYS_TO_EXPIRY.value] = st.number_input(
+                "days_to_expiry",
+                label_visibility="hidden",
+                min_value=1,
+                max_value=3650,
+                key="TM_T_num",
+            )
+        elif days_to_expiry_selection[0] == "date":
+            currDate = datetime.date.today()
+            TM_params[PARAMETERS.DAYS_TO_EXPIRY.value] = (st.date_input(
+                "days_to_expiry",
+                label_visibility="hidden",
+                min_value=datetime.date.today() + datetime.timedelta(days=1),
+                key="TM_T_date"
+            ) - currDate).days
+        else:
+            TM_params[PARAMETERS.DAYS_TO_EXPIRY.value] = st.slider(
+                "days_to_expiry",
+                label_visibility="hidden",
+                min_value=1,
+                max_value=3650,
+                key="TM_T_slider"
+            )
+        TM_params[PARAMETERS.INTEREST_RATE.value] = st.number_input(
+            "Risk-Free Interest Rate (in %)",
+            min_value=0.0,
+            max_value=100.0,
+            value=5.0,
+            key="TM_r"
+        ) / 100.0
+        TM_params[PARAMETERS.VOLATILITY.value] = st.number_input(
+            "Volatility (in %)",
+            min_value=0.0,
+            max_value=500.0,
+            value=20.0,
+            key="TM_sigma"
+        ) / 100.0
+        TM_params[PARAMETERS.DIVIDEND_YIELD.value] = st.number_input(
+            "Dividend Yield (in %)",
+            min_value=0.0,
+            max_value=100.0,
+            value=0.0,
+            key="TM_q"
+        ) / 100.0
+        TM_params[PARAMETERS.TIME_STEPS.value] = st.number_input(
+            "Time steps",
+            min_value=0,
+            value=100,
+            key="TM_N"
+        )
+        st.caption("Higher steps result in longer loads")
+        TM_params[PARAMETERS.EXERCISE_STYLE.value] = st.selectbox(
+            "Exercise Style",
+            [EXERCISE_STYLE.EUROPEAN.value, EXERCISE_STYLE.AMERICAN.value],
+            format_func=lambda x: x.capitalize(),
+            key="TM_exercise_style"
+        )
+        st.caption("Matches a binomial tree of twice the steps, a cheaper American pricer")
+        # Output the values
+        if st.button(f"Calculate {tm_option_type} Premium", key="TM_output"):
+            if any(TM_params[k] is None for k in TM_params.keys()):
+                st.toast("Missing Parameter Input!")
+            else:
+                # Price through the shared cache and store calculation
+                TM_output = pricing_cache.price(OPTION_MODEL.TRINOMIAL_MODEL.value, tm_option_type, TM_params)
+                if TM_output:
+                    with st.spinner("Calculating..."):
+                        insert_run_to_db(OPTION_MODEL.TRINOMIAL_MODEL.value, {**TM_params, "option_type": tm_option_type}, TM_output)
+                        st.write(f"{tm_option_type.split(" ")[0].capitalize()} Price: {TM_output:.4f}")
+
+    with rightCol:
+        st.write(TM_params)
+        if TM_output:
+            st.write({"Premium": TM_output})
+            curStockPrice = TM_params[PARAMETERS.STOCK_PRICE.value]
+
+            # plot payout against price
+            fig_payoutprice = show_plot_payoff_profit(
+                tm_option_type,
+                TM_params[PARAMETERS.STRIKE_PRICE.value],
+                TM_output,
+                [curStockPrice*0.5, curStockPrice*1.5, 100]
+            )
+            st.pyplot(fig_payoutprice)
+
+            # plot premium against price
+            fig_premiumprice = show_plot_premium_price(
+                tm_option_type,
+                OPTION_MODEL.TRINOMIAL_MODEL.value,
+                [curStockPrice*0.5, curStockPrice*1.5, 100],
+                TM_params[PARAMETERS.STRIKE_PRICE.value],
+                TM_params[PARAMETERS.DAYS_TO_EXPIRY.value],
+                TM_params[PARAMETERS.INTEREST_RATE.value],
+                TM_params[PARAMETERS.VOLATILITY.value],
+                TM_params[PARAMETERS.DIVIDEND_YIELD.value],
+                N=TM_params[PARAMETERS.TIME_STEPS.value],
+                exercise_style=TM_params[PARAMETERS.EXERCISE_STYLE.value]
+            )
+            st.pyplot(fig_premiumprice)
\ No newline at end of file
@@ -0,0 +1,158 @@
+import numpy as np
+import streamlit as st
+
+from app.components.plot_scenario_heatmap import show_plot_scenario_heatmap
+from option_valuation.scenario_grid import PNL, PRICE, max_grid_points
+from utils.enums_option import EXERCISE_STYLE, GREEKS, OPTION_MODEL, OPTION_TYPE, PARAMETERS, TREE_METHOD
+
+## ----------------------------------------------
+# Declarations
+SCN_params = {
+    PARAMETERS.STOCK_PRICE.value: None,  # float
+    PARAMETERS.STRIKE_PRICE.value: None,  # float
+    PARAMETERS.DAYS_TO_EXPIRY.value: None,  # int
+    PARAMETERS.INTEREST_RATE.value: None,  # float
+    PARAMETERS.VOLATILITY.value: None,  # float
+    PARAMETERS.DIVIDEND_YIELD.value: None,  # float
+}
+SCENARIO_MODELS = [
+    OPTION_MODEL.BLACK_SCHOLES_MODEL.value,
+    OPTION_MODEL.BINOMIAL_MODEL.value,
+    OPTION_MODEL.TRINOMIAL_MODEL.value,
+]
+HEATMAP_VALUES = [PNL, PRICE] + [greek.value for greek in (GREEKS.DELTA, GREEKS.GAMMA, GREEKS.VEGA, GREEKS.THETA, GREEKS.RHO)]
+MAX_GRID_POINTS = 200
+MAX_TIME_SLICES = 10
+## ----------------------------------------------
+
+def show_scenario_tab():
+    leftCol, rightCol = st.columns([1, 3])
+    with leftCol:
+        scn_option_model = st.selectbox(
+            "Model",
+            SCENARIO_MODELS,
+            format_func=lambda x: x.title(),
+            key="scn_option_model"
+        )
+        scn_option_type = st.selectbox(
+            "Option Type",
+            [OPTION_TYPE.CALL.value, OPTION_TYPE.PUT.value],
+            format_func=lambda x: x.split(" ")[0].capitalize(),
+            key="scn_option_type"
+        )
+
+        # Get Parameters
+        st.write("Enter your variables")
+        SCN_params[PARAMETERS.STOCK_PRICE.value] = st.number_input(
+            "Stock Price",
+            min_value=0.01,
+            value=100.0,
+            key="SCN_S",
+        )
+        SCN_params[PARAMETERS.STRIKE_PRICE.value] = st.number_input(
+            "Strike Price",
+            min_value=0.01,
+            value=100.0,
+            key="SCN_X",
+        )
+        SCN_params[PARAMETERS.DAYS_TO_EXPIRY.value] = st.number_input(
+            "Days to Expiry",
+            min_value=2,
+            max_value=3650,
+            value=90,
+            key="SCN_T",
+        )
+        SCN_params[PARAMETERS.INTEREST_RATE.value] = st.number_input(
+            "Risk-Free Interest Rate (in %)",
+            min_value=0.0,
+            max_value=100.0,
+            value=5.0,
+            key="SCN_r"
+        ) / 100.0
+        SCN_params[PARAMETERS.VOLATILITY.value] = st.number_input(
+            "Volatility (in %)",
+            min_value=1.0,
+            max_value=500.0,
+            value=20.0,
+            key="SCN_sigma"
+        ) / 100.0
+        SCN_params[PARAMETERS.DIVIDEND_YIELD.value] = st.number_input(
+            "Dividend Yield (in %)",
+            min_value=0.0,
+            max_value=100.0,
+            value=0.0,
+            key="SCN_q"
+        ) / 100.0
+
+        N = 100
+        exercise_style = EXERCISE_STYLE.EUROPEAN.value
+        tree_method = TREE_METHOD.CRR.value
+        if scn_option_model != OPTION_MODEL.BLACK_SCHOLES_MODEL.value:
+            N = st.number_input("Time steps", min_value=1, max_value=1000, value=100, key="SCN_N")
+            exercise_style = st.selectbox(
+                "Exercise Style",
+                [EXERCISE_STYLE.EUROPEAN.value, EXERCISE_STYLE.AMERICAN.value],
+                format_func=lambda x: x.capitalize(),
+                key="SCN_exercise_style"
+            )
+            st.caption("Every scenario is a tree, American/ trinomial grids are limited to fewer points")
+
+        # Scenario grid
+        st.write("Scenario shocks")
+        spot_move = st.slider("Spot move (in %)", min_value=1, max_value=90, value=30, key="SCN_spot_move")
+        vol_move = st.slider("Volatility move (in % points)", min_value=1, max_value=100, value=10, key="SCN_vol_move")
+        points = st.slider("Grid points per axis", min_value=10, max_value=MAX_GRID_POINTS, value=101, key="SCN_points")
+        horizon = st.slider(
+            "Days elapsed",
+            min_value=0,
+            max_value=SCN_params[PARAMETERS.DAYS_TO_EXPIRY.value] - 1,
+            value=min(30, SCN_params[PARAMETERS.DAYS_TO_EXPIRY.value] - 1),
+            key="SCN_horizon"
+        )
+        slices = st.slider("Time slices", min_value=1, max_value=MAX_TIME_SLICES, value=4, key="SCN_slices")
+
+    # volatility moves stop short of zero volatility
+    sigma = SCN_params[PARAMETERS.VOLATILITY.value]
+    vol_down = min(vol_move / 100.0, sigma - 0.005)
+    time_shocks = tuple(int(day) for day in np.unique(np.linspace(0, horizon, slices).round()))
+
+    with rightCol:
+        value = st.segmented_control(
+            "Value",
+            HEATMAP_VALUES,
+            default=PNL,
+            format_func=lambda x: x.upper() if x == PNL else x.capitalize(),
+            key="SCN_value"
+        ) or PNL
+        greeks = value not in (PNL, PRICE)
+        # grids of one tree per scenario are held to about a second of pricing
+        max_points = max_grid_points(scn_option_model, len(time_shocks), greeks, N, exercise_style, tree_method)
+        if max_points is not None and points > max_points:
+            st.caption(f"Grid reduced to {max_points}x{max_points} points per time slice to stay interactive")
+            points = max_points
+        time_index = time_shocks.index(st.select_slider(
+            "Days elapsed",
+            time_shocks,
+            key="SCN_day"
+        )) if len(time_shocks) > 1 else 0
+
+        fig_heatmap = show_plot_scenario_heatmap(
+            value,
+            time_index,
+            scn_option_type,
+            scn_option_model,
+            SCN_params[PARAMETERS.STOCK_PRICE.value],
+            SCN_params[PARAMETERS.STRIKE_PRICE.value],
+            SCN_params[PARAMETERS.DAYS_TO_EXPIRY.value],
+            SCN_params[PARAMETERS.INTEREST_RATE.value],
+            sigma,
+            SCN_params[PARAMETERS.DIVIDEND_YIELD.value],
+            (-spot_move / 100.0, spot_move / 100.0, points),
+            (-vol_down, vol_move / 100.0, points),
+            time_shocks,
+            greeks=greeks,
+            N=N,
+            exercise_style=exercise_style,
+            tree_method=tree_method
+        )
+        st.pyplot(fig_heatmap)
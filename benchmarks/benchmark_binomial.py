@@ -0,0 +1,64 @@
+"""
+Benchmark for the vectorized binomial backward induction engine.
+Times BinomialModel against the original O(N^2) pure-Python double loop at the UI's max step count.
+
+Run from the project root:
+    python -m benchmarks.benchmark_binomial
+"""
+import time
+
+import numpy as np
+
+from option_valuation.binomial_model import BinomialModel
+from utils.enums_option import OPTION_TYPE, PARAMETERS
+
+params = {
+    PARAMETERS.STOCK_PRICE.value: 100,
+    PARAMETERS.STRIKE_PRICE.value: 100,
+    PARAMETERS.DAYS_TO_EXPIRY.value: 365,
+    PARAMETERS.INTEREST_RATE.value: 0.05,
+    PARAMETERS.VOLATILITY.value: 0.2,
+    PARAMETERS.TIME_STEPS.value: 1000,
+}
+MIN_SPEEDUP = 50
+
+
+def loop_binomial_price(model: BinomialModel) -> float:
+    option_values = np.zeros(model.N + 1)
+    for i in range(model.N + 1):
+        option_values[i] = max(0, model.S * (model.u ** i) * (model.d ** (model.N - i)) - model.X)
+
+    for step in range(model.N - 1, -1, -1):
+        for i in range(step + 1):
+            option_values[i] = np.exp(-model.r * model.delta_t) * (model.p * option_values[i+1] + (1-model.p) * option_values[i])
+
+    return option_values[0]
+
+
+def best_time(fn, repeats: int) -> float:
+    timings = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main():
+    model = BinomialModel(OPTION_TYPE.CALL.value, params)
+    loop_time = best_time(lambda: loop_binomial_price(model), repeats=3)
+    vector_time = best_time(model.calculate_price, repeats=20)
+    diff = abs(loop_binomial_price(model) - model.calculate_price())
+    speedup = loop_time / vector_time
+
+    print(f"N={model.N}")
+    print(f"Loop induction:       {loop_time * 1e3:10.3f} ms")
+    print(f"Vectorized induction: {vector_time * 1e3:10.3f} ms")
+    print(f"Speedup:              {speedup:10.1f}x (required >= {MIN_SPEEDUP}x)")
+    print(f"Abs price difference: {diff:.3e}")
+    assert diff < 1e-10, "Vectorized price deviates from loop reference"
+    assert speedup >= MIN_SPEEDUP, "Vectorized induction below required speedup"
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,104 @@
+"""
+Throughput benchmark for options_calcs writes.
+Compares the original connect/ commit/ close per run against the pooled WAL connection, the
+executemany bulk insert and the buffered background writer.
+
+Run from the project root:
+    python -m benchmarks.benchmark_db_writes [n_rows]
+"""
+import os
+import sqlite3
+import sys
+import tempfile
+import time
+
+import numpy as np
+import pandas as pd
+
+from db.sqlite.db_utils import (
+    BufferedRunWriter,
+    close_connections,
+    generate_unique_code,
+    init_db,
+    insert_run_to_db,
+    insert_runs_to_db,
+    INSERT_RUN_SQL,
+)
+from utils.enums_option import OPTION_MODEL, OPTION_TYPE, PARAMETERS
+
+MODEL = OPTION_MODEL.BLACK_SCHOLES_MODEL.value
+# per-connection inserts fsync every row, time a sample and extrapolate
+LEGACY_SAMPLE = 2000
+
+
+def make_runs(n: int) -> list:
+    rng = np.random.default_rng(0)
+    return pd.DataFrame({
+        "option_type": rng.choice([OPTION_TYPE.CALL.value, OPTION_TYPE.PUT.value], n),
+        PARAMETERS.STOCK_PRICE.value: rng.uniform(50, 150, n),
+        PARAMETERS.STRIKE_PRICE.value: rng.uniform(50, 150, n),
+        PARAMETERS.DAYS_TO_EXPIRY.value: rng.integers(1, 730, n),
+        PARAMETERS.INTEREST_RATE.value: 0.05,
+        PARAMETERS.VOLATILITY.value: 0.2,
+        PARAMETERS.DIVIDEND_YIELD.value: 0.0,
+    }).to_dict("records")
+
+
+def legacy_insert(params: dict, premium: float, db_path: str) -> None:
+    conn = sqlite3.connect(db_path)
+    cur = conn.cursor()
+    cur.execute(INSERT_RUN_SQL, (
+        generate_unique_code(MODEL, params), MODEL, params["option_type"],
+        params[PARAMETERS.STOCK_PRICE.value], params[PARAMETERS.STRIKE_PRICE.value],
+        params[PARAMETERS.DAYS_TO_EXPIRY.value], params[PARAMETERS.INTEREST_RATE.value],
+        params[PARAMETERS.VOLATILITY.value], params[PARAMETERS.DIVIDEND_YIELD.value], None, premium
+    ))
+    conn.commit()
+    cur.close()
+    conn.close()
+
+
+def timed(label: str, n: int, fn, measured: int = None) -> None:
+    start = time.perf_counter()
+    fn()
+    elapsed = time.perf_counter() - start
+    per_row = elapsed / (measured or n)
+    note = f" (extrapolated from {measured} rows)" if measured else ""
+    print(f"{label:<32}{per_row * n:>10.2f} s{1 / per_row:>14.0f} rows/s{note}")
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    runs = make_runs(n)
+    premiums = np.random.default_rng(1).uniform(0, 20, n)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        paths = {name: os.path.join(tmp, f"{name}.db") for name in ("legacy", "pooled", "bulk", "buffered")}
+
+        # legacy table without WAL, as created before connection pooling
+        conn = sqlite3.connect(paths["legacy"])
+        init_sql = "CREATE TABLE options_calcs (id INTEGER PRIMARY KEY AUTOINCREMENT, unique_code TEXT, timestamp DATETIME DEFAULT CURRENT_TIMESTAMP, model TEXT, option_type TEXT, stock_price REAL, strike_price REAL, days_to_expiry INTEGER, interest_rate REAL, volatility REAL, dividend_yield REAL, time_steps INTEGER, option_price REAL)"
+        conn.execute(init_sql)
+        conn.close()
+        for name in ("pooled", "bulk", "buffered"):
+            init_db(paths[name])
+
+        sample = min(n, LEGACY_SAMPLE)
+        print(f"{n} options_calcs inserts")
+        timed("connect/commit/close per run", n,
+              lambda: [legacy_insert(runs[i], premiums[i], paths["legacy"]) for i in range(sample)], measured=sample)
+        timed("pooled WAL insert_run_to_db", n,
+              lambda: [insert_run_to_db(MODEL, runs[i], premiums[i], paths["pooled"]) for i in range(n)])
+        timed("insert_runs_to_db (executemany)", n,
+              lambda: insert_runs_to_db(MODEL, runs, premiums, paths["bulk"]))
+
+        def buffered():
+            with BufferedRunWriter(paths["buffered"], batch_size=5000) as writer:
+                for params, premium in zip(runs, premiums):
+                    writer.submit(MODEL, params, premium)
+        timed("BufferedRunWriter", n, buffered)
+        close_connections()
+
+
+if __name__ == "__main__":
+    main()
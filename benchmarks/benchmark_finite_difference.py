@@ -0,0 +1,61 @@
+"""
+American put benchmark for the Crank-Nicolson finite difference model against the CRR binomial tree.
+The reference value is a very fine CRR tree. Reports error and time per grid/ tree size, and the time
+to price a row of 101 spot values from one finite difference solve against a batched tree.
+
+Run from the project root:
+    python -m benchmarks.benchmark_finite_difference
+"""
+import time
+
+import numpy as np
+
+from benchmarks.benchmark_binomial import best_time
+from option_valuation.binomial_model import BinomialModel
+from option_valuation.finite_difference_model import FiniteDifferenceModel
+from utils.enums_option import EXERCISE_STYLE, OPTION_TYPE, PARAMETERS
+
+params = {
+    PARAMETERS.STOCK_PRICE.value: 100,
+    PARAMETERS.STRIKE_PRICE.value: 100,
+    PARAMETERS.DAYS_TO_EXPIRY.value: 365,
+    PARAMETERS.INTEREST_RATE.value: 0.05,
+    PARAMETERS.VOLATILITY.value: 0.2,
+    PARAMETERS.DIVIDEND_YIELD.value: 0.01,
+    PARAMETERS.EXERCISE_STYLE.value: EXERCISE_STYLE.AMERICAN.value,
+}
+REFERENCE_STEPS = 20000
+GRID_SIZES = [50, 100, 200, 400, 800]
+TREE_STEPS = [200, 500, 1000, 2000, 5000]
+SPOTS = np.linspace(60, 140, 101)
+MIN_SPEEDUP = 10
+REPEATS = 5
+
+
+def main():
+    option_type = OPTION_TYPE.PUT.value
+    exact = BinomialModel(option_type, {**params, PARAMETERS.TIME_STEPS.value: REFERENCE_STEPS}).calculate_price()
+    print(f"CRR reference ({REFERENCE_STEPS} steps): {exact:.6f}\n")
+    print(f"{'model':<22}{'error':>12}{'time (ms)':>12}")
+
+    for size in GRID_SIZES:
+        model = FiniteDifferenceModel(option_type, {**params, PARAMETERS.TIME_STEPS.value: size, PARAMETERS.PRICE_STEPS.value: size})
+        elapsed = best_time(model.calculate_price, REPEATS)
+        print(f"{f'fd {size}x{size}':<22}{abs(model.calculate_price() - exact):>12.2e}{elapsed * 1e3:>12.3f}")
+    for steps in TREE_STEPS:
+        model = BinomialModel(option_type, {**params, PARAMETERS.TIME_STEPS.value: steps})
+        elapsed = best_time(model.calculate_price, REPEATS)
+        print(f"{f'binomial {steps}':<22}{abs(model.calculate_price() - exact):>12.2e}{elapsed * 1e3:>12.3f}")
+
+    row_params = {**params, PARAMETERS.STOCK_PRICE.value: SPOTS, PARAMETERS.TIME_STEPS.value: 400, PARAMETERS.PRICE_STEPS.value: 400}
+    fd_row = best_time(FiniteDifferenceModel(option_type, row_params).calculate_price, REPEATS)
+    tree_params = {**params, PARAMETERS.STOCK_PRICE.value: SPOTS[:, None], PARAMETERS.TIME_STEPS.value: 2000}
+    start = time.perf_counter()
+    BinomialModel(option_type, tree_params).calculate_price()
+    tree_row = time.perf_counter() - start
+    print(f"\n{SPOTS.size} spots: fd 400x400 {fd_row * 1e3:.1f} ms, batched binomial 2000 steps {tree_row * 1e3:.1f} ms ({tree_row / fd_row:.0f}x)")
+    assert tree_row / fd_row >= MIN_SPEEDUP, "Finite difference row below required speedup"
+
+
+if __name__ == "__main__":
+    main()
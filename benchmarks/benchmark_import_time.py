@@ -0,0 +1,71 @@
+"""
+Startup benchmark from python -X importtime.
+Imports each entry point in a fresh interpreter and reports its cumulative import time, once as is
+(heavy dependencies deferred to first use) and once with the heavy dependencies imported up front
+as the modules used to, and checks that none of them are loaded by the import alone.
+
+Run from the project root:
+    python -m benchmarks.benchmark_import_time
+"""
+import os
+import subprocess
+import sys
+
+ENTRY_POINTS = [
+    "option_valuation.batch_pricing",
+    "utils.options_formulas",
+    "utils.common_formulas",
+    "pricing_service.server",
+]
+# Modules the pricing core used to import at the top, now loaded on first use
+EAGER_MODULES = ["scipy.stats", "scipy.optimize", "scipy.linalg.lapack", "pandas"]
+# None of these may be loaded by importing an entry point
+HEAVY_MODULES = EAGER_MODULES + ["scipy.special", "matplotlib", "streamlit", "dotenv", "alpaca"]
+MIN_SPEEDUP = 3
+REPEATS = 3
+
+
+def import_time(modules: list) -> tuple:
+    """
+    Import time (s) of modules in a fresh interpreter, the sum of the cumulative times of the top level
+    imports logged after interpreter startup (site), and the names of HEAVY_MODULES they loaded.
+    """
+    code = f"import sys; import {', '.join(modules)}; print(*[m for m in {HEAVY_MODULES!r} if m in sys.modules])"
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True, text=True, check=True, env={**os.environ, "PYTHONPATH": os.getcwd()}
+    )
+    elapsed, started = 0.0, False
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line.split("|")
+        if name.startswith("  "):  # nested imports are indented under their importer
+            continue
+        if started:
+            elapsed += int(cumulative) / 1e6
+        started = started or name.strip() == "site"
+    return elapsed, result.stdout.split()
+
+
+def best_import_time(modules: list) -> float:
+    return min(import_time(modules)[0] for _ in range(REPEATS))
+
+
+def main():
+    print(f"{'entry point':<34}{'lazy (ms)':>12}{'eager (ms)':>12}{'speedup':>10}")
+    for module in ENTRY_POINTS:
+        _, loaded = import_time([module])
+        assert not loaded, f"{module} imports {loaded} at startup"
+
+        lazy = best_import_time([module])
+        eager = best_import_time(EAGER_MODULES + [module])
+        print(f"{module:<34}{lazy * 1e3:>12.1f}{eager * 1e3:>12.1f}{eager / lazy:>9.1f}x")
+        assert eager / lazy >= MIN_SPEEDUP, f"{module} startup below required speedup"
+
+    for module in EAGER_MODULES:
+        print(f"  {module:<32}{best_import_time([module]) * 1e3:>12.1f} ms on its own")
+
+
+if __name__ == "__main__":
+    main()
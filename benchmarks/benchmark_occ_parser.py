@@ -0,0 +1,61 @@
+"""
+Benchmark for the columnar OCC symbol parser.
+Times parse_occ_symbol per symbol (dict + datetime.date each) against parse_occ_symbols on 1M symbols.
+
+Run from the project root:
+    python -m benchmarks.benchmark_occ_parser
+"""
+import time
+
+import numpy as np
+
+from alpaca_api.options import parse_occ_symbol, parse_occ_symbols
+
+N_SYMBOLS = 1_000_000
+MIN_SPEEDUP = 4
+
+
+def make_symbols(n: int, seed: int = 0) -> list:
+    rng = np.random.default_rng(seed)
+    roots = np.array(["AAPL", "SPY", "F", "BRKB", "GOOGL", "AAPL1", "QQQ"])
+    root = rng.choice(roots, n)
+    year = rng.integers(24, 35, n)
+    month = rng.integers(1, 13, n)
+    day = rng.integers(1, 29, n)
+    flag = rng.choice(["C", "P"], n)
+    strike = rng.integers(1, 5000, n) * 500
+    return [
+        f"{r}{y:02d}{m:02d}{d:02d}{f}{k:08d}"
+        for r, y, m, d, f, k in zip(root, year, month, day, flag, strike)
+    ]
+
+
+def main():
+    symbols = make_symbols(N_SYMBOLS)
+
+    start = time.perf_counter()
+    loop_parsed = [parse_occ_symbol(symbol) for symbol in symbols]
+    loop_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    parsed = parse_occ_symbols(symbols)
+    vector_time = time.perf_counter() - start
+
+    sample = np.random.default_rng(1).integers(0, N_SYMBOLS, 1000)
+    for i in sample:
+        row, expected = parsed.iloc[i], loop_parsed[i]
+        assert row["underlying"] == expected["underlying"]
+        assert row["expiration_date"].date() == expected["expiration_date"]
+        assert row["type"] == expected["type"]
+        assert row["strike_price"] == expected["strike_price"]
+
+    speedup = loop_time / vector_time
+    print(f"{N_SYMBOLS:,} symbols")
+    print(f"Per symbol parse:  {loop_time:8.3f} s")
+    print(f"Columnar parse:    {vector_time:8.3f} s")
+    print(f"Speedup:           {speedup:8.1f}x (required >= {MIN_SPEEDUP}x)")
+    assert speedup >= MIN_SPEEDUP, "Columnar parser below required speedup"
+
+
+if __name__ == "__main__":
+    main()
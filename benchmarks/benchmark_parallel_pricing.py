@@ -0,0 +1,63 @@
+"""
+Scaling benchmark for the multiprocess chain pricer.
+Prices a synthetic book with BinomialModel at a high step count and reports contracts/sec for
+increasing worker counts up to the machine's core count.
+
+Run from the project root:
+    python -m benchmarks.benchmark_parallel_pricing [n_contracts] [time_steps]
+"""
+import os
+import sys
+import time
+
+import numpy as np
+
+from option_valuation.batch_pricing import price_batch
+from option_valuation.parallel_pricing import price_batch_parallel
+from utils.enums_option import EXERCISE_STYLE, OPTION_MODEL, OPTION_TYPE
+
+
+def worker_counts(max_workers: int) -> list:
+    counts = [1]
+    while counts[-1] * 2 <= max_workers:
+        counts.append(counts[-1] * 2)
+    if counts[-1] != max_workers:
+        counts.append(max_workers)
+    return counts
+
+
+def main():
+    n_contracts = int(sys.argv[1]) if len(sys.argv) > 1 else 20_000
+    steps = int(sys.argv[2]) if len(sys.argv) > 2 else 500
+    rng = np.random.default_rng(0)
+    book = dict(
+        option_type=rng.choice([OPTION_TYPE.CALL.value, OPTION_TYPE.PUT.value], n_contracts),
+        S=rng.uniform(50, 150, n_contracts),
+        X=rng.uniform(50, 150, n_contracts),
+        T=rng.integers(1, 730, n_contracts),
+        r=0.04,
+        sigma=rng.uniform(0.1, 0.6, n_contracts),
+    )
+    model_kwargs = dict(N=steps, exercise_style=EXERCISE_STYLE.AMERICAN.value)
+
+    start = time.perf_counter()
+    serial = price_batch(OPTION_MODEL.BINOMIAL_MODEL.value, **book, **model_kwargs)
+    serial_time = time.perf_counter() - start
+
+    # start the forkserver (one-off pricing stack import) outside the timings
+    price_batch_parallel(OPTION_MODEL.BINOMIAL_MODEL.value, OPTION_TYPE.CALL.value, 100, 100, 30, 0.04, 0.2, workers=1)
+
+    print(f"{n_contracts} American binomial contracts, N={steps}, cores available: {os.cpu_count()}")
+    print(f"{'workers':>8}{'seconds':>10}{'contracts/sec':>16}{'speedup':>10}{'efficiency':>12}")
+    print(f"{'serial':>8}{serial_time:>10.2f}{n_contracts / serial_time:>16.0f}{1.0:>10.2f}{1.0:>12.2f}")
+    for workers in worker_counts(os.cpu_count() or 1):
+        start = time.perf_counter()
+        prices = price_batch_parallel(OPTION_MODEL.BINOMIAL_MODEL.value, **book, **model_kwargs, workers=workers)
+        elapsed = time.perf_counter() - start
+        assert np.array_equal(prices, serial), "Parallel prices differ from serial batch"
+        speedup = serial_time / elapsed
+        print(f"{workers:>8}{elapsed:>10.2f}{n_contracts / elapsed:>16.0f}{speedup:>10.2f}{speedup / workers:>12.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+"""
+Benchmark for Portfolio market updates.
+Times a spot/ volatility update of one underlying (incremental, only its positions repriced) against
+repricing the whole book, and a loop of per position BlackScholesModel Greeks on a sample of the book.
+
+Run from the project root:
+    python -m benchmarks.benchmark_portfolio
+"""
+import numpy as np
+
+from benchmarks.benchmark_binomial import best_time
+from option_valuation.black_scholes_model import BlackScholesModel
+from option_valuation.portfolio import Portfolio
+from utils.enums_option import OPTION_TYPE, PARAMETERS
+
+POSITIONS = 50_000
+UNDERLYINGS = 100
+LOOP_POSITIONS = 1_000
+MIN_SPEEDUP = 20
+REPEATS = 5
+
+rng = np.random.default_rng(0)
+symbols = np.array([f"U{i:03d}" for i in range(UNDERLYINGS)])
+spots = rng.uniform(20, 500, UNDERLYINGS)
+codes = rng.integers(0, UNDERLYINGS, POSITIONS)
+book = {
+    "underlying": symbols[codes],
+    "option_type": rng.choice([OPTION_TYPE.CALL.value, OPTION_TYPE.PUT.value], POSITIONS),
+    "S": spots[codes],
+    "X": spots[codes] * rng.uniform(0.7, 1.3, POSITIONS),
+    "T": rng.integers(1, 730, POSITIONS).astype(float),
+    "r": 0.04,
+    "sigma": rng.uniform(0.1, 0.8, POSITIONS),
+    "quantity": rng.integers(-50, 51, POSITIONS).astype(float),
+}
+
+
+def loop_greeks(positions: int) -> list:
+    return [
+        BlackScholesModel(book["option_type"][i], {
+            PARAMETERS.STOCK_PRICE.value: book["S"][i],
+            PARAMETERS.STRIKE_PRICE.value: book["X"][i],
+            PARAMETERS.DAYS_TO_EXPIRY.value: book["T"][i],
+            PARAMETERS.INTEREST_RATE.value: book["r"],
+            PARAMETERS.VOLATILITY.value: book["sigma"][i],
+        }).calculate_greeks()
+        for i in range(positions)
+    ]
+
+
+def main():
+    portfolio = Portfolio(**book)
+    symbol = symbols[0]
+    moves = iter(rng.uniform(0.95, 1.05, 10_000))
+
+    update_time = best_time(lambda: portfolio.update_market(symbol, S=spots[0] * next(moves), sigma=0.3), REPEATS)
+    full_time = best_time(portfolio.revalue, REPEATS)
+    loop_time = best_time(lambda: loop_greeks(LOOP_POSITIONS), 1) * POSITIONS / LOOP_POSITIONS
+    speedup = full_time / update_time
+
+    print(f"{POSITIONS} positions, {UNDERLYINGS} underlyings, {(book['underlying'] == symbol).sum()} positions in {symbol}")
+    print(f"Per position loop (est.): {loop_time * 1e3:10.1f} ms")
+    print(f"Full book revaluation:    {full_time * 1e3:10.3f} ms")
+    print(f"One underlying update:    {update_time * 1e3:10.3f} ms")
+    print(f"Speedup:                  {speedup:10.1f}x (required >= {MIN_SPEEDUP}x)")
+    assert speedup >= MIN_SPEEDUP, "Incremental revaluation below required speedup"
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+"""
+Benchmark for the premium vs underlying curve behind the plot components.
+Times the original per point loop (one BinomialModel per stock price) against
+BinomialModel.calculate_price_curve, which prices the whole curve from one tree's terminal distribution.
+
+Run from the project root:
+    python -m benchmarks.benchmark_premium_curve
+"""
+import time
+
+import numpy as np
+
+from option_valuation.binomial_model import BinomialModel
+from utils.enums_option import OPTION_TYPE, PARAMETERS
+
+params = {
+    PARAMETERS.STRIKE_PRICE.value: 100,
+    PARAMETERS.DAYS_TO_EXPIRY.value: 365,
+    PARAMETERS.INTEREST_RATE.value: 0.05,
+    PARAMETERS.VOLATILITY.value: 0.2,
+    PARAMETERS.TIME_STEPS.value: 1000,
+}
+STOCK_PRICES = np.linspace(50, 150, 100)
+MIN_SPEEDUP = 20
+
+
+def loop_curve(option_type: str) -> np.ndarray:
+    return np.array([
+        BinomialModel(option_type, {**params, PARAMETERS.STOCK_PRICE.value: s}).calculate_price()
+        for s in STOCK_PRICES
+    ])
+
+
+def vector_curve(option_type: str) -> np.ndarray:
+    return BinomialModel(option_type, {**params, PARAMETERS.STOCK_PRICE.value: STOCK_PRICES}).calculate_price_curve()
+
+
+def best_time(fn, repeats: int) -> float:
+    timings = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main():
+    option_type = OPTION_TYPE.CALL.value
+    loop_time = best_time(lambda: loop_curve(option_type), repeats=3)
+    vector_time = best_time(lambda: vector_curve(option_type), repeats=20)
+    diff = np.max(np.abs(loop_curve(option_type) - vector_curve(option_type)))
+    speedup = loop_time / vector_time
+
+    print(f"{STOCK_PRICES.size} points, N={params[PARAMETERS.TIME_STEPS.value]}")
+    print(f"Per point trees:      {loop_time * 1e3:10.3f} ms")
+    print(f"Single tree curve:    {vector_time * 1e3:10.3f} ms")
+    print(f"Speedup:              {speedup:10.1f}x (required >= {MIN_SPEEDUP}x)")
+    print(f"Max abs difference:   {diff:.3e}")
+    assert diff < 1e-9, "Curve deviates from per point trees"
+    assert speedup >= MIN_SPEEDUP, "Curve pricing below required speedup"
+
+
+if __name__ == "__main__":
+    main()
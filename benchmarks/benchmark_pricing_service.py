@@ -0,0 +1,65 @@
+"""
+Throughput benchmark for the pricing service's micro-batching.
+Fires concurrent single contract /price requests straight at the ASGI app (no network), once with
+the default micro-batcher and once with batches of one request, and reports requests per second.
+
+Run from the project root:
+    python -m benchmarks.benchmark_pricing_service
+"""
+import asyncio
+import json
+import time
+
+import numpy as np
+
+from pricing_service import server
+from pricing_service.micro_batcher import MicroBatcher
+from utils.enums_option import OPTION_MODEL, OPTION_TYPE
+
+N_REQUESTS = 5_000
+MIN_SPEEDUP = 5
+
+rng = np.random.default_rng(0)
+payloads = [
+    json.dumps({
+        "option_model": OPTION_MODEL.BLACK_SCHOLES_MODEL.value,
+        "option_type": OPTION_TYPE.CALL.value,
+        "stock_price": float(S),
+        "strike_price": 100.0,
+        "days_to_expiry": 90,
+        "interest_rate": 0.04,
+        "volatility": 0.3,
+    }).encode()
+    for S in rng.uniform(80, 120, N_REQUESTS)
+]
+
+
+async def post(body: bytes) -> None:
+    async def receive():
+        return {"type": "http.request", "body": body, "more_body": False}
+
+    async def send(message):
+        pass
+
+    await server.app({"type": "http", "method": "POST", "path": "/price"}, receive, send)
+
+
+async def run(max_batch: int) -> float:
+    server.price_batcher = MicroBatcher(server._price_rows, max_batch=max_batch)
+    start = time.perf_counter()
+    await asyncio.gather(*(post(body) for body in payloads))
+    return time.perf_counter() - start
+
+
+def main():
+    unbatched = asyncio.run(run(max_batch=1))
+    batched = asyncio.run(run(max_batch=server.MicroBatcher(server._price_rows).max_batch))
+    print(f"{N_REQUESTS} concurrent /price requests")
+    print(f"  batches of 1:  {unbatched:.3f}s ({N_REQUESTS / unbatched:,.0f} req/s)")
+    print(f"  micro-batched: {batched:.3f}s ({N_REQUESTS / batched:,.0f} req/s, {server.price_batcher.stats()['mean_batch_size']:.0f} per batch)")
+    print(f"  speedup: {unbatched / batched:.1f}x")
+    assert unbatched / batched >= MIN_SPEEDUP, "Micro-batching below required speedup"
+
+
+if __name__ == "__main__":
+    main()
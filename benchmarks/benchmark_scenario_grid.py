@@ -0,0 +1,93 @@
+"""
+Benchmark for scenario grids behind the scenario heatmap.
+Times a small spot x volatility grid priced point by point (one model per scenario) against
+scenario_grid, then the 200x200 grids the heatmap draws, whose european closed-form/ binomial
+versions must stay under MAX_GRID_SECONDS. Every other tree grid is limited to max_grid_points per
+axis in the heatmap, those limited grids (one time slice) must stay under MAX_TREE_GRID_SECONDS.
+
+Run from the project root:
+    python -m benchmarks.benchmark_scenario_grid
+"""
+import numpy as np
+
+from benchmarks.benchmark_binomial import best_time
+from option_valuation.batch_pricing import MODELS
+from option_valuation.scenario_grid import PRICE, max_grid_points, scenario_grid
+from utils.enums_option import EXERCISE_STYLE, OPTION_MODEL, OPTION_TYPE, PARAMETERS
+
+S, X, T, r, sigma, q = 100.0, 100.0, 90, 0.05, 0.2, 0.01
+N = 100
+LOOP_POINTS = 20
+GRID_POINTS = 200
+MIN_SPEEDUP = 20
+# Longest time (s) a european 200x200 closed-form/ binomial grid may take to stay interactive
+MAX_GRID_SECONDS = 0.5
+# Longest time (s) a tree grid limited by max_grid_points may take
+MAX_TREE_GRID_SECONDS = 1.5
+REPEATS = 3
+
+
+def shocks(points: int) -> dict:
+    return {"spot_shocks": np.linspace(-0.3, 0.3, points), "vol_shocks": np.linspace(-0.15, 0.15, points)}
+
+
+def loop_grid(option_model: str, points: int) -> np.ndarray:
+    grid = shocks(points)
+    return np.array([[
+        MODELS[option_model](OPTION_TYPE.PUT.value, {
+            PARAMETERS.STOCK_PRICE.value: S * (1 + spot_shock),
+            PARAMETERS.STRIKE_PRICE.value: X,
+            PARAMETERS.DAYS_TO_EXPIRY.value: T,
+            PARAMETERS.INTEREST_RATE.value: r,
+            PARAMETERS.VOLATILITY.value: sigma + vol_shock,
+            PARAMETERS.DIVIDEND_YIELD.value: q,
+            PARAMETERS.TIME_STEPS.value: N,
+        }).calculate_price()
+        for vol_shock in grid["vol_shocks"]
+    ] for spot_shock in grid["spot_shocks"]])
+
+
+def vector_grid(option_model: str, points: int, **kwargs):
+    return scenario_grid(option_model, OPTION_TYPE.PUT.value, S, X, T, r, sigma, q, N=N, **shocks(points), **kwargs)
+
+
+def main():
+    print(f"{'model':<24}{f'loop {LOOP_POINTS}x{LOOP_POINTS} (ms)':>22}{'grid (ms)':>12}{'speedup':>10}")
+    for option_model in (OPTION_MODEL.BLACK_SCHOLES_MODEL.value, OPTION_MODEL.BINOMIAL_MODEL.value):
+        loop_time = best_time(lambda: loop_grid(option_model, LOOP_POINTS), 1)
+        grid_time = best_time(lambda: vector_grid(option_model, LOOP_POINTS), REPEATS)
+        diff = np.max(np.abs(loop_grid(option_model, LOOP_POINTS) - vector_grid(option_model, LOOP_POINTS)[PRICE]))
+        print(f"{option_model:<24}{loop_time * 1e3:>22.1f}{grid_time * 1e3:>12.3f}{loop_time / grid_time:>9.1f}x")
+        assert diff < 1e-9, "Grid deviates from per scenario pricing"
+        assert loop_time / grid_time >= MIN_SPEEDUP, "Scenario grid below required speedup"
+
+    print(f"\n{f'{GRID_POINTS}x{GRID_POINTS} grid':<34}{'price (ms)':>12}{'greeks (ms)':>12}")
+    for option_model, exercise_style in [
+        (OPTION_MODEL.BLACK_SCHOLES_MODEL.value, EXERCISE_STYLE.EUROPEAN.value),
+        (OPTION_MODEL.BINOMIAL_MODEL.value, EXERCISE_STYLE.EUROPEAN.value),
+        (OPTION_MODEL.BINOMIAL_MODEL.value, EXERCISE_STYLE.AMERICAN.value),
+        (OPTION_MODEL.TRINOMIAL_MODEL.value, EXERCISE_STYLE.EUROPEAN.value),
+    ]:
+        price_time = best_time(lambda: vector_grid(option_model, GRID_POINTS, exercise_style=exercise_style), 1)
+        greeks_time = best_time(lambda: vector_grid(option_model, GRID_POINTS, exercise_style=exercise_style, greeks=True), 1)
+        print(f"{f'{option_model} ({exercise_style})':<34}{price_time * 1e3:>12.1f}{greeks_time * 1e3:>12.1f}")
+        if exercise_style == EXERCISE_STYLE.EUROPEAN.value and option_model != OPTION_MODEL.TRINOMIAL_MODEL.value:
+            assert greeks_time <= MAX_GRID_SECONDS, f"{option_model} grid too slow to stay interactive"
+
+    print(f"\n{'grid limited by max_grid_points':<34}{'price (ms)':>12}{'greeks (ms)':>12}")
+    for option_model, exercise_style in [
+        (OPTION_MODEL.BINOMIAL_MODEL.value, EXERCISE_STYLE.AMERICAN.value),
+        (OPTION_MODEL.TRINOMIAL_MODEL.value, EXERCISE_STYLE.EUROPEAN.value),
+        (OPTION_MODEL.TRINOMIAL_MODEL.value, EXERCISE_STYLE.AMERICAN.value),
+    ]:
+        price_points = max_grid_points(option_model, 1, N=N, exercise_style=exercise_style)
+        greeks_points = max_grid_points(option_model, 1, greeks=True, N=N, exercise_style=exercise_style)
+        price_time = best_time(lambda: vector_grid(option_model, price_points, exercise_style=exercise_style), 1)
+        greeks_time = best_time(lambda: vector_grid(option_model, greeks_points, exercise_style=exercise_style, greeks=True), 1)
+        label = f"{option_model} ({exercise_style}) {price_points}/{greeks_points} pts"
+        print(f"{label:<34}{price_time * 1e3:>12.1f}{greeks_time * 1e3:>12.1f}")
+        assert max(price_time, greeks_time) <= MAX_TREE_GRID_SECONDS, f"{option_model} limited grid too slow to stay interactive"
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,56 @@
+"""
+Convergence benchmark for the binomial tree methods against the Black-Scholes closed form.
+For each tree method reports the pricing error and time per step count, and the smallest step count
+reaching the target accuracy, compared with plain CRR.
+
+Run from the project root:
+    python -m benchmarks.benchmark_tree_convergence
+"""
+import time
+
+from option_valuation.binomial_model import BinomialModel
+from option_valuation.black_scholes_model import BlackScholesModel
+from utils.enums_option import OPTION_TYPE, PARAMETERS, TREE_METHOD
+
+params = {
+    PARAMETERS.STOCK_PRICE.value: 100,
+    PARAMETERS.STRIKE_PRICE.value: 110,
+    PARAMETERS.DAYS_TO_EXPIRY.value: 365,
+    PARAMETERS.INTEREST_RATE.value: 0.05,
+    PARAMETERS.VOLATILITY.value: 0.2,
+    PARAMETERS.DIVIDEND_YIELD.value: 0.01,
+}
+STEPS = [25, 51, 101, 201, 401, 801, 1601, 3201]
+TARGET_ERROR = 1e-3
+MIN_STEP_REDUCTION = 10
+
+
+def main():
+    option_type = OPTION_TYPE.CALL.value
+    exact = BlackScholesModel(option_type, params).calculate_price()
+    print(f"Black-Scholes reference: {exact:.6f}\n")
+    print(f"{'method':<15}{'steps':>7}{'error':>12}{'time (ms)':>12}")
+
+    steps_to_target = {}
+    for method in TREE_METHOD:
+        for steps in STEPS:
+            model = BinomialModel(option_type, {**params, PARAMETERS.TIME_STEPS.value: steps, PARAMETERS.TREE_METHOD.value: method.value})
+            start = time.perf_counter()
+            error = abs(model.calculate_price() - exact)
+            elapsed = time.perf_counter() - start
+            print(f"{method.value:<15}{steps:>7}{error:>12.2e}{elapsed * 1e3:>12.3f}")
+            if error < TARGET_ERROR and method.value not in steps_to_target:
+                steps_to_target[method.value] = steps
+        print()
+
+    crr_steps = steps_to_target.get(TREE_METHOD.CRR.value, float("inf"))
+    print(f"Steps needed for error < {TARGET_ERROR:g}:")
+    for method, steps in steps_to_target.items():
+        print(f"  {method:<15}{steps:>7} ({crr_steps / steps:5.1f}x fewer than CRR)")
+
+    best = min(steps_to_target[TREE_METHOD.LEISEN_REIMER.value], steps_to_target[TREE_METHOD.BBSR.value])
+    assert crr_steps / best >= MIN_STEP_REDUCTION, "Accelerated trees below required step reduction"
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+"""
+Accuracy per cost benchmark for the trinomial tree against the CRR binomial tree on an American put.
+The reference value is a fine BBSR tree (Black-Scholes smoothing with Richardson extrapolation, which
+converges smoothly where plain CRR oscillates), its own uncertainty taken as the change from half the
+steps. For each step count reports the pricing error and time, and the cheapest run of each tree whose
+error stays below the target from that step count on (tree errors oscillate, so one lucky step count
+below target does not count).
+
+Run from the project root:
+    python -m benchmarks.benchmark_trinomial
+"""
+import time
+
+from option_valuation.binomial_model import BinomialModel
+from option_valuation.trinomial_model import TrinomialModel
+from utils.enums_option import EXERCISE_STYLE, OPTION_TYPE, PARAMETERS, TREE_METHOD
+
+params = {
+    PARAMETERS.STOCK_PRICE.value: 100,
+    PARAMETERS.STRIKE_PRICE.value: 110,
+    PARAMETERS.DAYS_TO_EXPIRY.value: 365,
+    PARAMETERS.INTEREST_RATE.value: 0.05,
+    PARAMETERS.VOLATILITY.value: 0.2,
+    PARAMETERS.DIVIDEND_YIELD.value: 0.01,
+    PARAMETERS.EXERCISE_STYLE.value: EXERCISE_STYLE.AMERICAN.value,
+}
+REFERENCE_STEPS = 16000
+STEPS = [25, 50, 100, 200, 400, 800, 1600, 3200]
+TARGET_ERROR = 5e-4
+MODELS = {"binomial": BinomialModel, "trinomial": TrinomialModel}
+
+
+def reference_price(option_type: str, steps: int) -> float:
+    reference = {**params, PARAMETERS.TIME_STEPS.value: steps, PARAMETERS.TREE_METHOD.value: TREE_METHOD.BBSR.value}
+    return BinomialModel(option_type, reference).calculate_price()
+
+
+def main():
+    option_type = OPTION_TYPE.PUT.value
+    exact = reference_price(option_type, REFERENCE_STEPS)
+    uncertainty = abs(exact - reference_price(option_type, REFERENCE_STEPS // 2))
+    print(f"BBSR reference ({REFERENCE_STEPS} steps): {exact:.8f} (+/- {uncertainty:.1e})\n")
+    assert uncertainty < TARGET_ERROR / 10, "Reference too coarse for the target error"
+    print(f"{'model':<12}{'steps':>7}{'error':>12}{'time (ms)':>12}")
+
+    time_to_target = {}
+    for name, model_cls in MODELS.items():
+        runs = []
+        for steps in STEPS:
+            model = model_cls(option_type, {**params, PARAMETERS.TIME_STEPS.value: steps})
+            start = time.perf_counter()
+            error = abs(model.calculate_price() - exact)
+            elapsed = time.perf_counter() - start
+            print(f"{name:<12}{steps:>7}{error:>12.2e}{elapsed * 1e3:>12.3f}")
+            runs.append((steps, error, elapsed))
+        print()
+        # first step count from which every finer run stays below target
+        for i, (steps, _, elapsed) in enumerate(runs):
+            if all(error < TARGET_ERROR for _, error, _ in runs[i:]):
+                time_to_target[name] = (steps, elapsed)
+                break
+
+    print(f"Cheapest run with error < {TARGET_ERROR:g} at every finer step count:")
+    for name in MODELS:
+        if name in time_to_target:
+            steps, elapsed = time_to_target[name]
+            print(f"  {name:<12}{steps:>7} steps {elapsed * 1e3:>9.3f} ms")
+        else:
+            print(f"  {name:<12} not reached within {STEPS[-1]} steps")
+
+
+if __name__ == "__main__":
+    main()
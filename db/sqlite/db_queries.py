@@ -0,0 +1,110 @@
+import datetime
+
+import pandas as pd
+
+from db.sqlite.db_utils import get_connection
+
+"""
+Query layer over TABLE 'options_calcs' history for the DB viewer.
+
+Rows are returned newest first in pages using keyset pagination: the cursor is the
+(timestamp, id) of the last row of a page and the next page continues strictly after it,
+so every page is an index range scan (idx_options_calcs_timestamp) instead of an OFFSET
+that re-reads all earlier rows. Filters are applied in SQL, never in pandas.
+"""
+HISTORY_COLUMNS = (
+    "id",
+    "unique_code",
+    "timestamp",
+    "model",
+    "option_type",
+    "stock_price",
+    "strike_price",
+    "days_to_expiry",
+    "interest_rate",
+    "volatility",
+    "dividend_yield",
+    "time_steps",
+    "option_price",
+)
+
+
+def query_runs(
+    db_path: str = "options_calcs.db",
+    model: str = None,  # OPTION_MODEL value
+    option_type: str = None,  # OPTION_TYPE value
+    start_date: datetime.date = None,  # inclusive
+    end_date: datetime.date = None,  # inclusive
+    strike_min: float = None,
+    strike_max: float = None,
+    page_size: int = 50,
+    after: tuple = None  # cursor returned with the previous page
+) -> tuple:
+    """
+    Returns (page DataFrame, cursor for the next page or None when this is the last page).
+    """
+    where, args = _filters(model, option_type, start_date, end_date, strike_min, strike_max)
+    if after is not None:
+        where.append("(timestamp < ? OR (timestamp = ? AND id < ?))")
+        args += [after[0], after[0], after[1]]
+
+    sql = f"SELECT {', '.join(HISTORY_COLUMNS)} FROM options_calcs"
+    if where:
+        sql += " WHERE " + " AND ".join(where)
+    sql += " ORDER BY timestamp DESC, id DESC LIMIT ?"
+
+    # fetch one extra row to know whether another page exists
+    rows = get_connection(db_path).execute(sql, args + [page_size + 1]).fetchall()
+    page = pd.DataFrame(rows[:page_size], columns=HISTORY_COLUMNS)
+
+    cursor = None
+    if len(rows) > page_size:
+        last = rows[page_size - 1]
+        cursor = (last[HISTORY_COLUMNS.index("timestamp")], last[HISTORY_COLUMNS.index("id")])
+    return page, cursor
+
+
+"""
+Number of rows matching the same filters as query_runs.
+"""
+def count_runs(
+    db_path: str = "options_calcs.db",
+    model: str = None,
+    option_type: str = None,
+    start_date: datetime.date = None,
+    end_date: datetime.date = None,
+    strike_min: float = None,
+    strike_max: float = None
+) -> int:
+    where, args = _filters(model, option_type, start_date, end_date, strike_min, strike_max)
+    sql = "SELECT COUNT(*) FROM options_calcs"
+    if where:
+        sql += " WHERE " + " AND ".join(where)
+    return get_connection(db_path).execute(sql, args).fetchone()[0]
+
+
+"""
+Helper to build the SQL WHERE clauses and bound arguments for the history filters.
+Dates compare against CURRENT_TIMESTAMP text ('YYYY-MM-DD HH:MM:SS'), end_date covers its whole day.
+"""
+def _filters(model, option_type, start_date, end_date, strike_min, strike_max) -> tuple:
+    where, args = [], []
+    if model is not None:
+        where.append("model = ?")
+        args.append(model)
+    if option_type is not None:
+        where.append("option_type = ?")
+        args.append(option_type)
+    if start_date is not None:
+        where.append("timestamp >= ?")
+        args.append(start_date.strftime("%Y-%m-%d"))
+    if end_date is not None:
+        where.append("timestamp < ?")
+        args.append((end_date + datetime.timedelta(days=1)).strftime("%Y-%m-%d"))
+    if strike_min is not None:
+        where.append("strike_price >= ?")
+        args.append(strike_min)
+    if strike_max is not None:
+        where.append("strike_price <= ?")
+        args.append(strike_max)
+    return where, args
@@ -1,13 +1,56 @@
 from datetime import datetime
+import queue
 import sqlite3
+import threading
+import time
+
+import numpy as np
+
+from utils.enums_option import EXERCISE_STYLE, OPTION_MODEL, OPTION_MODEL_ABBR, PARAMETERS, TREE_METHOD
+
+"""
+Connections are pooled per thread and per db_path (see get_connection) instead of a connect,
+commit and close per call. Every pooled connection runs in WAL mode with synchronous=NORMAL, so
+commits append to the write-ahead log without an fsync each, and readers never block the writer.
+"""
+_thread_connections = threading.local()
+
+
+def get_connection(
+    db_path: str = "options_calcs.db"
+) -> sqlite3.Connection:
+    connections = getattr(_thread_connections, "connections", None)
+    if connections is None:
+        connections = _thread_connections.connections = {}
+
+    conn = connections.get(db_path)
+    if conn is None:
+        conn = sqlite3.connect(db_path)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        connections[db_path] = conn
+    return conn
+
+
+"""
+Close this thread's pooled connections (all of them, or only db_path's).
+"""
+def close_connections(
+    db_path: str = None
+) -> None:
+    connections = getattr(_thread_connections, "connections", {})
+    for path in [db_path] if db_path else list(connections):
+        conn = connections.pop(path, None)
+        if conn is not None:
+            conn.close()
 
-from utils.enums_option import OPTION_MODEL, OPTION_MODEL_ABBR, PARAMETERS
 
 """
 TABLE COLS
 id: auto generated id
 unique_code: composite identifier where key option parameters encoded directly into ID
              [MODEL_ABBR]_[TYPE_ABBR]_[UNDERLYING]_[DTE]_[STRIKE]_[R]_[SIGMA]_[Q]
+             binomial model appends _[STEPS]_[EXERCISE_ABBR]_[TREE_METHOD], trinomial model _[STEPS]_[EXERCISE_ABBR]
 timestamp: Query created at
 model: option model used
 option_type: CALL/ PUT
@@ -16,15 +59,14 @@ strike_price: strike/ exercise price used
 days_to_expiry: expiry window of option used
 volatility: sigma used
 dividend_yield: dividend used. defaults to 0.0
-time_steps: only for binomial model. defaults to NULL
+time_steps: only for binomial/ trinomial model. defaults to NULL
 output_price: model generated premium price of option
 """
 def init_db(
     db_path: str = "options_calcs.db"
 ) -> None:
-    conn = sqlite3.connect(db_path)
-    cur = conn.cursor()
-    cur.execute(
+    conn = get_connection(db_path)
+    conn.execute(
         '''
         CREATE TABLE IF NOT EXISTS options_calcs (
             id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -44,20 +86,23 @@ def init_db(
         '''
     )
 
-    # commit to db and clean up resources
+    # history queries (db_queries) filter/ page on these, timestamp index entries also carry the rowid (id)
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_options_calcs_timestamp ON options_calcs (timestamp)")
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_options_calcs_unique_code ON options_calcs (unique_code)")
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_options_calcs_model_type ON options_calcs (model, option_type)")
     conn.commit()
-    cur.close()
-    conn.close()
 
 
 """
 Helper function to generate unique_code for TABLE 'options_calcs'
+Also the key of utils.pricing_cache, so every input that changes the price must be encoded.
 """
 def generate_unique_code(
     model: str,
     params: dict
 ) -> str:
-    stock_price = params.get(PARAMETERS.STOCK_PRICE.value, "NA")
+    stock_price = params.get(PARAMETERS.STOCK_PRICE.value)
+    stock_price = "NA" if stock_price is None else f"{stock_price:.4f}"
     dte = params.get(PARAMETERS.DAYS_TO_EXPIRY.value, 0)
     strike = int(params.get(PARAMETERS.STRIKE_PRICE.value, 0) * 1000)  # std to thousands
     r = params.get(PARAMETERS.INTEREST_RATE.value, 0)
@@ -69,13 +114,66 @@ def generate_unique_code(
         model = OPTION_MODEL_ABBR.BINOMIAL_MODEL.value
     elif model == OPTION_MODEL.BLACK_SCHOLES_MODEL.value:
         model = OPTION_MODEL_ABBR.BLACK_SCHOLES_MODEL.value
+    elif model == OPTION_MODEL.TRINOMIAL_MODEL.value:
+        model = OPTION_MODEL_ABBR.TRINOMIAL_MODEL.value
     else:
         model = OPTION_MODEL_ABBR.SIMPLE_BINOMIAL_MODEL.value
 
     code = f"{model}_{opt_type}_{stock_price}_{dte}D_{strike}_{r:.4f}_{sigma:.4f}_{q:.4f}"
+    if model in (OPTION_MODEL_ABBR.BINOMIAL_MODEL.value, OPTION_MODEL_ABBR.TRINOMIAL_MODEL.value):
+        steps = params.get(PARAMETERS.TIME_STEPS.value, 100)
+        exercise = "A" if params.get(PARAMETERS.EXERCISE_STYLE.value) == EXERCISE_STYLE.AMERICAN.value else "E"
+        code += f"_{steps}N_{exercise}"
+    if model == OPTION_MODEL_ABBR.BINOMIAL_MODEL.value:
+        tree_method = (params.get(PARAMETERS.TREE_METHOD.value) or TREE_METHOD.CRR.value).replace(" ", "").upper()
+        code += f"_{tree_method}"
     return code
 
 
+INSERT_RUN_SQL = '''
+    INSERT INTO options_calcs
+    (
+        unique_code,
+        model,
+        option_type,
+        stock_price,
+        strike_price,
+        days_to_expiry,
+        interest_rate,
+        volatility,
+        dividend_yield,
+        time_steps,
+        option_price
+    )
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+'''
+
+
+"""
+Helper function to build one 'options_calcs' row (INSERT_RUN_SQL column order) from a model run.
+NumPy scalars (e.g. from batch pricing) are unwrapped since sqlite3 only binds native types.
+"""
+def _run_row(
+    model: str,
+    params: dict,
+    premium_output: float
+) -> tuple:
+    row = (
+        generate_unique_code(model, params),  # generate composite unique_code
+        model,
+        params.get("option_type"),
+        params.get(PARAMETERS.STOCK_PRICE.value),
+        params.get(PARAMETERS.STRIKE_PRICE.value),
+        params.get(PARAMETERS.DAYS_TO_EXPIRY.value),
+        params.get(PARAMETERS.INTEREST_RATE.value),
+        params.get(PARAMETERS.VOLATILITY.value),
+        params.get(PARAMETERS.DIVIDEND_YIELD.value),
+        params.get(PARAMETERS.TIME_STEPS.value),
+        premium_output
+    )
+    return tuple(value.item() if isinstance(value, np.generic) else value for value in row)
+
+
 """
 Helper function for TABLE 'options_calcs' insertion everytime models are queried
 """
@@ -85,44 +183,132 @@ def insert_run_to_db(
     premium_output: float,
     db_path: str = "options_calcs.db"
 ) -> None:
-    conn = sqlite3.connect(db_path)
-    cur = conn.cursor()
+    conn = get_connection(db_path)
+    conn.execute(INSERT_RUN_SQL, _run_row(model, params, premium_output))
+    conn.commit()
 
-    unique_code = generate_unique_code(model, params)  # generate composite unique_code
-    cur.execute(
-        '''
-        INSERT INTO options_calcs
-        (
-            unique_code,
-            model,
-            option_type,
-            stock_price,
-            strike_price,
-            days_to_expiry,
-            interest_rate,
-            volatility,
-            dividend_yield,
-            time_steps,
-            option_price
-        )
-        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-        ''',
-        (
-            unique_code,
-            model,
-            params.get("option_type"),
-            params.get(PARAMETERS.STOCK_PRICE.value),
-            params.get(PARAMETERS.STRIKE_PRICE.value),
-            params.get(PARAMETERS.DAYS_TO_EXPIRY.value),
-            params.get(PARAMETERS.INTEREST_RATE.value),
-            params.get(PARAMETERS.VOLATILITY.value),
-            params.get(PARAMETERS.DIVIDEND_YIELD.value),
-            params.get(PARAMETERS.TIME_STEPS.value),
-            premium_output
+
+"""
+Bulk insertion of many runs (e.g. batch pricing results) in a single executemany transaction.
+runs: list of parameter dicts, or a DataFrame with PARAMETERS/ "option_type" columns (price_batch_frame input)
+"""
+def insert_runs_to_db(
+    model: str,
+    runs,
+    premium_outputs,
+    db_path: str = "options_calcs.db"
+) -> None:
+    if hasattr(runs, "to_dict"):
+        runs = runs.to_dict("records")
+
+    conn = get_connection(db_path)
+    with conn:  # one transaction, rolled back on error
+        conn.executemany(
+            INSERT_RUN_SQL,
+            (_run_row(model, params, premium) for params, premium in zip(runs, premium_outputs))
         )
-    )
 
-    # commit to db and clean up resources
-    conn.commit()
-    cur.close()
-    conn.close()
\ No newline at end of file
+
+"""
+Buffered asynchronous writer for model runs.
+submit() only enqueues the row, a background thread owns its own connection and writes queued rows
+with executemany once batch_size rows are waiting or flush_interval seconds have passed since the
+first unwritten row. flush() blocks until everything submitted so far is committed.
+Once the writer thread has stopped (close(), or an error it cannot recover from, kept in last_error)
+submit() and flush() raise instead of queueing rows nobody writes or waiting forever.
+"""
+# flush() re-checks the writer thread at this interval while waiting
+FLUSH_POLL_SECONDS = 0.1
+
+
+class BufferedRunWriter:
+    _STOP = object()
+
+    def __init__(
+            self,
+            db_path: str = "options_calcs.db",
+            batch_size: int = 1000,
+            flush_interval: float = 1.0  # seconds
+    ):
+        self.db_path = db_path
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.rows_written = 0
+        self.batches_written = 0
+        self.last_error = None
+        self._queue = queue.Queue()
+        self._thread = threading.Thread(target=self._run, name="BufferedRunWriter", daemon=True)
+        self._thread.start()
+
+    def submit(self, model: str, params: dict, premium_output: float) -> None:
+        self._check_alive()
+        self._queue.put(_run_row(model, params, premium_output))
+
+    def submit_many(self, model: str, runs, premium_outputs) -> None:
+        self._check_alive()
+        if hasattr(runs, "to_dict"):
+            runs = runs.to_dict("records")
+        for params, premium in zip(runs, premium_outputs):
+            self._queue.put(_run_row(model, params, premium))
+
+    def flush(self) -> None:
+        self._check_alive()
+        flushed = threading.Event()
+        self._queue.put(flushed)
+        # the writer thread may stop before reaching the request, nothing would set the event then
+        while not flushed.wait(FLUSH_POLL_SECONDS):
+            self._check_alive()
+
+    def close(self) -> None:
+        if self._thread.is_alive():
+            self._queue.put(self._STOP)
+            self._thread.join()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def _check_alive(self) -> None:
+        if not self._thread.is_alive():
+            raise RuntimeError(f"BufferedRunWriter for {self.db_path} is not running") from self.last_error
+
+    def _run(self) -> None:
+        batch = []
+        deadline = None
+        try:
+            conn = get_connection(self.db_path)
+            while True:
+                timeout = None if deadline is None else max(0.0, deadline - time.monotonic())
+                try:
+                    item = self._queue.get(timeout=timeout)
+                except queue.Empty:
+                    item = None
+
+                if isinstance(item, tuple):
+                    batch.append(item)
+                    deadline = deadline or time.monotonic() + self.flush_interval
+                    if len(batch) < self.batch_size:
+                        continue
+
+                # batch full, deadline passed, flush requested or stopping
+                if batch:
+                    try:
+                        with conn:
+                            conn.executemany(INSERT_RUN_SQL, batch)
+                        self.rows_written += len(batch)
+                        self.batches_written += 1
+                    except sqlite3.Error as error:  # keep the writer alive, failed batch is dropped
+                        self.last_error = error
+                    batch = []
+                deadline = None
+
+                if isinstance(item, threading.Event):
+                    item.set()
+                elif item is self._STOP:
+                    break
+        except Exception as error:  # writer stops, submit()/ flush() raise from here on
+            self.last_error = error
+        finally:
+            close_connections(self.db_path)
@@ -0,0 +1,179 @@
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+from .binomial_model import BinomialModel
+from .black_scholes_model import BlackScholesModel
+from .simple_binomial_model import SimpleBinomialModel
+from .trinomial_model import TrinomialModel
+from utils.enums_option import EXERCISE_STYLE, OPTION_MODEL, OPTION_TYPE, PARAMETERS, TREE_METHOD
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+"""
+Batch pricing entry point shared by every model.
+Prices whole arrays of contracts in one vectorized call instead of constructing a model per contract.
+
+All contract inputs (S, X, T, r, sigma, q, option_type) broadcast against each other, so a scalar
+strike with an array of stock prices, or a full chain of per-contract arrays, are both valid.
+T is in days to expiry to match the single contract models.
+"""
+MODELS = {
+    OPTION_MODEL.BLACK_SCHOLES_MODEL.value: BlackScholesModel,
+    OPTION_MODEL.BINOMIAL_MODEL.value: BinomialModel,
+    OPTION_MODEL.SIMPLE_BINOMIAL_MODEL.value: SimpleBinomialModel,
+    OPTION_MODEL.TRINOMIAL_MODEL.value: TrinomialModel,
+}
+
+# Models inducting a tree of time_steps steps, american exercise only available for these
+TREE_MODELS = (OPTION_MODEL.BINOMIAL_MODEL.value, OPTION_MODEL.TRINOMIAL_MODEL.value)
+
+# Tree batches hold (contracts x leaf nodes) floats, chunk contracts to bound memory (~16MB)
+MAX_TREE_NODES = 2_000_000
+
+# DataFrame column holding the option type, same key used by db_utils for inserts
+OPTION_TYPE_COLUMN = "option_type"
+
+
+def price_batch(
+        option_model: str,  # OPTION_MODEL value
+        option_type,  # OPTION_TYPE value or array of them
+        S,  # stock_price(s)
+        X,  # strike_price(s)
+        T,  # days_to_expiry
+        r,  # interest_rate(s)
+        sigma,  # volatility(ies)
+        q=0.0,  # dividend_yield(s)
+        N: int = 100,  # time_steps, shared by every contract in tree model batches
+        exercise_style: str = EXERCISE_STYLE.EUROPEAN.value,  # american only supported by tree models
+        tree_method: str = TREE_METHOD.CRR.value,  # binomial model only
+) -> np.ndarray:
+    if option_model not in MODELS:
+        raise ValueError(f"Unsupported option model: {option_model}")
+    if exercise_style == EXERCISE_STYLE.AMERICAN.value and option_model not in TREE_MODELS:
+        raise ValueError(f"American exercise is not supported by {option_model}")
+
+    shape, (option_type, S, X, T, r, sigma, q) = _broadcast_contracts(option_type, S, X, T, r, sigma, q)
+
+    prices = np.empty(S.size)
+    for contract_type in (OPTION_TYPE.CALL.value, OPTION_TYPE.PUT.value):
+        idx = np.flatnonzero(option_type == contract_type)
+        if idx.size == 0:
+            continue
+
+        if option_model in TREE_MODELS:
+            # tree nodes live on the last axis, contracts are columns of shape (M, 1)
+            leaves = 2 * int(N) + 1 if option_model == OPTION_MODEL.TRINOMIAL_MODEL.value else int(N) + 1
+            chunk = max(1, MAX_TREE_NODES // leaves)
+            for start in range(0, idx.size, chunk):
+                rows = idx[start:start+chunk]
+                params = _parameters(S, X, T, r, sigma, q, rows, column=True)
+                params[PARAMETERS.TIME_STEPS.value] = int(N)
+                params[PARAMETERS.EXERCISE_STYLE.value] = exercise_style
+                params[PARAMETERS.TREE_METHOD.value] = tree_method
+                prices[rows] = MODELS[option_model](contract_type, params).calculate_price()
+        else:
+            params = _parameters(S, X, T, r, sigma, q, idx)
+            prices[idx] = MODELS[option_model](contract_type, params).calculate_price()
+
+    return prices.reshape(shape)
+
+
+def greeks_batch(
+        option_type,  # OPTION_TYPE value or array of them
+        S,
+        X,
+        T,  # days_to_expiry
+        r,
+        sigma,
+        q=0.0,
+        higher_order: bool = False,  # include vanna and volga
+) -> dict:
+    """
+    Black-Scholes price and Greeks for arrays of contracts, see BlackScholesModel.calculate_greeks.
+    Returns dict of arrays shaped like the broadcast inputs.
+    """
+    shape, (option_type, S, X, T, r, sigma, q) = _broadcast_contracts(option_type, S, X, T, r, sigma, q)
+
+    greeks = {}
+    for contract_type in (OPTION_TYPE.CALL.value, OPTION_TYPE.PUT.value):
+        idx = np.flatnonzero(option_type == contract_type)
+        if idx.size == 0:
+            continue
+
+        params = _parameters(S, X, T, r, sigma, q, idx)
+        for key, values in BlackScholesModel(contract_type, params).calculate_greeks(higher_order).items():
+            greeks.setdefault(key, np.empty(S.size))[idx] = values
+
+    return {key: values.reshape(shape) for key, values in greeks.items()}
+
+
+def price_batch_frame(
+        option_model: str,
+        contracts: "pd.DataFrame",  # columns named by PARAMETERS values plus "option_type"
+        N: int = 100,
+        exercise_style: str = EXERCISE_STYLE.EUROPEAN.value,
+        tree_method: str = TREE_METHOD.CRR.value,
+) -> np.ndarray:
+    """
+    Price every row of a DataFrame of contracts.
+    Missing dividend_yield defaults to 0.0, time_steps (tree models) must be shared by all rows.
+    """
+    if PARAMETERS.TIME_STEPS.value in contracts:
+        steps = contracts[PARAMETERS.TIME_STEPS.value].unique()
+        if len(steps) != 1:
+            raise ValueError("Tree model batches require a single time_steps value for all contracts.")
+        N = int(steps[0])
+
+    # simple binomial has no expiry, allow the column to be left out for it
+    T = contracts[PARAMETERS.DAYS_TO_EXPIRY.value].to_numpy() if PARAMETERS.DAYS_TO_EXPIRY.value in contracts else np.nan
+    q = contracts[PARAMETERS.DIVIDEND_YIELD.value].to_numpy() if PARAMETERS.DIVIDEND_YIELD.value in contracts else 0.0
+
+    return price_batch(
+        option_model,
+        contracts[OPTION_TYPE_COLUMN].to_numpy(),
+        contracts[PARAMETERS.STOCK_PRICE.value].to_numpy(),
+        contracts[PARAMETERS.STRIKE_PRICE.value].to_numpy(),
+        T,
+        contracts[PARAMETERS.INTEREST_RATE.value].to_numpy(),
+        contracts[PARAMETERS.VOLATILITY.value].to_numpy(),
+        q,
+        N=N,
+        exercise_style=exercise_style,
+        tree_method=tree_method,
+    )
+
+
+"""
+Helper to broadcast contract inputs against each other and flatten them.
+Returns the broadcast shape (to reshape outputs) and the flat arrays, option_type first.
+"""
+def _broadcast_contracts(option_type, *numeric_args) -> tuple:
+    arrays = np.broadcast_arrays(np.asarray(option_type), *(np.asarray(arg, dtype=float) for arg in numeric_args))
+    shape = arrays[0].shape
+    option_type, *numeric_args = (arr.ravel() for arr in arrays)
+
+    unknown_types = ~np.isin(option_type, [OPTION_TYPE.CALL.value, OPTION_TYPE.PUT.value])
+    if unknown_types.any():
+        raise ValueError(f"Unsupported option type: {option_type[unknown_types][0]}")
+
+    return shape, (option_type, *numeric_args)
+
+
+"""
+Helper to build a model parameter dict from the selected contracts of flattened input arrays.
+column=True reshapes to (M, 1) so binomial trees broadcast along their node axis.
+"""
+def _parameters(S, X, T, r, sigma, q, idx, column=False) -> dict:
+    def take(arr):
+        return arr[idx][:, None] if column else arr[idx]
+
+    return {
+        PARAMETERS.STOCK_PRICE.value: take(S),
+        PARAMETERS.STRIKE_PRICE.value: take(X),
+        PARAMETERS.DAYS_TO_EXPIRY.value: take(T),
+        PARAMETERS.INTEREST_RATE.value: take(r),
+        PARAMETERS.VOLATILITY.value: take(sigma),
+        PARAMETERS.DIVIDEND_YIELD.value: take(q),
+    }
@@ -1,8 +1,8 @@
 import numpy as np
-from scipy.stats import norm
 
 from .base_option import OptionValuationModel
-from utils.enums_option import PARAMETERS
+from .black_scholes_model import BlackScholesModel
+from utils.enums_option import EXERCISE_STYLE, OPTION_TYPE, PARAMETERS, TREE_METHOD
 
 class BinomialModel(OptionValuationModel):
     def __init__(self, option_type, parameters):
@@ -17,6 +17,12 @@ class BinomialModel(OptionValuationModel):
                 5. volatility - Annualized volatility of stock in decimal (risk neutral probability)
                 6. dividend_yeild - Stock dividend yield
                 7. time_steps - Number of binomial steps, default 100
+                8. exercise_style - EXERCISE_STYLE value, default european
+                9. tree_method - TREE_METHOD value, default crr
+                    - leisen reimer needs an odd number of steps, even time_steps are rounded up by one
+                    - bbsr prices a second tree with time_steps // 2 for the Richardson extrapolation
+            Parameters 1-6 may also be NumPy column arrays of shape (M, 1) to price M contracts
+            in one batched tree (time_steps stays a shared int), see option_valuation.batch_pricing.
         """
         super().__init__(option_type, parameters)
         self.S = self.parameters[PARAMETERS.STOCK_PRICE.value]
@@ -26,56 +32,216 @@ class BinomialModel(OptionValuationModel):
         self.sigma = self.parameters[PARAMETERS.VOLATILITY.value]
         self.q = self.parameters.get(PARAMETERS.DIVIDEND_YIELD.value, 0.0)
         self.N = self.parameters.get(PARAMETERS.TIME_STEPS.value, 100)
+        self.exercise_style = self.parameters.get(PARAMETERS.EXERCISE_STYLE.value, EXERCISE_STYLE.EUROPEAN.value)
+        self.tree_method = self.parameters.get(PARAMETERS.TREE_METHOD.value, TREE_METHOD.CRR.value)
 
-        self.delta_t = self.T/ self.N
+        if self.tree_method == TREE_METHOD.LEISEN_REIMER.value and self.N % 2 == 0:
+            self.N += 1
 
-        # Up, down factors
-        self.u = np.exp(self.sigma * np.sqrt(self.delta_t))
-        self.d = np.exp(-self.sigma * np.sqrt(self.delta_t))
+        self.delta_t = self.T/ self.N
 
-        # risk neutral probability
-        self.p = (np.exp((self.r - self.q) * self.delta_t) - self.d) / (self.u - self.d)
+        # Up, down factors and risk neutral probability
+        self.u, self.d, self.p = self._tree_factors()
 
     def calculate_call_price(self):
-        # Initializing option values
-        asset_prices = np.zeros(self.N + 1)  # payout
-        option_values = np.zeros(self.N + 1)  # profit
+        return self._extrapolate(self._backward_induction(self._call_payoff)[0])
+    
+    def calculate_put_price(self):
+        return self._extrapolate(self._backward_induction(self._put_payoff)[0])
+
+    def calculate_price_curve(self) -> np.ndarray:
+        """
+            European prices for a 1-D array of spot values held in stock_price, from one tree.
+            When u, d, p do not depend on the spot, every spot shares the same terminal distribution:
+                V(S) = e^(-r*N*delta_t) * sum_j Binom(j; N, p) * payoff(S * u^j * d^(N-j))
+            so the whole curve is one (spots x leaves) payoff matrix times the leaf weights, O(M*N)
+            instead of M separate O(N^2) inductions. bbs/ bbsr use the same identity one step early.
+            American exercise and leisen reimer (factors depend on the spot through d1) fall back
+            to one batched tree across all spot values.
+        """
+        stock_prices = np.asarray(self.S, dtype=float)
+        single_tree = (
+            self.exercise_style != EXERCISE_STYLE.AMERICAN.value and
+            self.tree_method != TREE_METHOD.LEISEN_REIMER.value and
+            0 <= self.p <= 1
+        )
+        if not single_tree:
+            batched = BinomialModel(self.option_type, {**self.parameters, PARAMETERS.STOCK_PRICE.value: stock_prices[:, None]})
+            return batched.calculate_price()
+
+        smoothed = self.tree_method in (TREE_METHOD.BBS.value, TREE_METHOD.BBSR.value)
+        steps = self.N - 1 if smoothed else self.N
+        up_moves = np.arange(steps + 1)
+        node_prices = stock_prices[:, None] * np.exp(up_moves * np.log(self.u) + (steps - up_moves) * np.log(self.d))
+
+        if smoothed:
+            node_values = self._black_scholes_step_values(node_prices)
+        elif self.option_type == OPTION_TYPE.CALL.value:
+            node_values = self._call_payoff(node_prices)
+        else:
+            node_values = self._put_payoff(node_prices)
+
+        from scipy.stats import binom
 
-        # Calculating asset prices at terminal states (leaf nodes)
-        for i in range(self.N+1):
-            asset_prices[i] = self.S * (self.u ** i) * (self.d ** (self.N - i))
-            option_values[i] = max(0, asset_prices[i] - self.X)
+        weights = binom.pmf(up_moves, steps, self.p) * np.exp(-self.r * self.delta_t * steps)
+        curve = node_values @ weights
 
-        # Backwards induction to calculate current option value
+        if self.tree_method == TREE_METHOD.BBSR.value:
+            half_tree = BinomialModel(
+                self.option_type,
+                {**self.parameters, PARAMETERS.TIME_STEPS.value: max(self.N // 2, 1), PARAMETERS.TREE_METHOD.value: TREE_METHOD.BBS.value}
+            )
+            curve = 2 * curve - half_tree.calculate_price_curve()
+        return curve
+
+    def calculate_price_and_boundary(self) -> tuple:
         """
-        Backwards induction value = e^(-r(delta_t))*[p * V_up + (1-p)*V_down]
-        Start from terminal nodes, move backward step by step to calc option vals at earlier nodes
-            - since upper factor accounted first then d earlier, leaf nodes are in order of 0 upper to all upper from i=0 to i=-1
+            American price together with the early-exercise boundary from the same tree.
+            Boundary[k] is the critical stock price at time step k (time k * delta_t): the highest
+            exercised node for puts, the lowest for calls, NaN where no node is exercised.
+            Returns (price, boundary), boundary has N+1 entries on its last axis.
         """
-        for step in range(self.N-1, -1, -1):
-            for i in range(step+1):  # each step of the way
-                option_values[i] = np.exp(-self.r * self.delta_t) * (self.p * option_values[i+1] + (1-self.p) * option_values[i])
+        if self.exercise_style != EXERCISE_STYLE.AMERICAN.value:
+            raise ValueError("Early-exercise boundary only exists for American exercise.")
 
-        return option_values[0]
-    
-    def calculate_put_price(self):
-        # Initializing option values
-        asset_prices = np.zeros(self.N + 1)  # payout
-        option_values = np.zeros(self.N + 1)  # profit
+        if self.option_type == OPTION_TYPE.CALL.value:
+            price, boundary = self._backward_induction(self._call_payoff, record_boundary=True)
+        elif self.option_type == OPTION_TYPE.PUT.value:
+            price, boundary = self._backward_induction(self._put_payoff, record_boundary=True)
+        return self._extrapolate(price), boundary
+
+    def _tree_factors(self) -> tuple:
+        """
+            Up factor, down factor and risk neutral probability for the selected tree method.
+                - crr/ bbs/ bbsr: u = e^(sigma*sqrt(dt)), d = 1/u
+                - tian: matches the first three moments of the lognormal step
+                - leisen reimer: Peizer-Pratt inversion of d1, d2 so the tree centres on the strike,
+                  converging smoothly at O(1/N^2) for European options
+        """
+        growth = np.exp((self.r - self.q) * self.delta_t)
+
+        if self.tree_method == TREE_METHOD.TIAN.value:
+            v = np.exp(self.sigma**2 * self.delta_t)
+            spread = np.sqrt(v**2 + 2*v - 3)
+            u = 0.5 * growth * v * (v + 1 + spread)
+            d = 0.5 * growth * v * (v + 1 - spread)
+        elif self.tree_method == TREE_METHOD.LEISEN_REIMER.value:
+            d1, d2 = BlackScholesModel(self.option_type, self.parameters)._calculate_d1_d2()
+            p = self._peizer_pratt(d2)
+            u = growth * self._peizer_pratt(d1) / p
+            d = (growth - p * u) / (1 - p)
+            return u, d, p
+        elif self.tree_method in (TREE_METHOD.CRR.value, TREE_METHOD.BBS.value, TREE_METHOD.BBSR.value):
+            u = np.exp(self.sigma * np.sqrt(self.delta_t))
+            d = np.exp(-self.sigma * np.sqrt(self.delta_t))
+        else:
+            raise ValueError(f"Unsupported tree method: {self.tree_method}")
+
+        return u, d, (growth - d) / (u - d)
 
-        # Calculating asset prices at terminal states (leaf nodes)
-        for i in range(self.N+1):
-            asset_prices[i] = self.S * (self.u ** i) * (self.d ** (self.N - i))
-            option_values[i] = max(0, self.X-asset_prices[i])
+    def _peizer_pratt(self, z):
+        """
+            Peizer-Pratt method 2 inversion of the normal cdf for a tree of N (odd) steps.
+        """
+        exponent = -(z / (self.N + 1/3 + 0.1 / (self.N + 1)))**2 * (self.N + 1/6)
+        return 0.5 + np.sign(z) * 0.5 * np.sqrt(1 - np.exp(exponent))
 
-        # Backwards induction to calculate current option value
+    def _extrapolate(self, price):
         """
-        Backwards induction value = e^(-r(delta_t))*[p * V_up + (1-p)*V_down]
-        Start from terminal nodes, move backward step by step to calc option vals at earlier nodes
-            - since upper factor accounted first then d earlier, leaf nodes are in order of 0 upper to all upper from i=0 to i=-1
+            Two-point Richardson extrapolation for bbsr: 2 * P(N) - P(N/2), cancelling the
+            O(1/N) error term left once Black-Scholes smoothing has removed the oscillation.
         """
-        for step in range(self.N-1, -1, -1):
-            for i in range(step+1):  # each step of the way
-                option_values[i] = np.exp(-self.r * self.delta_t) * (self.p * option_values[i+1] + (1-self.p) * option_values[i])
+        if self.tree_method != TREE_METHOD.BBSR.value:
+            return price
 
-        return option_values[0]
\ No newline at end of file
+        half_tree = BinomialModel(
+            self.option_type,
+            {**self.parameters, PARAMETERS.TIME_STEPS.value: max(self.N // 2, 1), PARAMETERS.TREE_METHOD.value: TREE_METHOD.BBS.value}
+        )
+        return 2 * price - half_tree.calculate_price()
+
+    def _call_payoff(self, asset_prices: np.ndarray) -> np.ndarray:
+        return np.maximum(asset_prices - self.X, 0.0)
+
+    def _put_payoff(self, asset_prices: np.ndarray) -> np.ndarray:
+        return np.maximum(self.X - asset_prices, 0.0)
+
+    def _terminal_asset_prices(self, steps: int) -> np.ndarray:
+        """
+            Asset prices at the steps+1 nodes (last axis) of a time step, ordered from 0 up moves to all up moves.
+            S * u^i * d^(steps-i) is built from a single exponent vector (in log space) so
+            large N does not overflow u^N before the d^(N-i) term brings it back down.
+        """
+        up_moves = np.arange(steps + 1)
+        return self.S * np.exp(up_moves * np.log(self.u) + (steps - up_moves) * np.log(self.d))
+
+    def _backward_induction(self, payoff, record_boundary: bool = False) -> tuple:
+        """
+            Backwards induction value = e^(-r(delta_t))*[p * V_up + (1-p)*V_down]
+            Start from terminal nodes, move backward step by step to calc option vals at earlier nodes
+                - since upper factor accounted first then d earlier, leaf nodes are in order of 0 upper to all upper from i=0 to i=-1
+                - each step is a single sliced vector op over the (step+1) live nodes, written in place
+                - nodes live on the last axis so a batch of trees (M, N+1) is inducted in the same ops
+            American exercise takes max(continuation, payoff) at every node. Node j at a step is
+            S * u^j * d^(step-j), i.e. the same node one step later divided by d, so the asset
+            prices are rolled back in place alongside the option values.
+            Returns (price, boundary), boundary is None unless record_boundary.
+            bbs/ bbsr start one step early from Black-Scholes values over the last delta_t.
+        """
+        smoothed = self.tree_method in (TREE_METHOD.BBS.value, TREE_METHOD.BBSR.value)
+        last_step = self.N - 1 if smoothed else self.N
+        american = self.exercise_style == EXERCISE_STYLE.AMERICAN.value
+
+        asset_prices = self._terminal_asset_prices(last_step)
+        exercise_values = payoff(asset_prices)
+        if smoothed:
+            option_values = self._black_scholes_step_values(asset_prices)
+            if american:
+                option_values = np.maximum(option_values, exercise_values)
+        else:
+            option_values = exercise_values
+
+        boundary = None
+        if record_boundary:
+            boundary = np.full(option_values.shape[:-1] + (self.N + 1,), np.nan)
+            if smoothed:
+                # expiry boundary is the strike itself, exercise whenever in the money
+                boundary[..., self.N] = self.X if np.ndim(self.X) == 0 else self.X[..., 0]
+            exercised = (exercise_values > 0) & (exercise_values >= option_values)
+            boundary[..., last_step] = self._critical_price(asset_prices, exercised)
+
+        discount = np.exp(-self.r * self.delta_t)
+        for step in range(last_step-1, -1, -1):
+            option_values[..., :step+1] = discount * (self.p * option_values[..., 1:step+2] + (1-self.p) * option_values[..., :step+1])
+
+            if american:
+                asset_prices[..., :step+1] /= self.d
+                exercise_values = payoff(asset_prices[..., :step+1])
+                if record_boundary:
+                    exercised = (exercise_values > 0) & (exercise_values >= option_values[..., :step+1])
+                    boundary[..., step] = self._critical_price(asset_prices[..., :step+1], exercised)
+                np.maximum(option_values[..., :step+1], exercise_values, out=option_values[..., :step+1])
+
+        # [()] unwraps the 0-d result of a single tree back to a scalar, batches stay (M,)
+        return option_values[..., 0][()], boundary
+
+    def _black_scholes_step_values(self, asset_prices: np.ndarray) -> np.ndarray:
+        """
+            European Black-Scholes values with one time step (delta_t) left to expiry at each node.
+        """
+        params = {
+            **self.parameters,
+            PARAMETERS.STOCK_PRICE.value: asset_prices,
+            PARAMETERS.DAYS_TO_EXPIRY.value: self.delta_t * 365,
+        }
+        return BlackScholesModel(self.option_type, params).calculate_price()
+
+    def _critical_price(self, asset_prices: np.ndarray, exercised: np.ndarray) -> np.ndarray:
+        """
+            Exercise boundary at one time step: highest exercised node for puts, lowest for calls.
+        """
+        if self.option_type == OPTION_TYPE.PUT.value:
+            critical = np.max(asset_prices, axis=-1, where=exercised, initial=-np.inf)
+        else:
+            critical = np.min(asset_prices, axis=-1, where=exercised, initial=np.inf)
+        return np.where(np.isfinite(critical), critical, np.nan)
@@ -1,8 +1,8 @@
 import numpy as np
-from scipy.stats import norm
 
 from .base_option import OptionValuationModel
-from utils.enums_option import PARAMETERS
+from utils.enums_option import GREEKS, OPTION_TYPE, PARAMETERS
+from utils.normal_distribution import norm_cdf, norm_pdf
 
 class BlackScholesModel(OptionValuationModel):
     def __init__(self, option_type, parameters, dividend_yield=0.0):
@@ -15,6 +15,7 @@ class BlackScholesModel(OptionValuationModel):
                 4. interest_rate - Risk free interest rate
                 5. volatility - Volatility of stock
                 6. dividend_yeild - Stock dividend yield 
+            Parameters may also be NumPy arrays to price many contracts at once.
         """
         super().__init__(option_type, parameters)
         self.S = self.parameters[PARAMETERS.STOCK_PRICE.value]
@@ -29,13 +30,59 @@ class BlackScholesModel(OptionValuationModel):
         self.d1, self.d2 = self._calculate_d1_d2()
 
     def calculate_call_price(self):
-        price = self.S * np.exp(-self.q * self.T) * norm.cdf(self.d1) - self.X * np.exp(-self.r * self.T) * norm.cdf(self.d2)
+        price = self.S * np.exp(-self.q * self.T) * norm_cdf(self.d1) - self.X * np.exp(-self.r * self.T) * norm_cdf(self.d2)
         return price
     
     def calculate_put_price(self):
-        price = self.X * np.exp(-self.r * self.T) * norm.cdf(-self.d2) - self.S * np.exp(-self.q * self.T) * norm.cdf(-self.d1)
+        price = self.X * np.exp(-self.r * self.T) * norm_cdf(-self.d2) - self.S * np.exp(-self.q * self.T) * norm_cdf(-self.d1)
         return price
     
+    def calculate_greeks(self, higher_order: bool = False) -> dict:
+        """
+            Closed-form price and Greeks in a single pass.
+            d1/d2, discount factors, N(d) and n(d1) are computed once and shared by every Greek,
+            and only the cdf terms needed by this option type are evaluated.
+            Units: vega/ vanna/ volga per 1.00 volatility, theta per year, rho per 1.00 rate.
+            Returns dict of "price" plus GREEKS values (vanna, volga only when higher_order=True).
+        """
+        sqrt_T = np.sqrt(self.T)
+        div_discount = np.exp(-self.q * self.T)
+        rate_discount = np.exp(-self.r * self.T)
+        pdf_d1 = norm_pdf(self.d1)
+
+        gamma = div_discount * pdf_d1 / (self.S * self.sigma * sqrt_T)
+        vega = self.S * div_discount * pdf_d1 * sqrt_T
+        theta_decay = -self.S * div_discount * pdf_d1 * self.sigma / (2 * sqrt_T)
+
+        if self.option_type == OPTION_TYPE.CALL.value:
+            cdf_d1 = norm_cdf(self.d1)
+            cdf_d2 = norm_cdf(self.d2)
+            price = self.S * div_discount * cdf_d1 - self.X * rate_discount * cdf_d2
+            delta = div_discount * cdf_d1
+            theta = theta_decay - self.r * self.X * rate_discount * cdf_d2 + self.q * self.S * div_discount * cdf_d1
+            rho = self.X * self.T * rate_discount * cdf_d2
+        else:
+            cdf_neg_d1 = norm_cdf(-self.d1)
+            cdf_neg_d2 = norm_cdf(-self.d2)
+            price = self.X * rate_discount * cdf_neg_d2 - self.S * div_discount * cdf_neg_d1
+            delta = -div_discount * cdf_neg_d1
+            theta = theta_decay + self.r * self.X * rate_discount * cdf_neg_d2 - self.q * self.S * div_discount * cdf_neg_d1
+            rho = -self.X * self.T * rate_discount * cdf_neg_d2
+
+        greeks = {
+            "price": price,
+            GREEKS.DELTA.value: delta,
+            GREEKS.GAMMA.value: gamma,
+            GREEKS.VEGA.value: vega,
+            GREEKS.THETA.value: theta,
+            GREEKS.RHO.value: rho,
+        }
+        if higher_order:
+            greeks[GREEKS.VANNA.value] = -div_discount * pdf_d1 * self.d2 / self.sigma
+            greeks[GREEKS.VOLGA.value] = vega * self.d1 * self.d2 / self.sigma
+
+        return greeks
+
     def _calculate_d1_d2(self):
         d1 = (np.log(self.S/self.X) + (self.r - self.q + (0.5 * self.sigma**2)) * self.T)/ (self.sigma * np.sqrt(self.T))
         d2 = d1 - self.sigma * np.sqrt(self.T)
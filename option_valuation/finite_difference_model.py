@@ -0,0 +1,209 @@
+import numpy as np
+
+from .base_option import OptionValuationModel
+from utils.enums_option import EXERCISE_STYLE, OPTION_TYPE, PARAMETERS
+
+# Grid half width in standard deviations of log price at expiry, beyond the spot/ strike range
+GRID_STDEVS = 5
+
+class FiniteDifferenceModel(OptionValuationModel):
+    def __init__(self, option_type, parameters):
+        """
+            Initialize parameters used to calculate call and put prices.
+            Crank-Nicolson finite differences on the Black-Scholes PDE in log price x = ln(S),
+                V_tau = 0.5 sigma^2 V_xx + (r - q - 0.5 sigma^2) V_x - r V
+            stepped from expiry (tau = 0) back to today on a uniform grid of price_steps intervals.
+            The first step is replaced by two implicit Euler half steps (Rannacher) to damp the
+            oscillations Crank-Nicolson produces from the payoff kink.
+            Every step is one tridiagonal solve, so the grid costs O(time_steps * price_steps).
+            Parameters:
+                1. stock_price - Underlying stock price, or a 1-D array of spot values priced from one solve
+                2. strike_price - Strike/ Exercise price
+                3. days_to_expiry - Days to expiry
+                4. interest_rate - Risk free interest rate
+                5. volatility - Annualized volatility of stock in decimal
+                6. dividend_yeild - Stock dividend yield
+                7. time_steps - Number of time steps, default 200
+                8. price_steps - Number of log price intervals, default 200
+                9. exercise_style - EXERCISE_STYLE value, default european
+        """
+        super().__init__(option_type, parameters)
+        self.S = self.parameters[PARAMETERS.STOCK_PRICE.value]
+        self.X = self.parameters[PARAMETERS.STRIKE_PRICE.value]
+        self.T = self.parameters[PARAMETERS.DAYS_TO_EXPIRY.value] / 365
+        self.r = self.parameters[PARAMETERS.INTEREST_RATE.value]
+        self.sigma = self.parameters[PARAMETERS.VOLATILITY.value]
+        self.q = self.parameters.get(PARAMETERS.DIVIDEND_YIELD.value, 0.0)
+        self.N = int(self.parameters.get(PARAMETERS.TIME_STEPS.value, 200))
+        self.M = int(self.parameters.get(PARAMETERS.PRICE_STEPS.value, 200))
+        self.exercise_style = self.parameters.get(PARAMETERS.EXERCISE_STYLE.value, EXERCISE_STYLE.EUROPEAN.value)
+
+        if self.N < 1 or self.M < 3:
+            raise ValueError("Finite difference grid needs at least 1 time step and 3 price steps.")
+
+        self.delta_t = self.T / self.N
+        self.log_prices = self._log_price_grid()
+        self.delta_x = self.log_prices[1] - self.log_prices[0]
+
+    def calculate_call_price(self):
+        return self._interpolate(self._solve(self._call_payoff))
+
+    def calculate_put_price(self):
+        return self._interpolate(self._solve(self._put_payoff))
+
+    def calculate_price_grid(self) -> tuple:
+        """
+            Returns (asset prices, option values) across the whole grid row for today.
+        """
+        payoff = self._call_payoff if self.option_type == OPTION_TYPE.CALL.value else self._put_payoff
+        return np.exp(self.log_prices), self._solve(payoff)
+
+    def _call_payoff(self, asset_prices: np.ndarray) -> np.ndarray:
+        return np.maximum(asset_prices - self.X, 0.0)
+
+    def _put_payoff(self, asset_prices: np.ndarray) -> np.ndarray:
+        return np.maximum(self.X - asset_prices, 0.0)
+
+    def _log_price_grid(self) -> np.ndarray:
+        """
+            Uniform log price grid covering every spot and the strike with GRID_STDEVS of room either side.
+            A single spot sits exactly on a node so it needs no interpolation.
+        """
+        log_spots = np.log(np.atleast_1d(np.asarray(self.S, dtype=float)))
+        width = GRID_STDEVS * self.sigma * np.sqrt(self.T)
+        low = min(log_spots.min(), np.log(self.X)) - width
+        high = max(log_spots.max(), np.log(self.X)) + width
+
+        delta_x = (high - low) / self.M
+        anchor = log_spots.min()
+        low = anchor - np.ceil((anchor - low) / delta_x) * delta_x
+        return low + delta_x * np.arange(self.M + 1)
+
+    def _interpolate(self, option_values: np.ndarray):
+        # [()] unwraps a single spot back to a scalar
+        return np.interp(np.log(self.S), self.log_prices, option_values)[()]
+
+    def _operator(self, delta_t: float, theta: float) -> tuple:
+        """
+            Scalar sub/ main/ super diagonal of the implicit matrix I - theta*delta_t*L and of the explicit
+            operator I + (1 - theta)*delta_t*L for the theta scheme (0.5 Crank-Nicolson, 1 implicit Euler).
+        """
+        diffusion = 0.5 * self.sigma**2 / self.delta_x**2
+        drift = (self.r - self.q - 0.5 * self.sigma**2) / (2 * self.delta_x)
+        L = (diffusion - drift, -2 * diffusion - self.r, diffusion + drift)
+
+        implicit = tuple(-theta * delta_t * coef for coef in L)
+        explicit = tuple((1 - theta) * delta_t * coef for coef in L)
+        return (implicit[0], 1 + implicit[1], implicit[2]), (explicit[0], 1 + explicit[1], explicit[2])
+
+    def _boundaries(self, call: bool, payoff, asset_prices: np.ndarray, tau: float) -> np.ndarray:
+        """
+            Option values at the lowest and highest grid price tau years before expiry: discounted
+            intrinsic (forward) value, floored at the payoff for american exercise.
+        """
+        edges = asset_prices[[0, -1]]
+        if call:
+            values = np.maximum(edges * np.exp(-self.q * tau) - self.X * np.exp(-self.r * tau), 0.0)
+        else:
+            values = np.maximum(self.X * np.exp(-self.r * tau) - edges * np.exp(-self.q * tau), 0.0)
+        if self.exercise_style == EXERCISE_STYLE.AMERICAN.value:
+            values = np.maximum(values, payoff(edges))
+        return values
+
+    def _solve(self, payoff) -> np.ndarray:
+        """
+            Step the grid from expiry back to today. Each step builds the explicit right hand side on the
+            interior nodes, adds the implicit boundary terms and solves the tridiagonal system:
+                - european: one LAPACK tridiagonal solve with the LU factor of the step's matrix
+                - american: Brennan-Schwartz projected solve (_projected_solve)
+        """
+        from scipy.linalg.lapack import dgttrf, dgttrs
+
+        american = self.exercise_style == EXERCISE_STYLE.AMERICAN.value
+        call = payoff == self._call_payoff
+        asset_prices = np.exp(self.log_prices)
+        exercise_values = payoff(asset_prices[1:-1])
+        option_values = payoff(asset_prices)
+
+        # Rannacher start: two implicit Euler half steps, then Crank-Nicolson
+        schedule = [(self.delta_t / 2, 1.0)] * 2 + [(self.delta_t, 0.5)] * (self.N - 1)
+        operators = {}
+        tau = 0.0
+        for delta_t, theta in schedule:
+            if (delta_t, theta) not in operators:
+                implicit, explicit = self._operator(delta_t, theta)
+                if american:
+                    # calls exercise at the top of the grid, their projected solve runs on the reversed system
+                    system = implicit[::-1] if call else implicit
+                    operators[(delta_t, theta)] = (implicit, explicit, _ul_factor(*system, self.M - 1))
+                else:
+                    m = self.M - 1
+                    lu = dgttrf(np.full(m - 1, implicit[0]), np.full(m, implicit[1]), np.full(m - 1, implicit[2]))[:-1]
+                    operators[(delta_t, theta)] = (implicit, explicit, lu)
+            implicit, explicit, factor = operators[(delta_t, theta)]
+            tau += delta_t
+
+            rhs = explicit[0] * option_values[:-2] + explicit[1] * option_values[1:-1] + explicit[2] * option_values[2:]
+            option_values[[0, -1]] = self._boundaries(call, payoff, asset_prices, tau)
+            rhs[0] -= implicit[0] * option_values[0]
+            rhs[-1] -= implicit[2] * option_values[-1]
+
+            if not american:
+                option_values[1:-1] = dgttrs(*factor, rhs[:, None], overwrite_b=True)[0][:, 0]
+            elif call:
+                option_values[1:-1] = _projected_solve(implicit[2], factor, rhs[::-1], exercise_values[::-1])[::-1]
+            else:
+                option_values[1:-1] = _projected_solve(implicit[0], factor, rhs, exercise_values)
+
+        return option_values
+
+
+"""
+Helper for the UL factorisation of a constant coefficient tridiagonal matrix (sub, diag, sup) of size m,
+eliminating from the last row upwards:
+    diag'_{m-1} = diag, w_i = sup/ diag'_{i+1}, diag'_i = diag - w_i * sub
+Returns LAPACK band storage of the unit upper bidiagonal U (w above the diagonal) and of the lower
+bidiagonal L (diag' on the diagonal, sub below), with A = U L.
+The factor only depends on the matrix, so it is computed once per step size.
+"""
+def _ul_factor(sub: float, diag: float, sup: float, m: int) -> tuple:
+    upper = np.ones((2, m))
+    lower = np.full((2, m), sub)
+    reduced = lower[0]
+    reduced[-1] = diag
+    for i in range(m - 2, -1, -1):
+        upper[0, i+1] = sup / reduced[i+1]
+        reduced[i] = diag - upper[0, i+1] * sub
+    lower[1, -1] = 0.0
+    return upper, lower
+
+
+"""
+Brennan-Schwartz projected tridiagonal solve for early exercise at the low end of the grid (puts):
+    1. upward elimination rhs' = U^-1 rhs, rhs'_i = rhs_i - w_i * rhs'_{i+1}
+    2. downward substitution x_i = max((rhs'_i - sub * x_{i-1})/ diag'_i, exercise_i)
+The exercise region is one block of low nodes, so step 2 is split at the first node k where holding beats
+exercising: x = exercise below k, and from k up a lower bidiagonal solve with x_{k-1} fixed.
+Both are LAPACK banded triangular solves instead of a Python loop over nodes.
+"""
+def _projected_solve(sub: float, factor: tuple, rhs: np.ndarray, exercise: np.ndarray) -> np.ndarray:
+    from scipy.linalg.lapack import dtbtrs
+
+    upper, lower = factor
+    eliminated = dtbtrs(upper, rhs[:, None], uplo="U", diag="U")[0][:, 0]
+
+    # holding value of every node if the node below is exercised
+    holding = eliminated.copy()
+    holding[1:] -= sub * exercise[:-1]
+    holding /= lower[0]
+    continuation = np.flatnonzero(holding > exercise)
+    if continuation.size == 0:
+        return exercise.copy()
+
+    k = continuation[0]
+    tail = eliminated[k:, None]
+    if k > 0:
+        tail[0] -= sub * exercise[k-1]
+    values = exercise.copy()
+    values[k:] = dtbtrs(lower[:, k:], tail, uplo="L", overwrite_b=True)[0][:, 0]
+    return np.maximum(values, exercise)
@@ -0,0 +1,212 @@
+from concurrent.futures import ProcessPoolExecutor
+import os
+
+import numpy as np
+
+from .base_option import OptionValuationModel
+from .black_scholes_model import BlackScholesModel
+from .parallel_pricing import _pool_context
+from utils.enums_option import OPTION_TYPE, PARAMETERS
+
+"""
+Monte Carlo pricer simulating GBM paths in memory bounded chunks.
+
+Paths are generated chunk by chunk (at most MAX_PATH_FLOATS floats resident per chunk) and every
+chunk is reduced to six running sums of the per path estimator Y and control C:
+    n, sum Y, sum C, sum Y^2, sum C^2, sum YC
+Sums merge by addition, so chunks can run in any order, in worker processes or streamed one at a time,
+and the estimate/ standard error of everything simulated so far is available after every chunk.
+
+Variance reduction:
+    - antithetic: each normal draw z is paired with -z, the pair average is one sample
+    - control variate C with known expectation E[C], the estimate is mean(Y) - beta * (mean(C) - E[C])
+      with beta = Cov(Y, C)/ Var(C) from the sums:
+        - payoff passed (e.g. arithmetic Asian): the discounted European payoff on the terminal price,
+          E[C] is the Black-Scholes price
+        - vanilla payoff: the discounted terminal price, E[C] = S e^(-qT). The European payoff itself
+          would be the estimand (Y == C), returning Black-Scholes with a zero standard error
+
+Chunk k draws from SeedSequence(seed, spawn_key=(k,)) and chunks are merged (and checked against
+target_std_error) in chunk order, so results only depend on seed and chunk size, never on the number
+of workers.
+"""
+# Floats per chunk of paths (chunk_size x time_steps), ~16MB
+MAX_PATH_FLOATS = 2_000_000
+
+# Default number of simulated paths (an upper bound when a target standard error is set)
+DEFAULT_NUM_PATHS = 100_000
+
+
+class MonteCarloModel(OptionValuationModel):
+    def __init__(
+            self,
+            option_type,
+            parameters,
+            payoff=None,  # callable(paths, X) -> per path payoff, paths (n, time_steps) at each step; vanilla if None
+            antithetic: bool = True,
+            control_variate: bool = True,
+            seed: int = None,  # None draws fresh entropy, kept in self.seed to reproduce the run
+            chunk_size: int = None,  # paths per chunk, defaults to MAX_PATH_FLOATS / time_steps
+            workers: int = 1,  # processes simulating chunks, None for os.cpu_count()
+            target_std_error: float = None  # stop once the standard error reaches this, num_paths is the cap
+    ):
+        """
+            Initialize parameters used to calculate call and put prices.
+            Parameters:
+                1. stock_price - Underlying stock price
+                2. strike_price - Strike/ Exercise price
+                3. days_to_expiry - Days to expiry
+                4. interest_rate - Risk free interest rate
+                5. volatility - Annualized volatility of stock in decimal
+                6. dividend_yeild - Stock dividend yield
+                7. time_steps - Monitoring dates per path, default 1 (terminal price only, exact for GBM)
+                8. num_paths - Paths to simulate, default DEFAULT_NUM_PATHS
+            After pricing, std_error holds the standard error of the price and paths_simulated the paths used.
+        """
+        super().__init__(option_type, parameters)
+        self.S = self.parameters[PARAMETERS.STOCK_PRICE.value]
+        self.X = self.parameters[PARAMETERS.STRIKE_PRICE.value]
+        self.T = self.parameters[PARAMETERS.DAYS_TO_EXPIRY.value] / 365
+        self.r = self.parameters[PARAMETERS.INTEREST_RATE.value]
+        self.sigma = self.parameters[PARAMETERS.VOLATILITY.value]
+        self.q = self.parameters.get(PARAMETERS.DIVIDEND_YIELD.value, 0.0)
+        self.N = int(self.parameters.get(PARAMETERS.TIME_STEPS.value, 1))
+        self.num_paths = int(self.parameters.get(PARAMETERS.NUM_PATHS.value, DEFAULT_NUM_PATHS))
+
+        self.payoff = payoff
+        self.antithetic = antithetic
+        self.control_variate = control_variate
+        self.seed = seed if seed is not None else np.random.SeedSequence().entropy
+        self.chunk_size = chunk_size or max(2, MAX_PATH_FLOATS // self.N)
+        self.chunk_size += self.chunk_size % 2 if antithetic else 0  # whole antithetic pairs
+        self.workers = workers or os.cpu_count() or 1
+        self.target_std_error = target_std_error
+
+        if self.num_paths < 2:
+            raise ValueError("Monte Carlo pricing needs at least 2 paths.")
+
+        self.std_error = None
+        self.paths_simulated = 0
+
+    def calculate_call_price(self):
+        return self._simulate(OPTION_TYPE.CALL.value)
+
+    def calculate_put_price(self):
+        return self._simulate(OPTION_TYPE.PUT.value)
+
+    def calculate_price_and_std_error(self) -> tuple:
+        """
+            Returns (price, standard error of the price).
+        """
+        price = self.calculate_price()
+        return price, self.std_error
+
+    def _simulate(self, option_type: str) -> float:
+        """
+            Run chunks in waves of one chunk per worker, merging their sums in chunk order, until num_paths
+            are simulated or the standard error reaches target_std_error (checked after every chunk).
+        """
+        if not self.control_variate:
+            control_price = 0.0
+        elif self.payoff is None:
+            control_price = self.S * np.exp(-self.q * self.T)
+        else:
+            control_price = BlackScholesModel(option_type, self.parameters).calculate_price()
+        chunk_args = (
+            option_type, self.S, self.X, self.T, self.r, self.sigma, self.q, self.N,
+            self.payoff, self.antithetic, self.control_variate, self.seed
+        )
+        n_chunks = -(-self.num_paths // self.chunk_size)
+        chunks = [(k, min(self.chunk_size, self.num_paths - k * self.chunk_size)) for k in range(n_chunks)]
+
+        sums = np.zeros(6)
+        pool = None
+        if self.workers > 1 and n_chunks > 1:
+            pool = ProcessPoolExecutor(max_workers=self.workers, mp_context=_pool_context())
+
+        def chunk_sums():
+            # one chunk at a time serially, a wave of one chunk per worker in parallel, in chunk order
+            if pool is None:
+                for chunk in chunks:
+                    yield _simulate_chunk(chunk, *chunk_args)
+                return
+            for start in range(0, n_chunks, self.workers):
+                wave = chunks[start:start+self.workers]
+                yield from pool.map(_simulate_chunk, wave, *([arg] * len(wave) for arg in chunk_args))
+
+        try:
+            for result in chunk_sums():
+                sums += result
+                price, self.std_error = _estimate(sums, control_price)
+                if self.target_std_error is not None and self.std_error <= self.target_std_error:
+                    break
+        finally:
+            if pool is not None:
+                pool.shutdown()
+
+        self.paths_simulated = int(sums[0]) * (2 if self.antithetic else 1)
+        return price
+
+
+"""
+Worker task: simulate one chunk of paths and reduce it to the running sums
+(n, sum Y, sum C, sum Y^2, sum C^2, sum YC) of discounted payoffs Y and controls C.
+"""
+def _simulate_chunk(chunk: tuple, option_type, S, X, T, r, sigma, q, N, payoff, antithetic, control_variate, seed) -> np.ndarray:
+    k, paths = chunk
+    rng = np.random.default_rng(np.random.SeedSequence(seed, spawn_key=(k,)))
+    draws = (paths + 1) // 2 if antithetic else paths
+
+    delta_t = T / N
+    z = rng.standard_normal((draws, N))
+    if antithetic:
+        z = np.concatenate((z, -z))
+    # log price increments, cumulated in place along the monitoring dates
+    z *= sigma * np.sqrt(delta_t)
+    z += (r - q - 0.5 * sigma**2) * delta_t
+    np.cumsum(z, axis=1, out=z)
+    np.exp(z, out=z)
+    z *= S
+    asset_prices = z
+
+    discount = np.exp(-r * T)
+    terminal_prices = asset_prices[:, -1]
+    vanilla = _vanilla_payoff(option_type, terminal_prices, X)
+    if payoff is None:
+        values, controls = discount * vanilla, discount * terminal_prices
+    else:
+        values, controls = discount * payoff(asset_prices, X), discount * vanilla
+    if not control_variate:
+        controls = np.zeros_like(values)
+
+    if antithetic:
+        values = 0.5 * (values[:draws] + values[draws:])
+        controls = 0.5 * (controls[:draws] + controls[draws:])
+
+    return np.array([
+        values.size, values.sum(), controls.sum(),
+        values @ values, controls @ controls, values @ controls
+    ])
+
+
+def _vanilla_payoff(option_type: str, terminal_prices: np.ndarray, X) -> np.ndarray:
+    if option_type == OPTION_TYPE.CALL.value:
+        return np.maximum(terminal_prices - X, 0.0)
+    return np.maximum(X - terminal_prices, 0.0)
+
+
+"""
+Helper for the control variate estimate and its standard error from merged running sums.
+Without a control (or a constant one) beta is 0 and this is the plain sample mean/ standard error.
+"""
+def _estimate(sums: np.ndarray, control_price: float) -> tuple:
+    n, sum_y, sum_c, sum_yy, sum_cc, sum_yc = sums
+    mean_y, mean_c = sum_y / n, sum_c / n
+    var_y = max(sum_yy / n - mean_y**2, 0.0) * n / (n - 1)
+    var_c = max(sum_cc / n - mean_c**2, 0.0) * n / (n - 1)
+    cov = (sum_yc / n - mean_y * mean_c) * n / (n - 1)
+
+    beta = cov / var_c if var_c > 0 else 0.0
+    price = mean_y - beta * (mean_c - control_price)
+    residual_var = max(var_y - beta * cov, 0.0)
+    return price, np.sqrt(residual_var / n)
@@ -0,0 +1,114 @@
+from concurrent.futures import ProcessPoolExecutor
+import multiprocessing
+from multiprocessing.shared_memory import SharedMemory
+import os
+
+import numpy as np
+
+from .batch_pricing import _broadcast_contracts, price_batch
+from utils.enums_option import EXERCISE_STYLE, OPTION_TYPE, TREE_METHOD
+
+"""
+Multiprocess chain pricer for large books (e.g. nightly revaluation with BinomialModel at high step counts).
+
+Contracts are sharded across a process pool, each worker prices its shard with price_batch.
+Inputs and outputs live in multiprocessing.shared_memory blocks wrapped as NumPy arrays:
+    - parent writes one (INPUT_ROWS x n) float64 input block and allocates an (n,) output block
+    - workers attach both blocks once in the pool initializer
+    - tasks only carry (start, stop) shard bounds, results are written straight into the output block
+so no per contract dicts or arrays are pickled between processes.
+"""
+# Row order of the shared input block, option type stored as 1.0 (call)/ 0.0 (put)
+INPUT_ROWS = ("is_call", "S", "X", "T", "r", "sigma", "q")
+
+# Shards per worker, more shards balance uneven shard costs at the price of more task round trips
+SHARDS_PER_WORKER = 4
+
+# forkserver avoids forking a (possibly multi-threaded) parent, spawn where it is unavailable
+START_METHOD = "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+
+# Shared blocks attached by each worker process in _attach_shared_blocks
+_worker_blocks = {}
+
+
+def price_batch_parallel(
+        option_model: str,  # OPTION_MODEL value
+        option_type,  # OPTION_TYPE value or array of them
+        S,
+        X,
+        T,  # days_to_expiry
+        r,
+        sigma,
+        q=0.0,
+        N: int = 100,
+        exercise_style: str = EXERCISE_STYLE.EUROPEAN.value,
+        tree_method: str = TREE_METHOD.CRR.value,
+        workers: int = None,  # defaults to os.cpu_count()
+        shard_size: int = None,  # contracts per task, defaults to n / (workers * SHARDS_PER_WORKER)
+) -> np.ndarray:
+    """
+    Same inputs and output as price_batch, priced across a process pool.
+    """
+    shape, (option_type, S, X, T, r, sigma, q) = _broadcast_contracts(option_type, S, X, T, r, sigma, q)
+    n = S.size
+    workers = workers or os.cpu_count() or 1
+    shard_size = shard_size or max(1, -(-n // (workers * SHARDS_PER_WORKER)))
+    model_kwargs = {"N": N, "exercise_style": exercise_style, "tree_method": tree_method}
+
+    input_block = SharedMemory(create=True, size=max(1, len(INPUT_ROWS) * n * 8))
+    output_block = SharedMemory(create=True, size=max(1, n * 8))
+    try:
+        inputs = np.ndarray((len(INPUT_ROWS), n), dtype=np.float64, buffer=input_block.buf)
+        inputs[:] = (option_type == OPTION_TYPE.CALL.value, S, X, T, r, sigma, q)
+        outputs = np.ndarray((n,), dtype=np.float64, buffer=output_block.buf)
+
+        shards = [(start, min(start + shard_size, n)) for start in range(0, n, shard_size)]
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=_pool_context(),
+            initializer=_attach_shared_blocks,
+            initargs=(input_block.name, output_block.name, n),
+        ) as pool:
+            # list() surfaces any worker exception here
+            list(pool.map(_price_shard, shards, [option_model] * len(shards), [model_kwargs] * len(shards)))
+
+        prices = outputs.copy().reshape(shape)
+        del inputs, outputs  # release buffer exports before closing the blocks
+        return prices
+    finally:
+        for block in (input_block, output_block):
+            block.close()
+            block.unlink()
+
+
+"""
+Process context for the pool. The forkserver imports the pricing stack once, so every later
+worker forks with NumPy/ SciPy and the models already loaded instead of re-importing them.
+"""
+def _pool_context():
+    context = multiprocessing.get_context(START_METHOD)
+    if START_METHOD == "forkserver":
+        context.set_forkserver_preload([__name__])
+    return context
+
+
+"""
+Pool initializer: attach the parent's shared blocks once per worker process.
+Pool workers share the parent's resource tracker, the parent alone unlinks the blocks.
+"""
+def _attach_shared_blocks(input_name: str, output_name: str, n: int) -> None:
+    input_block = SharedMemory(name=input_name)
+    output_block = SharedMemory(name=output_name)
+    _worker_blocks["blocks"] = (input_block, output_block)  # keep the mappings alive
+    _worker_blocks["inputs"] = np.ndarray((len(INPUT_ROWS), n), dtype=np.float64, buffer=input_block.buf)
+    _worker_blocks["outputs"] = np.ndarray((n,), dtype=np.float64, buffer=output_block.buf)
+
+
+"""
+Worker task: price contracts [start, stop) from the shared input block into the shared output block.
+"""
+def _price_shard(shard: tuple, option_model: str, model_kwargs: dict) -> None:
+    start, stop = shard
+    is_call, S, X, T, r, sigma, q = _worker_blocks["inputs"][:, start:stop]
+    option_type = np.where(is_call == 1.0, OPTION_TYPE.CALL.value, OPTION_TYPE.PUT.value)
+    _worker_blocks["outputs"][start:stop] = price_batch(option_model, option_type, S, X, T, r, sigma, q, **model_kwargs)
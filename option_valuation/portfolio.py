@@ -0,0 +1,239 @@
+import numpy as np
+
+from .batch_pricing import MODELS, OPTION_TYPE_COLUMN, TREE_MODELS, greeks_batch
+from .scenario_grid import _bumped_greeks
+from utils.enums_option import EXERCISE_STYLE, GREEKS, OPTION_MODEL, PARAMETERS, TREE_METHOD
+
+"""
+Book of option positions held column-wise: one array per field across every position, no object
+per position. Positions are grouped by underlying once (index arrays per underlying), and the unit
+price/ Greeks of every position are kept with per underlying totals of quantity * value:
+    - book value/ Greeks sum the per underlying totals (one row per underlying)
+    - a market update for one underlying (spot, volatility, rate, dividend yield) reprices only that
+      underlying's positions in one vectorized call and refreshes only its totals row
+Values are Black-Scholes closed form, or price_batch with bump and reprice Greeks for the other
+models (see option_valuation.scenario_grid), in the units of BlackScholesModel.calculate_greeks.
+"""
+# Unit values kept per position, in this row order
+PRICE = "price"
+VALUE_KEYS = (PRICE, GREEKS.DELTA.value, GREEKS.GAMMA.value, GREEKS.VEGA.value, GREEKS.THETA.value, GREEKS.RHO.value)
+
+# Quantity weighted totals, value (sum of quantity * price) in place of price
+VALUE = "value"
+TOTAL_KEYS = (VALUE, *VALUE_KEYS[1:])
+
+# DataFrame columns beside the PARAMETERS values and OPTION_TYPE_COLUMN
+UNDERLYING_COLUMN = "underlying"
+QUANTITY_COLUMN = "quantity"
+
+# Market fields update_market can set, by PARAMETERS value
+MARKET_FIELDS = (
+    PARAMETERS.STOCK_PRICE.value,
+    PARAMETERS.VOLATILITY.value,
+    PARAMETERS.INTEREST_RATE.value,
+    PARAMETERS.DIVIDEND_YIELD.value,
+)
+
+
+class Portfolio:
+    def __init__(
+            self,
+            underlying,  # symbol per position
+            option_type,  # OPTION_TYPE value(s)
+            S,  # stock_price(s)
+            X,  # strike_price(s)
+            T,  # days_to_expiry
+            r,  # interest_rate(s)
+            sigma,  # volatility(ies)
+            q=0.0,  # dividend_yield(s)
+            quantity=1.0,  # contracts held, negative for short positions
+            option_model: str = OPTION_MODEL.BLACK_SCHOLES_MODEL.value,  # OPTION_MODEL value shared by the book
+            N: int = 100,  # time_steps, tree models only
+            exercise_style: str = EXERCISE_STYLE.EUROPEAN.value,
+            tree_method: str = TREE_METHOD.CRR.value,
+    ):
+        """
+        Every argument besides the model settings broadcasts against the others, one entry per position.
+        """
+        if option_model not in MODELS:
+            raise ValueError(f"Unsupported option model: {option_model}")
+        if exercise_style == EXERCISE_STYLE.AMERICAN.value and option_model not in TREE_MODELS:
+            raise ValueError(f"American exercise is not supported by {option_model}")
+        self.option_model = option_model
+        self.settings = {"N": N, "exercise_style": exercise_style, "tree_method": tree_method}
+
+        self.underlyings = np.array([], dtype=str)  # symbol per underlying code
+        self.codes = np.array([], dtype=int)  # underlying code per position
+        self.option_type = np.array([], dtype=str)
+        # PARAMETERS value -> value per position, contract terms then MARKET_FIELDS
+        self.fields = {field: np.array([]) for field in (PARAMETERS.STRIKE_PRICE.value, PARAMETERS.DAYS_TO_EXPIRY.value, *MARKET_FIELDS)}
+        self.quantity = np.array([])
+        self.unit_values = np.empty((len(VALUE_KEYS), 0))  # VALUE_KEYS rows x positions
+        self.revalued = 0  # positions repriced so far
+        self.add_positions(underlying, option_type, S, X, T, r, sigma, q, quantity)
+
+    @classmethod
+    def from_frame(cls, positions, **settings) -> "Portfolio":
+        """
+        Positions from a DataFrame with columns named by PARAMETERS values plus "underlying",
+        "option_type" and optionally "quantity" (default 1) and "dividend_yield" (default 0.0).
+        """
+        return cls(
+            positions[UNDERLYING_COLUMN].to_numpy(),
+            positions[OPTION_TYPE_COLUMN].to_numpy(),
+            positions[PARAMETERS.STOCK_PRICE.value].to_numpy(),
+            positions[PARAMETERS.STRIKE_PRICE.value].to_numpy(),
+            positions[PARAMETERS.DAYS_TO_EXPIRY.value].to_numpy(),
+            positions[PARAMETERS.INTEREST_RATE.value].to_numpy(),
+            positions[PARAMETERS.VOLATILITY.value].to_numpy(),
+            positions[PARAMETERS.DIVIDEND_YIELD.value].to_numpy() if PARAMETERS.DIVIDEND_YIELD.value in positions else 0.0,
+            positions[QUANTITY_COLUMN].to_numpy() if QUANTITY_COLUMN in positions else 1.0,
+            **settings,
+        )
+
+    def __len__(self) -> int:
+        return self.quantity.size
+
+    def add_positions(self, underlying, option_type, S, X, T, r, sigma, q=0.0, quantity=1.0) -> None:
+        """
+        Append positions (broadcast like __init__), only the new positions are priced.
+        """
+        arrays = np.broadcast_arrays(
+            np.asarray(underlying, dtype=str), np.asarray(option_type),
+            *(np.asarray(arg, dtype=float) for arg in (X, T, S, sigma, r, q, quantity))
+        )
+        underlying, option_type, X, T, S, sigma, r, q, quantity = (arr.ravel() for arr in arrays)
+        # priced before the book changes, so positions the model rejects leave the book as it was
+        unit_values = self._unit_values(option_type, S, X, T, r, sigma, q)
+
+        self.underlyings, codes = np.unique(np.concatenate((self.underlyings[self.codes], underlying)), return_inverse=True)
+        self.codes = codes.ravel()
+        self.option_type = np.concatenate((self.option_type, option_type))
+        for field, values in zip(self.fields, (X, T, S, sigma, r, q)):
+            self.fields[field] = np.concatenate((self.fields[field], values))
+        self.quantity = np.concatenate((self.quantity, quantity))
+        self.unit_values = np.concatenate((self.unit_values, unit_values), axis=1)
+        self.revalued += underlying.size
+
+        # positions of each underlying, a stable sort keeps them in book order
+        order = np.argsort(self.codes, kind="stable")
+        self._members = np.split(order, np.flatnonzero(np.diff(self.codes[order])) + 1) if len(self) else []
+        self._refresh_totals()
+
+    def update_market(
+            self,
+            underlying: str,
+            S: float = None,  # new stock_price
+            sigma: float = None,  # new volatility
+            r: float = None,  # new interest_rate
+            q: float = None,  # new dividend_yield
+    ) -> float:
+        """
+        Set market inputs of one underlying's positions and revalue only those positions.
+        Returns the change in book value.
+        """
+        code = self._code(underlying)
+        members = self._members[code]
+        for field, value in zip(MARKET_FIELDS, (S, sigma, r, q)):
+            if value is not None:
+                self.fields[field][members] = value
+
+        previous_value = self._totals[code, 0]
+        self._revalue(members)
+        self._totals[code] = self._total(members)
+        return self._totals[code, 0] - previous_value
+
+    def advance(self, days: float) -> float:
+        """
+        Move the book forward in time: days_to_expiry of every position shrinks by days and the whole book is repriced.
+        Returns the change in book value.
+        """
+        T = self.fields[PARAMETERS.DAYS_TO_EXPIRY.value] - days
+        # checked before the book changes, expired positions have to be removed by the caller first
+        if np.any(T <= 0):
+            raise ValueError(f"Advancing {days} days would expire positions")
+        previous_value = self.value()
+        self.fields[PARAMETERS.DAYS_TO_EXPIRY.value] = T
+        self.revalue()
+        return self.value() - previous_value
+
+    def revalue(self) -> None:
+        """
+        Reprice the whole book from its current fields, e.g. after advance moved days_to_expiry.
+        """
+        self._revalue(np.arange(len(self)))
+        self._refresh_totals()
+
+    def value(self) -> float:
+        return self._totals[:, 0].sum()
+
+    def greeks(self) -> dict:
+        """
+        Book value and Greeks, quantity weighted sums over every position.
+        """
+        return dict(zip(TOTAL_KEYS, self._totals.sum(axis=0)))
+
+    def exposures(self, underlying: str = None) -> dict:
+        """
+        Value and Greeks per underlying ({symbol: {value key: total}}), or of one underlying.
+        """
+        if underlying is not None:
+            return dict(zip(TOTAL_KEYS, self._totals[self._code(underlying)]))
+        return {symbol: dict(zip(TOTAL_KEYS, totals)) for symbol, totals in zip(self.underlyings, self._totals)}
+
+    def to_frame(self):
+        """
+        One row per position: contract fields, quantity, unit price/ Greeks and position value (quantity * price).
+        """
+        import pandas as pd
+
+        frame = pd.DataFrame({
+            UNDERLYING_COLUMN: self.underlyings[self.codes],
+            OPTION_TYPE_COLUMN: self.option_type,
+            **self.fields,
+            QUANTITY_COLUMN: self.quantity,
+            **dict(zip(VALUE_KEYS, self.unit_values)),
+        })
+        frame[VALUE] = frame[QUANTITY_COLUMN] * frame[PRICE]
+        return frame
+
+    def _code(self, underlying: str) -> int:
+        code = np.searchsorted(self.underlyings, underlying)
+        if code == self.underlyings.size or self.underlyings[code] != underlying:
+            raise KeyError(f"No positions in underlying: {underlying}")
+        return code
+
+    def _total(self, members: np.ndarray) -> np.ndarray:
+        return self.unit_values[:, members] @ self.quantity[members]
+
+    def _refresh_totals(self) -> None:
+        self._totals = np.array([self._total(members) for members in self._members]).reshape(-1, len(VALUE_KEYS))
+
+    def _revalue(self, positions: np.ndarray) -> None:
+        """
+        Reprice the selected positions from their current fields.
+        """
+        if positions.size == 0:
+            return
+        self.unit_values[:, positions] = self._unit_values(
+            self.option_type[positions],
+            self.fields[PARAMETERS.STOCK_PRICE.value][positions],
+            self.fields[PARAMETERS.STRIKE_PRICE.value][positions],
+            self.fields[PARAMETERS.DAYS_TO_EXPIRY.value][positions],
+            self.fields[PARAMETERS.INTEREST_RATE.value][positions],
+            self.fields[PARAMETERS.VOLATILITY.value][positions],
+            self.fields[PARAMETERS.DIVIDEND_YIELD.value][positions],
+        )
+        self.revalued += positions.size
+
+    def _unit_values(self, option_type, S, X, T, r, sigma, q) -> np.ndarray:
+        """
+        Unit price/ Greeks (VALUE_KEYS rows x contracts) of 1-D contract arrays in one vectorized call.
+        """
+        if option_type.size == 0:
+            return np.empty((len(VALUE_KEYS), 0))
+        if self.option_model == OPTION_MODEL.BLACK_SCHOLES_MODEL.value:
+            values = greeks_batch(option_type, S, X, T, r, sigma, q)
+        else:
+            values = _bumped_greeks(self.option_model, option_type, S, X, T, r, sigma, q, self.settings)
+        return np.array([values[key] for key in VALUE_KEYS]).reshape(len(VALUE_KEYS), -1)
@@ -0,0 +1,241 @@
+import math
+
+import numpy as np
+
+from .batch_pricing import greeks_batch, price_batch
+from .binomial_model import BinomialModel
+from utils.enums_option import EXERCISE_STYLE, GREEKS, OPTION_MODEL, PARAMETERS, TREE_METHOD
+
+"""
+Scenario grids: one contract revalued over spot x volatility x time shocks.
+
+Every shock vector lies along its own axis (spot (n, 1, 1), volatility (1, m, 1), days (1, 1, k)) and the
+contract inputs broadcast against them, so the whole grid is a single price_batch call: one closed-form
+evaluation, or batched tree runs (contracts as (M, 1) columns) for the tree models. European binomial
+grids with a spot axis instead price each spot row from one tree (BinomialModel.calculate_price_curve).
+Only the shocks given become axes, in that order, so a grid is 1D, 2D or 3D:
+    - spot shocks are relative moves, S * (1 + shock)
+    - volatility shocks are absolute moves, sigma + shock
+    - time shocks are days elapsed, T - shock
+P&L is the scenario price less today's price. Greeks are closed form for Black-Scholes and central
+bump and reprice for every other model, with all bumps stacked on a leading axis of the same call.
+"""
+# Bump sizes for bump and reprice Greeks: relative spot, absolute volatility/ rate, days to expiry
+SPOT_BUMP = 0.01
+VOL_BUMP = 0.01
+RATE_BUMP = 0.0001
+DAY_BUMP = 1.0
+
+# Values of every grid, Greeks (GREEKS values) are added when requested
+PRICE = "price"
+PNL = "pnl"
+
+# Scenarios per grid (points^2 x time slices) of 100 step trees when every scenario is its own tree
+# (see max_grid_points), about a second of pricing, bump and reprice Greeks reprice every scenario 9 times
+MAX_TREE_SCENARIOS = 5_000
+MAX_TREE_GREEK_SCENARIOS = 500
+TREE_SCENARIO_STEPS = 100
+
+# Grid axes in order: (PARAMETERS value, scenario_grid argument)
+SCENARIO_AXES = (
+    (PARAMETERS.STOCK_PRICE.value, "spot_shocks"),
+    (PARAMETERS.VOLATILITY.value, "vol_shocks"),
+    (PARAMETERS.DAYS_TO_EXPIRY.value, "time_shocks"),
+)
+
+
+class ScenarioGrid:
+    def __init__(
+            self,
+            dims: tuple,  # PARAMETERS values naming the axes
+            coords: dict,  # dim -> shocked parameter level along the axis
+            shocks: dict,  # dim -> shock along the axis
+            values: dict,  # value name -> array shaped by the dims
+            base_price: float  # unshocked price, P&L reference
+    ):
+        self.dims = dims
+        self.coords = coords
+        self.shocks = shocks
+        self.values = values
+        self.base_price = base_price
+
+    def __getitem__(self, value: str) -> np.ndarray:
+        return self.values[value]
+
+    @property
+    def shape(self) -> tuple:
+        return tuple(self.coords[dim].size for dim in self.dims)
+
+    def to_frame(self, value: str = None):
+        """
+        value given: a 2D grid as a table of value, first axis levels as index and second as columns.
+        Otherwise one row per scenario, indexed by every axis level, with one column per value.
+        """
+        import pandas as pd
+
+        if value is not None:
+            if len(self.dims) != 2:
+                raise ValueError(f"A {value} table needs a 2D grid, got axes {self.dims}.")
+            return pd.DataFrame(
+                self.values[value],
+                index=pd.Index(self.coords[self.dims[0]], name=self.dims[0]),
+                columns=pd.Index(self.coords[self.dims[1]], name=self.dims[1])
+            )
+        index = pd.MultiIndex.from_product([self.coords[dim] for dim in self.dims], names=self.dims)
+        return pd.DataFrame({name: values.ravel() for name, values in self.values.items()}, index=index)
+
+
+def scenario_grid(
+        option_model: str,  # OPTION_MODEL value
+        option_type: str,  # OPTION_TYPE value
+        S: float,  # stock_price
+        X: float,  # strike_price
+        T: float,  # days_to_expiry
+        r: float,  # interest_rate
+        sigma: float,  # volatility
+        q: float = 0.0,  # dividend_yield
+        spot_shocks=None,  # relative spot moves, e.g. np.linspace(-0.2, 0.2, 41)
+        vol_shocks=None,  # absolute volatility moves, e.g. np.linspace(-0.1, 0.1, 21)
+        time_shocks=None,  # days elapsed, e.g. [0, 7, 30]
+        greeks: bool = False,  # add delta, gamma, vega, theta, rho (units of BlackScholesModel.calculate_greeks)
+        N: int = 100,  # time_steps, tree models only
+        exercise_style: str = EXERCISE_STYLE.EUROPEAN.value,
+        tree_method: str = TREE_METHOD.CRR.value,
+) -> ScenarioGrid:
+    """
+    Price (and P&L, Greeks) of one contract at every point of the spot x volatility x time shock grid.
+    """
+    shocks = {"spot_shocks": spot_shocks, "vol_shocks": vol_shocks, "time_shocks": time_shocks}
+    axes = [(dim, np.asarray(shocks[arg], dtype=float)) for dim, arg in SCENARIO_AXES if shocks[arg] is not None]
+    if not axes:
+        raise ValueError("Scenario grid needs at least one of spot_shocks, vol_shocks, time_shocks.")
+    if any(shock.ndim != 1 or shock.size == 0 for _, shock in axes):
+        raise ValueError("Scenario shocks must be non-empty 1-D arrays.")
+
+    # shocked parameter levels, each shock vector along its own axis of the grid
+    levels = {
+        PARAMETERS.STOCK_PRICE.value: lambda shock: S * (1 + shock),
+        PARAMETERS.VOLATILITY.value: lambda shock: sigma + shock,
+        PARAMETERS.DAYS_TO_EXPIRY.value: lambda shock: T - shock,
+    }
+    coords = {dim: levels[dim](shock) for dim, shock in axes}
+    grid = {
+        dim: coords[dim].reshape([-1 if axis == i else 1 for axis in range(len(axes))])
+        for i, (dim, _) in enumerate(axes)
+    }
+    S_grid, sigma_grid, T_grid = np.broadcast_arrays(
+        grid.get(PARAMETERS.STOCK_PRICE.value, S),
+        grid.get(PARAMETERS.VOLATILITY.value, sigma),
+        grid.get(PARAMETERS.DAYS_TO_EXPIRY.value, T)
+    )
+    if np.any(S_grid <= 0) or np.any(sigma_grid <= 0) or np.any(T_grid <= 0):
+        raise ValueError("Scenario shocks must leave a positive stock price, volatility and days to expiry.")
+
+    settings = {"N": N, "exercise_style": exercise_style, "tree_method": tree_method}
+    spot_axis = 0 if PARAMETERS.STOCK_PRICE.value in grid else None
+    base_price = float(price_batch(option_model, option_type, S, X, T, r, sigma, q, **settings))
+    if not greeks:
+        values = {PRICE: _price_grid(option_model, option_type, S_grid, X, T_grid, r, sigma_grid, q, settings, spot_axis)}
+    elif option_model == OPTION_MODEL.BLACK_SCHOLES_MODEL.value:
+        values = greeks_batch(option_type, S_grid, X, T_grid, r, sigma_grid, q)
+    else:
+        values = _bumped_greeks(option_model, option_type, S_grid, X, T_grid, r, sigma_grid, q, settings, spot_axis)
+
+    price = values.pop(PRICE)
+    return ScenarioGrid(
+        dims=tuple(dim for dim, _ in axes),
+        coords=coords,
+        shocks=dict(axes),
+        values={PRICE: price, PNL: price - base_price, **values},
+        base_price=base_price,
+    )
+
+
+def max_grid_points(
+        option_model: str,
+        slices: int,  # time slices of the grid
+        greeks: bool = False,
+        N: int = 100,
+        exercise_style: str = EXERCISE_STYLE.EUROPEAN.value,
+        tree_method: str = TREE_METHOD.CRR.value,
+):
+    """
+    Largest points per axis of a square spot x volatility grid that stays interactive, None when unbounded.
+    Closed-form and shared curve binomial grids are unbounded, every other tree grid is held to
+    MAX_TREE_SCENARIOS (MAX_TREE_GREEK_SCENARIOS with Greeks) scenarios, scaled by the O(N^2) tree cost.
+    """
+    settings = {"exercise_style": exercise_style, "tree_method": tree_method}
+    if option_model == OPTION_MODEL.BLACK_SCHOLES_MODEL.value or _shared_curve(option_model, settings):
+        return None
+    scenarios = (MAX_TREE_GREEK_SCENARIOS if greeks else MAX_TREE_SCENARIOS) * (TREE_SCENARIO_STEPS / N) ** 2
+    return max(2, math.isqrt(int(scenarios // slices)))
+
+
+"""
+Helper for bump and reprice price/ Greeks over a grid in one price_batch call. The grid is repriced with
+each input bumped up and down, stacked on a leading axis:
+    0 base, 1-2 spot -/+, 3-4 volatility -/+, 5-6 days to expiry -/+, 7-8 rate -/+
+Volatility and days bumps shrink to half the level where the level is smaller than the bump.
+"""
+def _bumped_greeks(option_model, option_type, S, X, T, r, sigma, q, settings: dict, spot_axis: int = None) -> dict:
+    spot_bump = SPOT_BUMP * S
+    vol_bump = np.minimum(VOL_BUMP, sigma / 2)
+    day_bump = np.minimum(DAY_BUMP, T / 2)
+
+    # -1/ +1 on the two slices bumping each input (spot, volatility, days, rate), 0 elsewhere
+    steps = np.zeros((4, 9))
+    for i in range(4):
+        steps[i, 2*i+1:2*i+3] = (-1, 1)
+    steps = steps.reshape((4, 9) + (1,) * S.ndim)
+
+    prices = _price_grid(
+        option_model, option_type,
+        S + steps[0] * spot_bump, X, T + steps[2] * day_bump, r + steps[3] * RATE_BUMP, sigma + steps[1] * vol_bump, q,
+        settings, None if spot_axis is None else spot_axis + 1
+    )
+    base, spot_down, spot_up, vol_down, vol_up, day_down, day_up, rate_down, rate_up = prices
+    return {
+        PRICE: base,
+        GREEKS.DELTA.value: (spot_up - spot_down) / (2 * spot_bump),
+        GREEKS.GAMMA.value: (spot_up - 2 * base + spot_down) / spot_bump**2,
+        GREEKS.VEGA.value: (vol_up - vol_down) / (2 * vol_bump),
+        # theta per year is the value change as time passes, i.e. as days to expiry shrink
+        GREEKS.THETA.value: (day_down - day_up) / (2 * day_bump / 365),
+        GREEKS.RHO.value: (rate_up - rate_down) / (2 * RATE_BUMP),
+    }
+
+
+"""
+Helper pricing broadcast grids with price_batch. European binomial grids with a spot axis are priced one
+spot row at a time instead: every other input is constant along the row, so the row is one tree's price
+curve (BinomialModel.calculate_price_curve, O(spots * N) rather than a tree per spot). American and
+leisen reimer trees have no shared curve and stay one batched tree run.
+"""
+def _price_grid(option_model, option_type, S, X, T, r, sigma, q, settings: dict, spot_axis: int = None) -> np.ndarray:
+    if not _shared_curve(option_model, settings) or spot_axis is None:
+        return price_batch(option_model, option_type, S, X, T, r, sigma, q, **settings)
+
+    S, X, T, r, sigma, q = (np.moveaxis(arr, spot_axis, -1) for arr in np.broadcast_arrays(S, X, T, r, sigma, q))
+    rows = [arr.reshape(-1, arr.shape[-1]) for arr in (S, X, T, r, sigma, q)]
+    prices = np.empty(rows[0].shape)
+    for i, (S_row, X_row, T_row, r_row, sigma_row, q_row) in enumerate(zip(*rows)):
+        prices[i] = BinomialModel(option_type, {
+            PARAMETERS.STOCK_PRICE.value: S_row,
+            PARAMETERS.STRIKE_PRICE.value: X_row[0],
+            PARAMETERS.DAYS_TO_EXPIRY.value: T_row[0],
+            PARAMETERS.INTEREST_RATE.value: r_row[0],
+            PARAMETERS.VOLATILITY.value: sigma_row[0],
+            PARAMETERS.DIVIDEND_YIELD.value: q_row[0],
+            PARAMETERS.TIME_STEPS.value: int(settings["N"]),
+            PARAMETERS.EXERCISE_STYLE.value: settings["exercise_style"],
+            PARAMETERS.TREE_METHOD.value: settings["tree_method"],
+        }).calculate_price_curve()
+    return np.moveaxis(prices.reshape(S.shape), -1, spot_axis)
+
+
+def _shared_curve(option_model: str, settings: dict) -> bool:
+    return (
+        option_model == OPTION_MODEL.BINOMIAL_MODEL.value and
+        settings["exercise_style"] == EXERCISE_STYLE.EUROPEAN.value and
+        settings["tree_method"] != TREE_METHOD.LEISEN_REIMER.value
+    )
@@ -1,5 +1,4 @@
 import numpy as np
-from scipy.stats import norm
 
 from .base_option import OptionValuationModel
 from utils.enums_option import PARAMETERS
@@ -15,6 +14,7 @@ class SimpleBinomialModel(OptionValuationModel):
                 3. interest_rate - Risk free interest rate
                 4. dividend_yeild - Stock dividend yield
                 5. volatility - Volatlity of stock
+            Parameters may also be NumPy arrays to price many contracts at once.
         """
         super().__init__(option_type, parameters)
         self.S = self.parameters[PARAMETERS.STOCK_PRICE.value]
@@ -30,16 +30,16 @@ class SimpleBinomialModel(OptionValuationModel):
 
     def calculate_call_price(self):
         # upper and lower payouts at expiry
-        Su = max(self.S * self.u - self.X, 0)
-        Sd = max(self.S * self.d - self.X, 0)
+        Su = np.maximum(self.S * self.u - self.X, 0)
+        Sd = np.maximum(self.S * self.d - self.X, 0)
         price = (self.p * Su + (1-self.p) * Sd)/ (1 + self.r)
 
         return price
     
     def calculate_put_price(self):
         # upper and lower payouts at expiry
-        Su = max(self.X - self.S * self.u, 0)
-        Sd = max(self.X - self.S * self.d, 0)
+        Su = np.maximum(self.X - self.S * self.u, 0)
+        Sd = np.maximum(self.X - self.S * self.d, 0)
         price = (self.p * Su + (1-self.p) * Sd)/ (1 + self.r)
 
         return price
\ No newline at end of file
@@ -0,0 +1,93 @@
+import numpy as np
+
+from .base_option import OptionValuationModel
+from utils.enums_option import EXERCISE_STYLE, PARAMETERS
+
+class TrinomialModel(OptionValuationModel):
+    def __init__(self, option_type, parameters):
+        """
+            Initialize parameters used to calculate call and put prices.
+            Boyle trinomial tree: every node moves up (u), stays (m = 1) or moves down (d = 1/u)
+            each step, with u = e^(sigma*sqrt(2*delta_t)) and probabilities matching the risk neutral
+            drift and variance of the step. Step i has 2i+1 nodes, so N trinomial steps resolve the
+            terminal distribution about as finely as 2N binomial steps at a fraction of the steps.
+            Parameters:
+                1. stock_price - Underlying stock price
+                2. strike_price - Strike/ Exercise price
+                3. days_to_expiry - Days to expiry
+                4. interest_rate - Risk free interest rate
+                5. volatility - Annualized volatility of stock in decimal
+                6. dividend_yeild - Stock dividend yield
+                7. time_steps - Number of trinomial steps, default 100
+                8. exercise_style - EXERCISE_STYLE value, default european
+            Parameters 1-6 may also be NumPy column arrays of shape (M, 1) to price M contracts
+            in one batched tree (time_steps stays a shared int), see option_valuation.batch_pricing.
+        """
+        super().__init__(option_type, parameters)
+        self.S = self.parameters[PARAMETERS.STOCK_PRICE.value]
+        self.X = self.parameters[PARAMETERS.STRIKE_PRICE.value]
+        self.T = self.parameters[PARAMETERS.DAYS_TO_EXPIRY.value] / 365
+        self.r = self.parameters[PARAMETERS.INTEREST_RATE.value]
+        self.sigma = self.parameters[PARAMETERS.VOLATILITY.value]
+        self.q = self.parameters.get(PARAMETERS.DIVIDEND_YIELD.value, 0.0)
+        self.N = self.parameters.get(PARAMETERS.TIME_STEPS.value, 100)
+        self.exercise_style = self.parameters.get(PARAMETERS.EXERCISE_STYLE.value, EXERCISE_STYLE.EUROPEAN.value)
+
+        self.delta_t = self.T/ self.N
+
+        # Up factor and risk neutral up/ middle/ down probabilities
+        self.u = np.exp(self.sigma * np.sqrt(2 * self.delta_t))
+        half_growth = np.exp((self.r - self.q) * self.delta_t / 2)
+        half_up = np.exp(self.sigma * np.sqrt(self.delta_t / 2))
+        half_down = 1 / half_up
+        self.p_u = ((half_growth - half_down) / (half_up - half_down))**2
+        self.p_d = ((half_up - half_growth) / (half_up - half_down))**2
+        self.p_m = 1 - self.p_u - self.p_d
+
+    def calculate_call_price(self):
+        return self._backward_induction(self._call_payoff)
+
+    def calculate_put_price(self):
+        return self._backward_induction(self._put_payoff)
+
+    def _call_payoff(self, asset_prices: np.ndarray) -> np.ndarray:
+        return np.maximum(asset_prices - self.X, 0.0)
+
+    def _put_payoff(self, asset_prices: np.ndarray) -> np.ndarray:
+        return np.maximum(self.X - asset_prices, 0.0)
+
+    def _terminal_asset_prices(self) -> np.ndarray:
+        """
+            Asset prices at the 2N+1 terminal nodes (last axis), S * u^(j-N) for j = 0 .. 2N.
+        """
+        moves = np.arange(2 * self.N + 1) - self.N
+        return self.S * np.exp(moves * np.log(self.u))
+
+    def _backward_induction(self, payoff):
+        """
+            Backwards induction value = e^(-r(delta_t))*[p_u * V_up + p_m * V_mid + p_d * V_down]
+                - node j at a step has children j (down), j+1 (middle), j+2 (up) one step later
+                - each step is a single sliced vector op over the (2*step+1) live nodes, written in place
+                - nodes live on the last axis so a batch of trees (M, 2N+1) is inducted in the same ops
+            American exercise takes max(continuation, payoff) at every node. Node j at a step has the
+            same asset price as node j+1 one step later, so asset prices are shifted down in place.
+        """
+        american = self.exercise_style == EXERCISE_STYLE.AMERICAN.value
+        asset_prices = self._terminal_asset_prices()
+        option_values = payoff(asset_prices)
+
+        discount = np.exp(-self.r * self.delta_t)
+        for step in range(self.N - 1, -1, -1):
+            nodes = 2 * step + 1
+            option_values[..., :nodes] = discount * (
+                self.p_d * option_values[..., :nodes]
+                + self.p_m * option_values[..., 1:nodes+1]
+                + self.p_u * option_values[..., 2:nodes+2]
+            )
+
+            if american:
+                asset_prices[..., :nodes] = asset_prices[..., 1:nodes+1]
+                np.maximum(option_values[..., :nodes], payoff(asset_prices[..., :nodes]), out=option_values[..., :nodes])
+
+        # [()] unwraps the 0-d result of a single tree back to a scalar, batches stay (M,)
+        return option_values[..., 0][()]
@@ -0,0 +1,76 @@
+import asyncio
+
+"""
+Micro-batching of concurrent single contract requests into one vectorized call.
+
+Requests are grouped by a key holding everything the vectorized call shares (model, steps, exercise style, ...).
+The first request of a key opens a batch, which is flushed once it holds max_batch rows or max_delay
+seconds after it was opened, whichever comes first. The flush runs batch_fn(key, rows) in a worker
+thread, so the event loop keeps accepting requests while NumPy prices the batch, and hands every
+waiting request its own row of the result.
+"""
+# Longest time (seconds) a request waits for others to join its batch
+MAX_DELAY = 0.002
+
+# Rows per vectorized call, a full batch is flushed without waiting
+MAX_BATCH = 4096
+
+
+class MicroBatcher:
+    def __init__(
+            self,
+            batch_fn,  # callable(key, rows) -> sequence with one result per row, runs in a worker thread
+            max_batch: int = MAX_BATCH,
+            max_delay: float = MAX_DELAY
+    ):
+        self.batch_fn = batch_fn
+        self.max_batch = max_batch
+        self.max_delay = max_delay
+        self._pending = {}  # key -> (rows, futures, flush timer)
+        self.batches = 0
+        self.requests = 0
+
+    async def submit(self, key, row):
+        """
+        Queue one row under key and wait for its result from the batched call.
+        """
+        loop = asyncio.get_running_loop()
+        if key not in self._pending:
+            self._pending[key] = ([], [], loop.call_later(self.max_delay, self._flush, key))
+        rows, futures, _ = self._pending[key]
+
+        future = loop.create_future()
+        rows.append(row)
+        futures.append(future)
+        self.requests += 1
+        if len(rows) >= self.max_batch:
+            self._flush(key)
+        return await future
+
+    def _flush(self, key) -> None:
+        batch = self._pending.pop(key, None)
+        if batch is None:
+            return
+        rows, futures, timer = batch
+        timer.cancel()
+        self.batches += 1
+        asyncio.get_running_loop().create_task(self._run(key, rows, futures))
+
+    async def _run(self, key, rows: list, futures: list) -> None:
+        try:
+            results = await asyncio.to_thread(self.batch_fn, key, rows)
+        except Exception as e:
+            for future in futures:
+                if not future.done():
+                    future.set_exception(e)
+            return
+        for future, result in zip(futures, results):
+            if not future.done():  # the request may have been cancelled (client gone)
+                future.set_result(result)
+
+    def stats(self) -> dict:
+        return {
+            "requests": self.requests,
+            "batches": self.batches,
+            "mean_batch_size": self.requests / self.batches if self.batches else 0.0,
+        }
@@ -0,0 +1,284 @@
+import asyncio
+import json
+import math
+import os
+
+import numpy as np
+
+from option_valuation.batch_pricing import MODELS, TREE_MODELS, greeks_batch, price_batch
+from pricing_service.micro_batcher import MicroBatcher
+from utils.common_formulas import BS_vectorized_implied_volatility
+from utils.enums_option import EXERCISE_STYLE, IV_STATUS, OPTION_TYPE, PARAMETERS, TREE_METHOD
+
+"""
+Headless HTTP/JSON pricing service, a plain ASGI app over the batch pricing entry points.
+
+Serve it (bound to localhost unless PRICING_SERVICE_HOST says otherwise) with
+    python -m pricing_service.server
+or any ASGI server, e.g. uvicorn pricing_service.server:app --workers 4
+
+Endpoints (POST, JSON body keyed by PARAMETERS values plus option_model/ option_type/ option_price):
+    /price, /price/batch    - option_model, option_type, stock_price, strike_price, days_to_expiry,
+                              interest_rate, volatility, [dividend_yield, time_steps, exercise_style, tree_method]
+    /iv, /iv/batch          - option_type, option_price, stock_price, strike_price, days_to_expiry,
+                              interest_rate, [dividend_yield], Black-Scholes implied volatility
+    /greeks, /greeks/batch  - option_type, stock_price, strike_price, days_to_expiry, interest_rate,
+                              volatility, [dividend_yield, higher_order], Black-Scholes price and Greeks
+    GET /health             - liveness plus micro-batching counters
+Single endpoints take one contract and are micro-batched with concurrent requests (MicroBatcher).
+Batch endpoints take the same fields with any of the contract fields as (broadcasting) lists and
+price them in one vectorized call. Invalid requests get a 400 with {"error": message}.
+"""
+HOST = os.getenv("PRICING_SERVICE_HOST", "127.0.0.1")
+PORT = int(os.getenv("PRICING_SERVICE_PORT", "8000"))
+
+OPTION_MODEL_FIELD = "option_model"
+OPTION_TYPE_FIELD = "option_type"
+OPTION_PRICE_FIELD = "option_price"
+HIGHER_ORDER_FIELD = "higher_order"
+
+# Numeric contract fields of pricing/ greeks requests, implied volatility requests swap volatility for option_price
+CONTRACT_FIELDS = (
+    PARAMETERS.STOCK_PRICE.value,
+    PARAMETERS.STRIKE_PRICE.value,
+    PARAMETERS.DAYS_TO_EXPIRY.value,
+    PARAMETERS.INTEREST_RATE.value,
+    PARAMETERS.VOLATILITY.value,
+    PARAMETERS.DIVIDEND_YIELD.value,
+)
+IV_FIELDS = (OPTION_PRICE_FIELD, *(field for field in CONTRACT_FIELDS if field != PARAMETERS.VOLATILITY.value))
+# Fields every model needs strictly positive, rejected before pricing instead of returning null/ 0.0 prices
+POSITIVE_FIELDS = (
+    PARAMETERS.STOCK_PRICE.value,
+    PARAMETERS.STRIKE_PRICE.value,
+    PARAMETERS.DAYS_TO_EXPIRY.value,
+    PARAMETERS.VOLATILITY.value,
+)
+# Tree size bound (the app's limit), a tree is O(N^2) work on the shared worker threads
+MAX_TIME_STEPS = 1000
+OPTION_TYPES = (OPTION_TYPE.CALL.value, OPTION_TYPE.PUT.value)
+EXERCISE_STYLES = tuple(style.value for style in EXERCISE_STYLE)
+TREE_METHODS = tuple(method.value for method in TREE_METHOD)
+
+# Response label per IV_STATUS value (values are 0, 1, 2, ...)
+IV_STATUS_NAMES = np.array([status.name.lower() for status in sorted(IV_STATUS, key=lambda status: status.value)])
+
+
+class ServiceError(ValueError):
+    pass
+
+
+"""
+Vectorized calls behind the micro-batchers: rows are tuples of one contract's fields, key the settings
+shared by the batch. Each returns one result per row.
+"""
+def _price_rows(key: tuple, rows: list) -> list:
+    option_model, N, exercise_style, tree_method = key
+    option_type, *numeric = zip(*rows)
+    prices = price_batch(option_model, np.array(option_type), *numeric, N=N, exercise_style=exercise_style, tree_method=tree_method)
+    return prices.tolist()
+
+
+def _iv_rows(key: tuple, rows: list) -> list:
+    option_price, S, X, T, r, option_type, q = zip(*rows)
+    iv, status = BS_vectorized_implied_volatility(option_price, S, X, T, r, np.array(option_type), q)
+    return list(zip(iv.tolist(), status.tolist()))
+
+
+def _greeks_rows(key: tuple, rows: list) -> list:
+    (higher_order,) = key
+    option_type, *numeric = zip(*rows)
+    greeks = greeks_batch(np.array(option_type), *numeric, higher_order=higher_order)
+    return [dict(zip(greeks, values)) for values in zip(*(values.tolist() for values in greeks.values()))]
+
+
+price_batcher = MicroBatcher(_price_rows)
+iv_batcher = MicroBatcher(_iv_rows)
+greeks_batcher = MicroBatcher(_greeks_rows)
+
+
+async def price(payload: dict) -> dict:
+    key = _price_settings(payload)
+    row = (_option_type(payload), *_numbers(payload, CONTRACT_FIELDS))
+    return {"price": await price_batcher.submit(key, row)}
+
+
+async def price_many(payload: dict) -> dict:
+    option_model, N, exercise_style, tree_method = _price_settings(payload)
+    option_type = _option_type(payload, batch=True)
+    numeric = _numbers(payload, CONTRACT_FIELDS, batch=True)
+    prices = await asyncio.to_thread(
+        price_batch, option_model, option_type, *numeric, N=N, exercise_style=exercise_style, tree_method=tree_method
+    )
+    return {"prices": prices}
+
+
+async def implied_volatility(payload: dict) -> dict:
+    option_price, S, X, T, r, q = _numbers(payload, IV_FIELDS)
+    iv, status = await iv_batcher.submit((), (option_price, S, X, T, r, _option_type(payload), q))
+    return {"implied_volatility": iv, "status": IV_STATUS_NAMES[status]}
+
+
+async def implied_volatility_many(payload: dict) -> dict:
+    option_price, S, X, T, r, q = _numbers(payload, IV_FIELDS, batch=True)
+    option_type = _option_type(payload, batch=True)
+    iv, status = await asyncio.to_thread(BS_vectorized_implied_volatility, option_price, S, X, T, r, option_type, q)
+    return {"implied_volatility": iv, "status": IV_STATUS_NAMES[status]}
+
+
+async def greeks(payload: dict) -> dict:
+    row = (_option_type(payload), *_numbers(payload, CONTRACT_FIELDS))
+    return await greeks_batcher.submit((bool(payload.get(HIGHER_ORDER_FIELD, False)),), row)
+
+
+async def greeks_many(payload: dict) -> dict:
+    option_type = _option_type(payload, batch=True)
+    numeric = _numbers(payload, CONTRACT_FIELDS, batch=True)
+    return await asyncio.to_thread(greeks_batch, option_type, *numeric, higher_order=bool(payload.get(HIGHER_ORDER_FIELD, False)))
+
+
+async def health(payload: dict) -> dict:
+    return {
+        "status": "ok",
+        "price": price_batcher.stats(),
+        "iv": iv_batcher.stats(),
+        "greeks": greeks_batcher.stats(),
+    }
+
+
+ROUTES = {
+    ("POST", "/price"): price,
+    ("POST", "/price/batch"): price_many,
+    ("POST", "/iv"): implied_volatility,
+    ("POST", "/iv/batch"): implied_volatility_many,
+    ("POST", "/greeks"): greeks,
+    ("POST", "/greeks/batch"): greeks_many,
+    ("GET", "/health"): health,
+}
+
+
+async def app(scope, receive, send):
+    """
+    ASGI entry point.
+    """
+    if scope["type"] == "lifespan":
+        while True:
+            message = await receive()
+            if message["type"] == "lifespan.startup":
+                await send({"type": "lifespan.startup.complete"})
+            elif message["type"] == "lifespan.shutdown":
+                await send({"type": "lifespan.shutdown.complete"})
+                return
+    if scope["type"] != "http":
+        return
+
+    handler = ROUTES.get((scope["method"], scope["path"]))
+    if handler is None:
+        known_path = any(path == scope["path"] for _, path in ROUTES)
+        await _respond(send, 405 if known_path else 404, {"error": f"No route for {scope['method']} {scope['path']}"})
+        return
+
+    body = await _read_body(receive)
+    try:
+        payload = json.loads(body) if body else {}
+        if not isinstance(payload, dict):
+            raise ServiceError("Request body must be a JSON object.")
+        result = await handler(payload)
+    except (ValueError, TypeError) as e:  # includes ServiceError and invalid JSON
+        await _respond(send, 400, {"error": str(e)})
+        return
+    await _respond(send, 200, result)
+
+
+"""
+Helpers to read and validate request fields. Single requests are validated up front so one bad
+contract never fails the micro-batch it would have joined.
+"""
+def _numbers(payload: dict, fields: tuple, batch: bool = False) -> tuple:
+    values = []
+    for field in fields:
+        if field not in payload and field != PARAMETERS.DIVIDEND_YIELD.value:
+            raise ServiceError(f"Missing field: {field}")
+        value = payload.get(field, 0.0)
+        try:
+            value = np.asarray(value, dtype=float) if batch else float(value)
+        except (TypeError, ValueError):
+            raise ServiceError(f"Field {field} must be {'numeric (or a list of numbers)' if batch else 'a number'}.")
+        if not (np.all(np.isfinite(value)) if batch else math.isfinite(value)):
+            raise ServiceError(f"Field {field} must be finite.")
+        if field in POSITIVE_FIELDS and not (np.all(value > 0) if batch else value > 0):
+            raise ServiceError(f"Field {field} must be positive.")
+        values.append(value)
+    return tuple(values)
+
+
+def _option_type(payload: dict, batch: bool = False):
+    option_type = payload.get(OPTION_TYPE_FIELD)
+    if batch:
+        option_type = np.asarray(option_type)
+        if np.all(np.isin(option_type, OPTION_TYPES)):
+            return option_type
+    elif isinstance(option_type, str) and option_type in OPTION_TYPES:
+        return option_type
+    raise ServiceError(f"Field {OPTION_TYPE_FIELD} must be one of {list(OPTION_TYPES)}.")
+
+
+def _price_settings(payload: dict) -> tuple:
+    option_model = payload.get(OPTION_MODEL_FIELD)
+    exercise_style = payload.get(PARAMETERS.EXERCISE_STYLE.value, EXERCISE_STYLE.EUROPEAN.value)
+    tree_method = payload.get(PARAMETERS.TREE_METHOD.value, TREE_METHOD.CRR.value)
+    N = payload.get(PARAMETERS.TIME_STEPS.value, 100)
+
+    if option_model not in MODELS:
+        raise ServiceError(f"Field {OPTION_MODEL_FIELD} must be one of {list(MODELS)}.")
+    if exercise_style not in EXERCISE_STYLES:
+        raise ServiceError(f"Unsupported exercise style: {exercise_style}")
+    if exercise_style == EXERCISE_STYLE.AMERICAN.value and option_model not in TREE_MODELS:
+        raise ServiceError(f"American exercise is not supported by {option_model}")
+    if tree_method not in TREE_METHODS:
+        raise ServiceError(f"Unsupported tree method: {tree_method}")
+    if not isinstance(N, int) or isinstance(N, bool) or not 1 <= N <= MAX_TIME_STEPS:
+        raise ServiceError(f"Field {PARAMETERS.TIME_STEPS.value} must be an integer from 1 to {MAX_TIME_STEPS}.")
+    return option_model, N, exercise_style, tree_method
+
+
+async def _read_body(receive) -> bytes:
+    chunks = []
+    while True:
+        message = await receive()
+        chunks.append(message.get("body", b""))
+        if not message.get("more_body", False):
+            return b"".join(chunks)
+
+
+async def _respond(send, status: int, result: dict) -> None:
+    body = json.dumps(_jsonable(result), allow_nan=False).encode()
+    await send({
+        "type": "http.response.start",
+        "status": status,
+        "headers": [(b"content-type", b"application/json"), (b"content-length", str(len(body)).encode())],
+    })
+    await send({"type": "http.response.body", "body": body})
+
+
+def _jsonable(value):
+    """
+    NumPy arrays/ scalars to lists/ floats, NaN (unsolved implied volatility) to null.
+    """
+    if isinstance(value, dict):
+        return {key: _jsonable(item) for key, item in value.items()}
+    if isinstance(value, np.ndarray):
+        return _jsonable(value.tolist())
+    if isinstance(value, (list, tuple)):
+        return [_jsonable(item) for item in value]
+    if isinstance(value, (float, np.floating)):
+        return None if math.isnan(value) else float(value)
+    if isinstance(value, np.integer):
+        return int(value)
+    return value
+
+
+if __name__ == "__main__":
+    import uvicorn
+
+    uvicorn.run(app, host=HOST, port=PORT)
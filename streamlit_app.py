@@ -1,14 +1,51 @@
+from importlib import import_module
+
 import streamlit as st
 
-from app.pages.db_viewer.db_viewer import show_database
-from app.pages.option_valuation.binomial_tab import show_binomial_tab
-from app.pages.option_valuation.black_scholes_tab import show_black_scholes_tab
-from app.pages.option_valuation.simple_binomial_tab import show_simple_binomial_tab
 from db.sqlite.db_utils import init_db
 
+## ----------------------------------------------
+# Declarations
+# View label -> ("module:render function", session state key prefixes of its widgets)
+# View modules (and the plotting/ pricing stack behind them) are imported when the view is first opened
+VIEWS = {
+    "Black Scholes Model": ("app.pages.option_valuation.black_scholes_tab:show_black_scholes_tab", ("BSM_", "bsm_")),
+    "Binomial Model": ("app.pages.option_valuation.binomial_tab:show_binomial_tab", ("BM_", "bm_")),
+    "Trinomial Model": ("app.pages.option_valuation.trinomial_tab:show_trinomial_tab", ("TM_", "tm_")),
+    "Classic Binomial Model": ("app.pages.option_valuation.simple_binomial_tab:show_simple_binomial_tab", ("SBM_", "sbm_")),
+    "Scenario Analysis": ("app.pages.scenario_analysis.scenario_tab:show_scenario_tab", ("SCN_", "scn_")),
+    "Database Viewer": ("app.pages.db_viewer.db_viewer:show_database", ("DB_",)),
+}
+# Buttons hold no state worth keeping and cannot be set through session state
+BUTTON_KEYS = {"BSM_output", "BM_output", "TM_output", "SBM_output", "DB_prev", "DB_next"}
+## ----------------------------------------------
+
+# Create the tables once per server process instead of on every rerun
+@st.cache_resource(show_spinner=False)
+def init_db_once() -> None:
+    init_db()
+
+
+# Render function of a view, importing its module on first use (later calls hit sys.modules)
+def load_view(view: str):
+    module_name, function_name = VIEWS[view][0].split(":")
+    return getattr(import_module(module_name), function_name)
+
+
+# Streamlit drops the state of widgets that are not rendered in a run, re-assigning the keys of the
+# hidden views keeps their inputs for when the user switches back
+def keep_hidden_view_state(active_view: str) -> None:
+    hidden_prefixes = tuple(
+        prefix for view, (_, prefixes) in VIEWS.items() if view != active_view for prefix in prefixes
+    )
+    for key in list(st.session_state.keys()):
+        if key.startswith(hidden_prefixes) and key not in BUTTON_KEYS:
+            st.session_state[key] = st.session_state[key]
+
+
 ## ----------------------------------------------
 # Initialize db
-init_db()
+init_db_once()
 
 
 ## ----------------------------------------------
@@ -16,23 +53,13 @@ init_db()
 st.title("OptiML Option Valuation")
 st.divider()
 
-# Choosing valuation method
-st.write("Choose an option valuation model:")
-BSM_tab, BM_tab, SBM_tab, db_tab = st.tabs(
-    [ "Black Scholes Model", "Binomial Model", "Classic Binomial Model", "Database Viewer" ]
-)
-
-# BSM tab
-with BSM_tab:
-    show_black_scholes_tab()
-# BM tab
-with BM_tab:
-    show_binomial_tab()
-
-# BSM tab
-with SBM_tab:
-    show_simple_binomial_tab()
-
-# DB tab
-with db_tab:
-    show_database()
\ No newline at end of file
+# Choosing valuation method, only the selected view is rendered and computed
+view = st.segmented_control(
+    "Choose an option valuation model:",
+    list(VIEWS),
+    default=next(iter(VIEWS)),
+    key="view"
+) or next(iter(VIEWS))
+keep_hidden_view_state(view)
+
+load_view(view)()
@@ -0,0 +1,126 @@
+import datetime
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import pandas as pd
+import pytest
+
+from alpaca_api.bar_store import BarStore, _missing_ranges
+from alpaca_api.stocks import get_recent_stock_prices, get_single_current_price
+from db.sqlite.db_utils import close_connections
+
+
+class StubStockBarsClient:
+    """
+    Local stand-in for StockHistoricalDataClient: one bar per weekday in [start, end),
+    shaped like Alpaca's (symbol, timestamp) MultiIndex bars frame. Records every request.
+    """
+    def __init__(self):
+        self.requests = []
+
+    def get_stock_bars(self, req):
+        self.requests.append((req.symbol_or_symbols, req.start.date(), req.end.date()))
+        timestamps = pd.date_range(req.start, req.end, freq="B", inclusive="left", tz="UTC") + pd.Timedelta(hours=4)
+        close = [100.0 + ts.day for ts in timestamps]
+        df = pd.DataFrame(
+            {"open": close, "high": close, "low": close, "close": close, "volume": 1000.0},
+            index=pd.MultiIndex.from_product([[req.symbol_or_symbols], timestamps], names=["symbol", "timestamp"])
+        )
+        return SimpleNamespace(df=df)
+
+
+@pytest.fixture
+def store(tmp_path):
+    db_path = str(tmp_path / "bars.db")
+    yield BarStore(db_path, client=StubStockBarsClient())
+    close_connections(db_path)
+
+
+def test_get_bars_fetches_once_then_serves_locally(store):
+    start, end = datetime.date(2025, 7, 1), datetime.date(2025, 7, 31)
+    bars = store.get_bars("AAPL", start, end)
+
+    assert len(bars) == 23  # weekdays in July 2025
+    assert isinstance(bars.index, pd.DatetimeIndex)
+    assert list(bars.columns) == ["open", "high", "low", "close", "volume"]
+    assert bars["close"].iloc[-1] == 131.0
+
+    again = store.get_bars("AAPL", datetime.date(2025, 7, 7), datetime.date(2025, 7, 11))
+    assert store.api_calls == 1
+    assert len(again) == 5
+    assert store.coverage("AAPL") == [(start, end)]
+
+
+def test_incremental_refresh_only_fetches_missing_dates(store):
+    store.get_bars("AAPL", datetime.date(2025, 7, 10), datetime.date(2025, 7, 20))
+    bars = store.get_bars("AAPL", datetime.date(2025, 7, 1), datetime.date(2025, 7, 31))
+
+    assert store.client.requests == [
+        ("AAPL", datetime.date(2025, 7, 10), datetime.date(2025, 7, 21)),
+        ("AAPL", datetime.date(2025, 7, 1), datetime.date(2025, 7, 10)),
+        ("AAPL", datetime.date(2025, 7, 21), datetime.date(2025, 8, 1)),
+    ]
+    assert len(bars) == 23 and bars.index.is_unique
+    assert store.coverage("AAPL") == [(datetime.date(2025, 7, 1), datetime.date(2025, 7, 31))]
+
+    # other symbols are covered separately
+    store.get_bars("MSFT", datetime.date(2025, 7, 1), datetime.date(2025, 7, 31))
+    assert store.api_calls == 4
+
+
+def test_today_is_always_refetched(store):
+    today = datetime.date.today()
+    store.get_bars("AAPL", today - datetime.timedelta(days=10), today)
+    store.get_bars("AAPL", today - datetime.timedelta(days=10), today)
+
+    assert store.api_calls == 2
+    assert store.client.requests[-1][1] == today
+    assert store.coverage("AAPL")[-1][1] == today - datetime.timedelta(days=1)
+
+
+def test_separate_ranges_stay_covered(store):
+    store.get_bars("AAPL", datetime.date(2025, 7, 1), datetime.date(2025, 7, 10))
+    store.get_bars("AAPL", datetime.date(2025, 7, 20), datetime.date(2025, 7, 31))
+    assert store.coverage("AAPL") == [
+        (datetime.date(2025, 7, 1), datetime.date(2025, 7, 10)),
+        (datetime.date(2025, 7, 20), datetime.date(2025, 7, 31)),
+    ]
+
+    # both ranges are served from disk, a request across them only fetches the gap
+    store.get_bars("AAPL", datetime.date(2025, 7, 2), datetime.date(2025, 7, 9))
+    bars = store.get_bars("AAPL", datetime.date(2025, 7, 1), datetime.date(2025, 7, 31))
+    assert store.client.requests[-1] == ("AAPL", datetime.date(2025, 7, 11), datetime.date(2025, 7, 20))
+    assert store.api_calls == 3
+    assert len(bars) == 23 and bars.index.is_unique
+    assert store.coverage("AAPL") == [(datetime.date(2025, 7, 1), datetime.date(2025, 7, 31))]
+
+
+def test_missing_ranges():
+    covered = [(datetime.date(2025, 7, 10), datetime.date(2025, 7, 20))]
+    assert _missing_ranges(datetime.date(2025, 7, 12), datetime.date(2025, 7, 15), covered) == []
+    assert _missing_ranges(datetime.date(2025, 7, 1), datetime.date(2025, 7, 5), covered) == [
+        (datetime.date(2025, 7, 1), datetime.date(2025, 7, 5))
+    ]
+    assert _missing_ranges(datetime.date(2025, 7, 15), datetime.date(2025, 7, 25), covered) == [
+        (datetime.date(2025, 7, 21), datetime.date(2025, 7, 25))
+    ]
+    assert _missing_ranges(datetime.date(2025, 7, 1), datetime.date(2025, 7, 5), []) == [
+        (datetime.date(2025, 7, 1), datetime.date(2025, 7, 5))
+    ]
+    covered.append((datetime.date(2025, 7, 25), datetime.date(2025, 7, 28)))
+    assert _missing_ranges(datetime.date(2025, 7, 5), datetime.date(2025, 7, 31), covered) == [
+        (datetime.date(2025, 7, 5), datetime.date(2025, 7, 9)),
+        (datetime.date(2025, 7, 21), datetime.date(2025, 7, 24)),
+        (datetime.date(2025, 7, 29), datetime.date(2025, 7, 31)),
+    ]
+
+
+@patch("alpaca_api.stocks.StockHistoricalDataClient")
+def test_stock_functions_read_through_store(mock_StockHistoricalDataClient, store):
+    prices = get_recent_stock_prices("AAPL", datetime.date(2025, 7, 1), datetime.date(2025, 7, 31), store=store)
+    last = get_single_current_price("AAPL", datetime.date(2025, 7, 1), datetime.datetime(2025, 7, 31), store=store)
+
+    assert isinstance(prices, pd.Series) and isinstance(prices.index, pd.DatetimeIndex)
+    assert last == prices.iloc[-1] == 131.0
+    assert store.api_calls == 1
+    mock_StockHistoricalDataClient.assert_not_called()
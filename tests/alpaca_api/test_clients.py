@@ -0,0 +1,143 @@
+import datetime
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+import pandas as pd
+import pytest
+
+from alpaca_api.bar_store import BarStore
+from alpaca_api.bulk_fetch import fetch_option_chains, fetch_stock_bars
+from alpaca_api.clients import RateLimiter, ThrottledClient, clear_clients, get_client
+from db.sqlite.db_utils import close_connections
+
+
+@pytest.fixture(autouse=True)
+def fresh_registry():
+    clear_clients()
+    yield
+    clear_clients()
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+        self.sleeps = []
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+class RateLimitedError(Exception):
+    status_code = 429
+
+
+def test_get_client_reuses_one_client_per_class_and_key():
+    client_cls = MagicMock()
+    first = get_client(client_cls, "key", "secret")
+    assert get_client(client_cls, "key", "secret") is first
+    assert get_client(client_cls, "other", "secret") is not first
+    assert client_cls.call_count == 2
+
+    clear_clients()
+    assert get_client(client_cls, "key", "secret") is not first
+
+
+def test_rate_limiter_blocks_beyond_budget():
+    clock = FakeClock()
+    limiter = RateLimiter(max_calls=5, period=1.0, clock=clock, sleep=clock.sleep)
+    for _ in range(5):
+        limiter.acquire()
+    assert clock.sleeps == []
+
+    for _ in range(5):
+        limiter.acquire()
+    # 5 further calls need 5 refilled tokens at 5 per second
+    assert clock.now == pytest.approx(1.0)
+
+
+def test_throttled_client_rate_limits_without_retrying():
+    clock = FakeClock()
+    inner = MagicMock()
+    inner.get_stock_bars.return_value = "bars"
+    client = ThrottledClient(inner, RateLimiter(max_calls=1, period=1.0, clock=clock, sleep=clock.sleep))
+
+    assert client.get_stock_bars("req") == "bars"
+    assert client.get_stock_bars("req") == "bars"
+    assert clock.sleeps == [pytest.approx(1.0)]
+
+    # 429s are retried inside alpaca-py's RESTClient, the wrapper passes errors straight through
+    inner.get_option_chain.side_effect = RateLimitedError()
+    with pytest.raises(RateLimitedError):
+        client.get_option_chain("req")
+    assert inner.get_option_chain.call_count == 1
+
+
+@patch("alpaca_api.bulk_fetch.SYMBOLS_PER_REQUEST", 2)
+@patch("alpaca_api.bulk_fetch.StockHistoricalDataClient")
+def test_fetch_stock_bars_groups_symbols_per_request(mock_client_cls):
+    def get_stock_bars(req):
+        timestamps = pd.date_range("2025-07-01", periods=3, freq="D", tz="UTC")
+        index = pd.MultiIndex.from_product([req.symbol_or_symbols, timestamps], names=["symbol", "timestamp"])
+        return SimpleNamespace(df=pd.DataFrame({"close": range(len(index))}, index=index, dtype=float))
+    mock_client_cls.return_value.get_stock_bars.side_effect = get_stock_bars
+
+    symbols = ["AAPL", "MSFT", "NVDA", "AAPL"]
+    results, errors = fetch_stock_bars(symbols, datetime.date(2025, 7, 1), datetime.date(2025, 7, 3))
+
+    assert errors == {}
+    assert sorted(results) == ["AAPL", "MSFT", "NVDA"]
+    assert all(len(bars) == 3 and isinstance(bars.index, pd.DatetimeIndex) for bars in results.values())
+    assert mock_client_cls.call_count == 1  # one shared client
+    assert mock_client_cls.return_value.get_stock_bars.call_count == 2
+
+
+@patch("alpaca_api.bulk_fetch.OptionHistoricalDataClient")
+def test_fetch_option_chains_collects_errors_per_symbol(mock_client_cls):
+    def get_option_chain(req):
+        if req.underlying_symbol == "BAD":
+            raise ValueError("unknown symbol")
+        return {f"{req.underlying_symbol}250829C00170000": MagicMock()}
+    mock_client_cls.return_value.get_option_chain.side_effect = get_option_chain
+
+    results, errors = fetch_option_chains(["AAPL", "BAD", "MSFT"], type="call")
+
+    assert sorted(results) == ["AAPL", "MSFT"]
+    assert list(results["AAPL"]) == ["AAPL250829C00170000"]
+    assert isinstance(errors["BAD"], ValueError)
+
+
+def test_fetch_stock_bars_reads_through_store():
+    store = MagicMock()
+    store.get_bars.side_effect = lambda symbol, *args: symbol
+    results, errors = fetch_stock_bars(["AAPL", "MSFT"], datetime.date(2025, 7, 1), datetime.date(2025, 7, 3), store=store)
+    assert results == {"AAPL": "AAPL", "MSFT": "MSFT"} and errors == {}
+
+
+def weekday_bars(req):
+    """One bar per weekday in [req.start, req.end) and symbol, like Alpaca's exclusive end."""
+    symbols = req.symbol_or_symbols if isinstance(req.symbol_or_symbols, list) else [req.symbol_or_symbols]
+    timestamps = pd.date_range(req.start, req.end, freq="B", inclusive="left", tz="UTC") + pd.Timedelta(hours=4)
+    index = pd.MultiIndex.from_product([symbols, timestamps], names=["symbol", "timestamp"])
+    return SimpleNamespace(df=pd.DataFrame(
+        {"open": 1.0, "high": 1.0, "low": 1.0, "close": range(len(index)), "volume": 1.0}, index=index, dtype=float
+    ))
+
+
+@patch("alpaca_api.bulk_fetch.StockHistoricalDataClient")
+def test_fetch_stock_bars_end_inclusive_with_and_without_store(mock_client_cls, tmp_path):
+    mock_client_cls.return_value.get_stock_bars.side_effect = weekday_bars
+    start, end = datetime.date(2025, 7, 1), datetime.date(2025, 7, 31)
+    direct, _ = fetch_stock_bars(["AAPL", "MSFT"], start, end)
+
+    db_path = str(tmp_path / "bars.db")
+    store = BarStore(db_path, client=SimpleNamespace(get_stock_bars=weekday_bars))
+    stored, _ = fetch_stock_bars(["AAPL", "MSFT"], start, end, store=store, max_workers=1)
+    close_connections(db_path)
+
+    for symbol in ("AAPL", "MSFT"):
+        assert len(direct[symbol]) == len(stored[symbol]) == 23  # weekdays in July 2025, the 31st included
+        assert direct[symbol].index.equals(stored[symbol].index)
@@ -0,0 +1,164 @@
+import datetime
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from alpaca_api import iv_surface
+from alpaca_api.clients import clear_clients
+from alpaca_api.iv_surface import build_iv_surface, get_iv_surface, surface_from_quotes
+from alpaca_api.options import _surface_IV, get_specific_contract_IV
+from option_valuation.batch_pricing import price_batch
+from utils.enums_option import OPTION_MODEL, OPTION_TYPE
+
+AS_OF = datetime.date(2025, 8, 1)
+SPOT = 100.0
+R = 0.04
+
+
+def smile(moneyness, days):
+    return 0.2 + 0.3 * (moneyness - 1) ** 2 + 0.02 * days / 365
+
+
+def make_chain(snapshot_iv_every: int = 2, as_of: datetime.date = AS_OF) -> pd.DataFrame:
+    """Calls and puts priced off smile(), every snapshot_iv_every-th contract carries its snapshot IV."""
+    rows = []
+    for days in (30, 90, 180):
+        expiry = as_of + datetime.timedelta(days=days)
+        for strike in range(70, 135, 5):
+            for flag, option_type in (("C", OPTION_TYPE.CALL.value), ("P", OPTION_TYPE.PUT.value)):
+                sigma = smile(strike / SPOT, days)
+                price = float(price_batch(OPTION_MODEL.BLACK_SCHOLES_MODEL.value, option_type, SPOT, strike, days, R, sigma))
+                snapshot_iv = sigma if len(rows) % snapshot_iv_every == 0 else np.nan
+                rows.append((f"AAPL{expiry:%y%m%d}{flag}{strike * 1000:08d}", snapshot_iv, price, price, np.nan))
+    return pd.DataFrame(rows, columns=iv_surface.QUOTE_COLUMNS)
+
+
+def test_surface_recovers_quoted_smile():
+    surface = surface_from_quotes("AAPL", SPOT, make_chain(), r=R, as_of=AS_OF)
+
+    strikes = np.array([80.0, 95.0, 100.0, 120.0])
+    for days in (30, 90, 180):
+        np.testing.assert_allclose(surface.iv(strikes, days), smile(strikes / SPOT, days), atol=1e-6)
+
+    # grid is (moneyness x tenor), flat volatility before the first and after the last expiry
+    frame = surface.to_frame()
+    assert frame.shape == (iv_surface.MONEYNESS_GRID.size, iv_surface.TENOR_GRID.size)
+    np.testing.assert_allclose(frame[7], frame[30])
+    np.testing.assert_allclose(frame[365], frame[180])
+
+
+def test_surface_interpolates_in_total_variance():
+    surface = surface_from_quotes("AAPL", SPOT, make_chain(), r=R, as_of=AS_OF)
+    v30, v90 = smile(1.0, 30), smile(1.0, 90)
+    expected = np.sqrt((v30**2 * 30 * 30 + v90**2 * 90 * 30) / 60 / 60)
+    assert surface.iv(100.0, 60) == pytest.approx(expected, abs=1e-6)
+    assert surface.iv(100.0, 60, S=200.0) == pytest.approx(surface.iv(50.0, 60), abs=1e-12)
+
+
+def test_surface_without_usable_quotes_raises():
+    quotes = pd.DataFrame([("AAPL250829C00170000", np.nan, np.nan, np.nan, np.nan)], columns=iv_surface.QUOTE_COLUMNS)
+    with pytest.raises(ValueError):
+        surface_from_quotes("AAPL", SPOT, quotes, r=R, as_of=AS_OF)
+
+
+def make_snapshots(as_of: datetime.date = AS_OF) -> dict:
+    """make_chain as the {OCC symbol: snapshot} dict get_option_chain returns, every snapshot with its IV."""
+    chain = {}
+    for occ_symbol, snapshot_iv, bid, ask, _ in make_chain(snapshot_iv_every=1, as_of=as_of).itertuples(index=False):
+        chain[occ_symbol] = SimpleNamespace(
+            implied_volatility=snapshot_iv,
+            latest_quote=SimpleNamespace(bid_price=bid, ask_price=ask),
+            latest_trade=None,
+        )
+    return chain
+
+
+@patch("alpaca_api.iv_surface.get_single_current_price", return_value=SPOT)
+@patch("alpaca_api.iv_surface.OptionHistoricalDataClient")
+def test_build_iv_surface_pulls_chain_once(mock_client_cls, mock_price):
+    clear_clients()
+    mock_client_cls.return_value.get_option_chain.return_value = make_snapshots()
+
+    surface = build_iv_surface("AAPL", as_of=AS_OF)
+
+    assert mock_client_cls.return_value.get_option_chain.call_count == 1
+    assert mock_price.call_count == 1
+    assert surface.iv(110.0, 90) == pytest.approx(smile(1.1, 90), abs=1e-12)
+    clear_clients()
+
+
+@patch("alpaca_api.iv_surface.build_iv_surface")
+def test_get_iv_surface_caches_until_stale(mock_build):
+    mock_build.side_effect = lambda symbol: MagicMock(symbol=symbol)
+    clock = MagicMock(return_value=0.0)
+    iv_surface._surfaces.clear()
+
+    first = get_iv_surface("AAPL", max_age_seconds=60, clock=clock)
+    assert get_iv_surface("AAPL", max_age_seconds=60, clock=clock) is first
+    clock.return_value = 61.0
+    assert get_iv_surface("AAPL", max_age_seconds=60, clock=clock) is not first
+    assert mock_build.call_count == 2
+    iv_surface._surfaces.clear()
+
+
+@patch("alpaca_api.iv_surface.build_iv_surface")
+def test_get_iv_surface_caches_failed_builds(mock_build):
+    mock_build.side_effect = iv_surface.NoQuotesError("no quotes")
+    clock = MagicMock(return_value=0.0)
+    iv_surface._surfaces.clear()
+
+    for _ in range(2):
+        with pytest.raises(iv_surface.NoQuotesError):
+            get_iv_surface("AAPL", max_age_seconds=60, clock=clock)
+    assert mock_build.call_count == 1
+    clock.return_value = 61.0
+    with pytest.raises(iv_surface.NoQuotesError):
+        get_iv_surface("AAPL", max_age_seconds=60, clock=clock)
+    assert mock_build.call_count == 2
+
+    # anything else is a bug, neither cached nor swallowed by the contract IV lookup
+    mock_build.side_effect = TypeError("bug")
+    iv_surface._surfaces.clear()
+    with pytest.raises(TypeError):
+        _surface_IV("AAPL", 100.0, 30)
+    assert "AAPL" not in iv_surface._surfaces
+    iv_surface._surfaces.clear()
+
+
+@patch("alpaca_api.iv_surface.get_iv_surface")
+def test_surface_IV_only_inside_the_grid(mock_get):
+    mock_get.return_value = surface_from_quotes("AAPL", SPOT, make_chain(), r=R, as_of=AS_OF)
+    assert _surface_IV("AAPL", 110.0, 90) == pytest.approx(smile(1.1, 90), abs=1e-6)
+    assert _surface_IV("AAPL", 150.0, 90) is None  # moneyness beyond MONEYNESS_GRID
+    assert _surface_IV("AAPL", 60.0, 90) is None
+    assert _surface_IV("AAPL", 100.0, 400) is None  # beyond the last tenor
+
+    mock_get.side_effect = iv_surface.NoQuotesError("no quotes")
+    assert _surface_IV("AAPL", 100.0, 90) is None
+
+
+@patch("alpaca_api.iv_surface.get_single_current_price", return_value=SPOT)
+@patch("alpaca_api.iv_surface.OptionHistoricalDataClient")
+def test_contract_IV_reads_cached_surface(mock_client_cls, mock_price):
+    clear_clients()
+    iv_surface._surfaces.clear()
+    today = datetime.date.today()
+    mock_client_cls.return_value.get_option_chain.return_value = make_snapshots(as_of=today)
+
+    for X in (90.0, 110.0):
+        iv = get_specific_contract_IV(
+            symbol="AAPL",
+            option_type=OPTION_TYPE.CALL.value,
+            X=X,
+            expiry_start=today + datetime.timedelta(days=85),
+            expiry_end=today + datetime.timedelta(days=95),
+            expiry_window=90
+        )
+        assert iv == pytest.approx(smile(X / SPOT, 90), abs=1e-12)
+    # two contracts on one underlying, one chain pull
+    assert mock_client_cls.return_value.get_option_chain.call_count == 1
+    clear_clients()
+    iv_surface._surfaces.clear()
@@ -4,7 +4,7 @@ import pytest
 from unittest.mock import patch, MagicMock
 from alpaca.trading.enums import ContractType
 
-from alpaca_api.options import parse_occ_symbol, get_specific_contract_IV
+from alpaca_api.options import parse_occ_symbol, parse_occ_symbols, get_specific_contract_IV
 
 
 def test_parse_occ_symbol_call_put():
@@ -20,8 +20,46 @@ def test_parse_occ_symbol_call_put():
     assert parsed["type"] == "PUT"
 
 
+def test_parse_occ_symbol_digits_in_underlying_and_late_years():
+    parsed = parse_occ_symbol("AAPL1300117P00012500")
+    assert parsed["underlying"] == "AAPL1"
+    assert parsed["expiration_date"] == datetime.date(2030, 1, 17)
+    assert parsed["type"] == "PUT"
+    assert parsed["strike_price"] == 12.5
+
+    assert parse_occ_symbol("F     251219C00012000")["underlying"] == "F"
+
+
+def test_parse_occ_symbols_matches_scalar_parser():
+    symbols = [
+        "AAPL250829C00170000",
+        "AAPL1300117P00012500",
+        "SPY251231P00600500",
+        "F     251219C00012000",
+        "BRKB991231C12345678",
+    ]
+    parsed = parse_occ_symbols(symbols)
+    assert list(parsed.columns) == ["underlying", "expiration_date", "type", "strike_price"]
+    for row, symbol in zip(parsed.itertuples(index=False), symbols):
+        expected = parse_occ_symbol(symbol)
+        assert row.underlying == expected["underlying"]
+        assert row.expiration_date.date() == expected["expiration_date"]
+        assert row.type == expected["type"]
+        assert row.strike_price == expected["strike_price"]
+
+    assert parse_occ_symbols([]).empty
+    for bad in (["AAPL250829X00170000"], ["AAPL251329C00170000"], ["C00170000"], ["AAPL250231C00150000"]):
+        with pytest.raises(ValueError):
+            parse_occ_symbols(bad)
+    # day beyond the month's end is rejected by both parsers
+    with pytest.raises(ValueError):
+        parse_occ_symbol("AAPL250231C00150000")
+    assert parse_occ_symbols(["AAPL240229C00150000"])["expiration_date"][0].date() == datetime.date(2024, 2, 29)
+
+
+@patch("alpaca_api.options._surface_IV", return_value=None)
 @patch("alpaca_api.options.OptionHistoricalDataClient")
-def test_get_specific_contract_IV_direct_iv(mock_client_cls):
+def test_get_specific_contract_IV_direct_iv(mock_client_cls, mock_surface):
     mock_client = MagicMock()
     mock_client_cls.return_value = mock_client
 
@@ -43,11 +81,12 @@ def test_get_specific_contract_IV_direct_iv(mock_client_cls):
     assert result == 0.25
 
 
+@patch("alpaca_api.options._surface_IV", return_value=None)
 @patch("alpaca_api.options.get_single_current_price", return_value=100.0)
 @patch("alpaca_api.options.BS_brent_implied_volatility", return_value=0.42)
 @patch("alpaca_api.options.get_risk_free_rate", return_value=0.01)
 @patch("alpaca_api.options.OptionHistoricalDataClient")
-def test_get_specific_contract_IV_bsm_fallback(mock_client_cls, mock_rfr, mock_bs, mock_price):
+def test_get_specific_contract_IV_bsm_fallback(mock_client_cls, mock_rfr, mock_bs, mock_price, mock_surface):
     mock_client = MagicMock()
     mock_client_cls.return_value = mock_client
 
@@ -72,11 +111,12 @@ def test_get_specific_contract_IV_bsm_fallback(mock_client_cls, mock_rfr, mock_b
     assert result == 0.42
 
 
+@patch("alpaca_api.options._surface_IV", return_value=None)
 @patch("alpaca_api.options.annualized_volatility", return_value=0.30)
 @patch("alpaca_api.options.price_sampling_adjustment")
 @patch("alpaca_api.options.get_recent_stock_prices")
 @patch("alpaca_api.options.OptionHistoricalDataClient")
-def test_get_specific_contract_IV_hist_fallback(mock_client_cls, mock_prices, mock_adjust, mock_annvol):
+def test_get_specific_contract_IV_hist_fallback(mock_client_cls, mock_prices, mock_adjust, mock_annvol, mock_surface):
     mock_client = MagicMock()
     mock_client_cls.return_value = mock_client
 
@@ -100,8 +140,9 @@ def test_get_specific_contract_IV_hist_fallback(mock_client_cls, mock_prices, mo
     assert result == 0.30
 
 
+@patch("alpaca_api.options._surface_IV", return_value=None)
 @patch("alpaca_api.options.OptionHistoricalDataClient", side_effect=Exception("API failure"))
-def test_get_specific_contract_IV_exception(mock_client_cls):
+def test_get_specific_contract_IV_exception(mock_client_cls, mock_surface):
     with pytest.raises(Exception) as excinfo:
         get_specific_contract_IV(
             symbol="AAPL",
@@ -116,6 +157,8 @@ def test_get_specific_contract_IV_exception(mock_client_cls):
 
 # Call all tests
 test_parse_occ_symbol_call_put()
+test_parse_occ_symbol_digits_in_underlying_and_late_years()
+test_parse_occ_symbols_matches_scalar_parser()
 test_get_specific_contract_IV_direct_iv()
 test_get_specific_contract_IV_bsm_fallback()
 test_get_specific_contract_IV_hist_fallback()
@@ -2,8 +2,15 @@ import numpy as np
 import pytest
 import pandas as pd
 
-from utils.common_formulas import annualized_volatility, price_sampling_adjustment
+from option_valuation.batch_pricing import price_batch
+from utils.common_formulas import (
+    annualized_volatility,
+    BS_brent_implied_volatility,
+    BS_vectorized_implied_volatility,
+    price_sampling_adjustment,
+)
 from utils.enums_market import SAMPLING_FREQ
+from utils.enums_option import IV_STATUS, OPTION_MODEL, OPTION_TYPE
 
 # Helper to create sample price ranges
 def create_sample_price_series():
@@ -72,6 +79,46 @@ def test_annualized_volatility_invalid_freq():
         annualized_volatility(prices, 'invalid_freq')
 
 
+"""
+Tests for BS_vectorized_implied_volatility
+"""
+# Test vectorized IV recovers the volatility used to price a mixed chain
+def test_vectorized_implied_volatility_round_trip():
+    rng = np.random.default_rng(0)
+    n = 500
+    option_type = rng.choice([OPTION_TYPE.CALL.value, OPTION_TYPE.PUT.value], n)
+    S = rng.uniform(80, 120, n)
+    X = rng.uniform(70, 130, n)
+    T = rng.integers(7, 730, n)
+    r = rng.uniform(0.0, 0.06, n)
+    q = rng.uniform(0.0, 0.02, n)
+    sigma = rng.uniform(0.05, 1.5, n)
+    prices = price_batch(OPTION_MODEL.BLACK_SCHOLES_MODEL.value, option_type, S, X, T, r, sigma, q)
+
+    iv, status = BS_vectorized_implied_volatility(prices, S, X, T, r, option_type, q)
+    solved = np.isin(status, [IV_STATUS.CONVERGED.value, IV_STATUS.BISECTION.value])
+    assert solved.mean() > 0.95  # the rest are deep ITM puts priced below intrinsic
+    np.testing.assert_allclose(iv[solved], sigma[solved], atol=1e-6)
+
+# Test vectorized IV agrees with the scalar brent solver, including its edge cases
+def test_vectorized_implied_volatility_matches_brent():
+    cases = [
+        (10.4506, 100, 100, 365, 0.05, OPTION_TYPE.CALL.value),
+        (5.5735, 100, 100, 365, 0.05, OPTION_TYPE.PUT.value),
+        (2.0, 100, 120, 90, 0.03, OPTION_TYPE.CALL.value),
+        (0.5, 100, 80, 30, 0.02, OPTION_TYPE.PUT.value),
+        (1.0, 100, 90, 30, 0.02, OPTION_TYPE.CALL.value),  # below intrinsic
+        (150.0, 100, 90, 30, 0.02, OPTION_TYPE.CALL.value),  # above stock price, no solution
+    ]
+    iv, status = BS_vectorized_implied_volatility(*map(np.array, zip(*cases)))
+    for i, case in enumerate(cases):
+        expected = BS_brent_implied_volatility(*case)
+        if expected is None:
+            assert np.isnan(iv[i]) and status[i] == IV_STATUS.FAILED.value
+        else:
+            assert abs(iv[i] - expected) < 1e-6
+    assert status[4] == IV_STATUS.INTRINSIC.value
+
 
 if __name__ == "__main__":
     test_price_sampling_adjustment_daily()
@@ -81,4 +128,6 @@ if __name__ == "__main__":
     test_price_sampling_adjustment_invalid_index()
     test_annualized_volatility_valid()
     test_annualized_volatility_invalid_freq()
+    test_vectorized_implied_volatility_round_trip()
+    test_vectorized_implied_volatility_matches_brent()
     print("All tests passed!")
@@ -0,0 +1,90 @@
+import math
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from utils.common_formulas import annualized_volatility
+from utils.enums_market import SAMPLING_FREQ, VOL_ESTIMATOR
+from utils.volatility_estimators import (
+    CloseToCloseVolatility,
+    EWMAVolatility,
+    GarmanKlassVolatility,
+    ParkinsonVolatility,
+    StreamingVolatility,
+    YangZhangVolatility,
+    rolling_volatility,
+)
+
+
+# Helper to create a random OHLC bar history (GBM closes with gaps and intraday ranges)
+def create_sample_bars(n: int = 120, sigma: float = 0.25, seed: int = 7) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    daily_sigma = sigma / np.sqrt(252)
+    close = 100 * np.exp(np.cumsum(rng.normal(0, daily_sigma, n)))
+    open_ = np.r_[100, close[:-1]] * np.exp(rng.normal(0, daily_sigma / 3, n))
+    high = np.maximum(open_, close) * np.exp(np.abs(rng.normal(0, daily_sigma / 2, n)))
+    low = np.minimum(open_, close) * np.exp(-np.abs(rng.normal(0, daily_sigma / 2, n)))
+    dates = pd.date_range(start="2024-01-01", periods=n, freq="B")
+    return pd.DataFrame({"open": open_, "high": high, "low": low, "close": close}, index=dates)
+
+
+@pytest.mark.parametrize(
+    "estimator, streaming",
+    [
+        (VOL_ESTIMATOR.CLOSE_TO_CLOSE.value, lambda: CloseToCloseVolatility(window=20)),
+        (VOL_ESTIMATOR.EWMA.value, lambda: EWMAVolatility(lam=0.94)),
+        (VOL_ESTIMATOR.PARKINSON.value, lambda: ParkinsonVolatility(window=20)),
+        (VOL_ESTIMATOR.GARMAN_KLASS.value, lambda: GarmanKlassVolatility(window=20)),
+        (VOL_ESTIMATOR.YANG_ZHANG.value, lambda: YangZhangVolatility(window=20)),
+    ]
+)
+def test_streaming_matches_rolling_series(estimator, streaming):
+    bars = create_sample_bars()
+    series = rolling_volatility(bars, estimator, window=20)
+    model = streaming()
+    streamed = [model.update(bar.close, bar.open, bar.high, bar.low) for bar in bars.itertuples()]
+
+    assert series.index.equals(bars.index)
+    np.testing.assert_allclose(streamed, series.to_numpy(), rtol=1e-9, equal_nan=True)
+    assert series.notna().sum() > 90
+    # all estimators land near the volatility the bars were generated with
+    assert 0.1 < series.iloc[-1] < 0.5
+
+
+def test_expanding_close_to_close_matches_annualized_volatility():
+    bars = create_sample_bars()
+    model = CloseToCloseVolatility(sampling_freq=SAMPLING_FREQ.WEEKLY.value)
+    for close in bars["close"]:
+        vol = model.update(close)
+    expected = annualized_volatility(bars["close"], SAMPLING_FREQ.WEEKLY.value)
+    assert vol == pytest.approx(expected, rel=1e-12)
+    assert rolling_volatility(bars["close"], window=None, sampling_freq=SAMPLING_FREQ.WEEKLY.value).iloc[-1] == pytest.approx(expected, rel=1e-12)
+
+
+def test_parkinson_constant_range():
+    # every bar spans e^0.02, so per bar variance is 0.02^2 / (4 ln 2)
+    model = ParkinsonVolatility(window=5)
+    for _ in range(5):
+        vol = model.update(close=100.0, open=100.0, high=100.0 * math.exp(0.01), low=100.0 * math.exp(-0.01))
+    assert vol == pytest.approx(math.sqrt(0.02**2 / (4 * math.log(2)) * 252))
+
+
+def test_window_not_full_gives_nan():
+    model = CloseToCloseVolatility(window=5)
+    assert math.isnan(model.update(100.0))
+    assert math.isnan(model.update(101.0))
+
+
+def test_invalid_inputs():
+    bars = create_sample_bars(n=10)
+    with pytest.raises(ValueError):
+        rolling_volatility(bars, "invalid_estimator")
+    with pytest.raises(ValueError):
+        rolling_volatility(bars, sampling_freq="invalid_freq")
+    with pytest.raises(ValueError):
+        CloseToCloseVolatility(sampling_freq="invalid_freq")
+    with pytest.raises(ValueError):
+        YangZhangVolatility(window=1)
+    with pytest.raises(TypeError):
+        StreamingVolatility()
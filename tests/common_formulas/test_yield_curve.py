@@ -0,0 +1,65 @@
+import numpy as np
+import pytest
+
+from utils.common_formulas import get_risk_free_rate
+from utils.enums_market import CURVE_INTERPOLATION
+from utils.yield_curve import DEFAULT_ZERO_RATES, YieldCurve
+
+MATURITIES = [0.25, 0.5, 1.0, 2.0, 5.0]
+RATES = [0.0415, 0.0420, 0.0430, 0.0450, 0.0480]
+
+
+@pytest.mark.parametrize("interpolation", [method.value for method in CURVE_INTERPOLATION])
+def test_curve_reprices_tenors_and_is_flat_beyond(interpolation):
+    curve = YieldCurve(MATURITIES, RATES, interpolation)
+    np.testing.assert_allclose(curve.zero_rate(MATURITIES), RATES, rtol=1e-12)
+    assert curve.zero_rate(0.01) == pytest.approx(RATES[0])
+    assert curve.zero_rate(30.0) == pytest.approx(RATES[-1])
+
+    # continuous in maturity, no snapping to the nearest tenor
+    t = np.linspace(0.01, 10, 2001)
+    assert np.max(np.abs(np.diff(curve.zero_rate(t)))) < 1e-4
+    assert curve.zero_rate(t).shape == t.shape
+
+
+def test_interpolation_methods():
+    linear = YieldCurve(MATURITIES, RATES, CURVE_INTERPOLATION.LINEAR_ZERO.value)
+    assert linear.zero_rate(1.5) == pytest.approx(0.0440)
+
+    log_discount = YieldCurve(MATURITIES, RATES, CURVE_INTERPOLATION.LOG_DISCOUNT.value)
+    # flat forward between 1y and 2y
+    forward = (0.0450 * 2 - 0.0430 * 1) / 1
+    assert log_discount.forward_rate(1.0, 1.5) == pytest.approx(forward)
+    assert log_discount.forward_rate(1.2, 1.8) == pytest.approx(forward)
+
+    cubic = YieldCurve(MATURITIES, RATES, CURVE_INTERPOLATION.MONOTONE_CUBIC.value)
+    t = np.linspace(0.25, 5.0, 500)
+    assert np.all(np.diff(cubic.zero_rate(t)) >= -1e-15)  # monotone data stays monotone
+
+    with pytest.raises(ValueError):
+        YieldCurve(MATURITIES, RATES, "unknown")
+    with pytest.raises(ValueError):
+        YieldCurve([1.0, 0.5], [0.04, 0.04])
+
+
+def test_discount_factors_for_arrays():
+    curve = YieldCurve(MATURITIES, RATES)
+    t = np.array([[0.1, 1.0], [3.0, 7.0]])
+    np.testing.assert_allclose(curve.discount_factor(t), np.exp(-curve.zero_rate(t) * t))
+    assert curve.discount_factor(1.0) == pytest.approx(np.exp(-0.0430))
+    assert isinstance(curve.discount_factor(1.0), float)
+
+
+def test_from_csv(tmp_path):
+    path = tmp_path / "curve.csv"
+    path.write_text("maturity,rate\n2.0,0.045\n0.5,0.042\n1.0,0.043\n")
+    curve = YieldCurve.from_csv(str(path), CURVE_INTERPOLATION.LOG_DISCOUNT.value)
+    np.testing.assert_allclose(curve.maturities, [0.5, 1.0, 2.0])
+    assert curve.zero_rate(1.0) == pytest.approx(0.043)
+
+
+def test_get_risk_free_rate_uses_curve():
+    assert get_risk_free_rate() == DEFAULT_ZERO_RATES[0.25]
+    assert get_risk_free_rate(1.0) == pytest.approx(0.0430)
+    assert get_risk_free_rate(0.75) == pytest.approx(0.0425)
+    np.testing.assert_allclose(get_risk_free_rate(np.array([0.5, 2.0])), [0.0420, 0.0450])
@@ -0,0 +1,155 @@
+import datetime
+import sqlite3
+import time
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from db.sqlite.db_queries import count_runs, query_runs
+from db.sqlite.db_utils import (
+    BufferedRunWriter,
+    close_connections,
+    get_connection,
+    init_db,
+    insert_run_to_db,
+    insert_runs_to_db,
+)
+from utils.enums_option import OPTION_MODEL, OPTION_TYPE, PARAMETERS
+
+MODEL = OPTION_MODEL.BLACK_SCHOLES_MODEL.value
+
+
+def make_runs(n: int) -> pd.DataFrame:
+    return pd.DataFrame({
+        "option_type": [OPTION_TYPE.CALL.value, OPTION_TYPE.PUT.value] * (n // 2),
+        PARAMETERS.STOCK_PRICE.value: np.linspace(50, 150, n),
+        PARAMETERS.STRIKE_PRICE.value: 100.0,
+        PARAMETERS.DAYS_TO_EXPIRY.value: np.arange(n) + 1,
+        PARAMETERS.INTEREST_RATE.value: 0.05,
+        PARAMETERS.VOLATILITY.value: 0.2,
+        PARAMETERS.DIVIDEND_YIELD.value: 0.0,
+    })
+
+
+def count_rows(db_path: str) -> int:
+    conn = sqlite3.connect(db_path)
+    try:
+        return conn.execute("SELECT COUNT(*) FROM options_calcs").fetchone()[0]
+    finally:
+        conn.close()
+
+
+def test_pooled_connection_is_reused_and_in_wal_mode(tmp_path):
+    db_path = str(tmp_path / "calcs.db")
+    init_db(db_path)
+    conn = get_connection(db_path)
+    assert get_connection(db_path) is conn
+    assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+
+    insert_run_to_db(MODEL, {**make_runs(2).iloc[0].to_dict()}, np.float64(1.5), db_path)
+    assert count_rows(db_path) == 1
+    close_connections(db_path)
+    assert get_connection(db_path) is not conn
+    close_connections()
+
+
+def test_bulk_insert_from_dataframe(tmp_path):
+    db_path = str(tmp_path / "calcs.db")
+    init_db(db_path)
+    runs = make_runs(1000)
+    insert_runs_to_db(MODEL, runs, np.arange(1000, dtype=float), db_path)
+    assert count_rows(db_path) == 1000
+
+    conn = get_connection(db_path)
+    row = conn.execute("SELECT option_type, days_to_expiry, option_price FROM options_calcs WHERE id = 2").fetchone()
+    assert row == (OPTION_TYPE.PUT.value, 2, 1.0)
+    close_connections()
+
+
+def test_buffered_writer_flushes_on_size_and_request(tmp_path):
+    db_path = str(tmp_path / "calcs.db")
+    init_db(db_path)
+    runs = make_runs(250)
+
+    with BufferedRunWriter(db_path, batch_size=100, flush_interval=60) as writer:
+        writer.submit_many(MODEL, runs, np.ones(250))
+        writer.flush()
+        assert count_rows(db_path) == 250
+        assert writer.batches_written == 3  # two full batches, remainder on flush
+
+        writer.submit(MODEL, runs.iloc[0].to_dict(), 2.0)
+    assert count_rows(db_path) == 251  # close writes what is left
+    assert writer.last_error is None
+    close_connections()
+
+
+def test_buffered_writer_flushes_on_time_threshold(tmp_path):
+    db_path = str(tmp_path / "calcs.db")
+    init_db(db_path)
+    with BufferedRunWriter(db_path, batch_size=1000, flush_interval=0.05) as writer:
+        writer.submit(MODEL, make_runs(2).iloc[0].to_dict(), 1.0)
+        for _ in range(100):
+            if writer.rows_written:
+                break
+            time.sleep(0.02)
+        assert writer.rows_written == 1
+    close_connections()
+
+
+def test_buffered_writer_raises_once_stopped(tmp_path):
+    db_path = str(tmp_path / "calcs.db")
+    init_db(db_path)
+    writer = BufferedRunWriter(db_path)
+    writer.close()
+    with pytest.raises(RuntimeError):
+        writer.flush()
+    with pytest.raises(RuntimeError):
+        writer.submit(MODEL, make_runs(2).iloc[0].to_dict(), 1.0)
+    with pytest.raises(RuntimeError):
+        writer.submit_many(MODEL, make_runs(2), np.ones(2))
+
+    # writer thread dies at start, no connection to a missing directory
+    dead = BufferedRunWriter(str(tmp_path / "missing" / "calcs.db"))
+    dead._thread.join(timeout=5)
+    with pytest.raises(RuntimeError) as excinfo:
+        dead.flush()
+    assert isinstance(excinfo.value.__cause__, sqlite3.OperationalError)
+    assert isinstance(dead.last_error, sqlite3.OperationalError)
+    close_connections()
+
+
+def test_history_indexes_and_keyset_pagination(tmp_path):
+    db_path = str(tmp_path / "calcs.db")
+    init_db(db_path)
+    runs = make_runs(120)
+    insert_runs_to_db(MODEL, runs.iloc[:60], np.arange(60, dtype=float), db_path)
+    insert_runs_to_db(OPTION_MODEL.BINOMIAL_MODEL.value, runs.iloc[60:], np.arange(60, 120, dtype=float), db_path)
+
+    conn = get_connection(db_path)
+    indexes = {row[1] for row in conn.execute("PRAGMA index_list(options_calcs)")}
+    assert {"idx_options_calcs_timestamp", "idx_options_calcs_unique_code", "idx_options_calcs_model_type"} <= indexes
+    plan = " ".join(row[-1] for row in conn.execute(
+        "EXPLAIN QUERY PLAN SELECT * FROM options_calcs WHERE model = ? AND option_type = ? ORDER BY timestamp DESC", ("a", "b")
+    ))
+    assert "idx_options_calcs" in plan
+
+    # pages cover every row exactly once, newest (highest id within the same second) first
+    seen, cursor = [], None
+    while True:
+        page, cursor = query_runs(db_path, page_size=25, after=cursor)
+        seen += page["id"].tolist()
+        if cursor is None:
+            break
+    assert seen == list(range(120, 0, -1))
+
+    page, cursor = query_runs(
+        db_path, model=OPTION_MODEL.BINOMIAL_MODEL.value, option_type=OPTION_TYPE.CALL.value,
+        start_date=datetime.date.today() - datetime.timedelta(days=1), end_date=datetime.date.today() + datetime.timedelta(days=1),
+        strike_min=99, strike_max=101, page_size=100
+    )
+    assert cursor is None and len(page) == 30
+    assert set(page["model"]) == {OPTION_MODEL.BINOMIAL_MODEL.value}
+    assert count_runs(db_path, option_type=OPTION_TYPE.PUT.value) == 60
+    assert count_runs(db_path, start_date=datetime.date.today() + datetime.timedelta(days=2)) == 0
+    close_connections()
@@ -0,0 +1,62 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from option_valuation.batch_pricing import price_batch, price_batch_frame
+from option_valuation.binomial_model import BinomialModel
+from option_valuation.black_scholes_model import BlackScholesModel
+from option_valuation.simple_binomial_model import SimpleBinomialModel
+from option_valuation.trinomial_model import TrinomialModel
+from utils.enums_option import OPTION_MODEL, OPTION_TYPE, PARAMETERS
+
+MODEL_CLASSES = {
+    OPTION_MODEL.BLACK_SCHOLES_MODEL.value: BlackScholesModel,
+    OPTION_MODEL.BINOMIAL_MODEL.value: BinomialModel,
+    OPTION_MODEL.SIMPLE_BINOMIAL_MODEL.value: SimpleBinomialModel,
+    OPTION_MODEL.TRINOMIAL_MODEL.value: TrinomialModel,
+}
+
+# Small mixed chain of calls and puts
+rng = np.random.default_rng(7)
+n_contracts = 25
+chain = pd.DataFrame({
+    "option_type": rng.choice([OPTION_TYPE.CALL.value, OPTION_TYPE.PUT.value], n_contracts),
+    PARAMETERS.STOCK_PRICE.value: rng.uniform(50, 150, n_contracts),
+    PARAMETERS.STRIKE_PRICE.value: rng.uniform(50, 150, n_contracts),
+    PARAMETERS.DAYS_TO_EXPIRY.value: rng.integers(1, 730, n_contracts),
+    PARAMETERS.INTEREST_RATE.value: rng.uniform(0.0, 0.08, n_contracts),
+    PARAMETERS.VOLATILITY.value: rng.uniform(0.05, 0.8, n_contracts),
+    PARAMETERS.DIVIDEND_YIELD.value: rng.uniform(0.0, 0.03, n_contracts),
+    PARAMETERS.TIME_STEPS.value: 200,
+})
+
+
+@pytest.mark.parametrize("option_model", list(MODEL_CLASSES))
+def test_price_batch_frame_matches_single_contract_models(option_model):
+    batch_prices = price_batch_frame(option_model, chain)
+    expected = [
+        MODEL_CLASSES[option_model](row["option_type"], row.to_dict()).calculate_price()
+        for _, row in chain.iterrows()
+    ]
+    np.testing.assert_allclose(batch_prices, expected, rtol=1e-10, atol=1e-10)
+
+
+def test_price_batch_broadcasts_scalar_inputs():
+    S = np.linspace(50, 150, 11)
+    prices = price_batch(OPTION_MODEL.BLACK_SCHOLES_MODEL.value, OPTION_TYPE.CALL.value, S, 100, 365, 0.05, 0.2)
+    assert prices.shape == S.shape
+    assert np.all(np.diff(prices) > 0)  # call value increases with stock price
+
+    grid = price_batch(
+        OPTION_MODEL.BINOMIAL_MODEL.value,
+        OPTION_TYPE.PUT.value,
+        S[:, None], np.array([90, 100, 110])[None, :], 180, 0.05, 0.2, N=50
+    )
+    assert grid.shape == (11, 3)
+
+
+def test_price_batch_invalid_inputs():
+    with pytest.raises(ValueError):
+        price_batch("unknown model", OPTION_TYPE.CALL.value, 100, 100, 365, 0.05, 0.2)
+    with pytest.raises(ValueError):
+        price_batch(OPTION_MODEL.BLACK_SCHOLES_MODEL.value, "straddle", 100, 100, 365, 0.05, 0.2)
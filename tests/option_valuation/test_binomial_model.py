@@ -0,0 +1,161 @@
+import numpy as np
+import pytest
+
+from option_valuation.batch_pricing import price_batch
+from option_valuation.binomial_model import BinomialModel
+from option_valuation.black_scholes_model import BlackScholesModel
+from utils.enums_option import EXERCISE_STYLE, OPTION_MODEL, OPTION_TYPE, PARAMETERS, TREE_METHOD
+
+
+def loop_binomial_price(model: BinomialModel, option_type: str) -> float:
+    """Reference O(N^2) double loop the vectorized induction engine replaced."""
+    option_values = np.zeros(model.N + 1)
+    for i in range(model.N + 1):
+        asset_price = model.S * (model.u ** i) * (model.d ** (model.N - i))
+        if option_type == OPTION_TYPE.CALL.value:
+            option_values[i] = max(0, asset_price - model.X)
+        else:
+            option_values[i] = max(0, model.X - asset_price)
+
+    for step in range(model.N - 1, -1, -1):
+        for i in range(step + 1):
+            option_values[i] = np.exp(-model.r * model.delta_t) * (model.p * option_values[i+1] + (1-model.p) * option_values[i])
+
+    return option_values[0]
+
+
+@pytest.mark.parametrize("option_type", [OPTION_TYPE.CALL.value, OPTION_TYPE.PUT.value])
+@pytest.mark.parametrize(
+    "S, X, T, r, sigma, q, N",
+    [
+        (100, 100, 365, 0.05, 0.2, 0.0, 1000),
+        (100, 120, 90, 0.03, 0.35, 0.01, 250),
+        (50, 40, 730, 0.0, 0.6, 0.02, 500),
+        (10, 10, 1, 0.05, 0.2, 0.0, 1),
+    ]
+)
+def test_vectorized_induction_matches_loop(option_type, S, X, T, r, sigma, q, N):
+    params = {
+        PARAMETERS.STOCK_PRICE.value: S,
+        PARAMETERS.STRIKE_PRICE.value: X,
+        PARAMETERS.DAYS_TO_EXPIRY.value: T,
+        PARAMETERS.INTEREST_RATE.value: r,
+        PARAMETERS.VOLATILITY.value: sigma,
+        PARAMETERS.DIVIDEND_YIELD.value: q,
+        PARAMETERS.TIME_STEPS.value: N,
+    }
+    model = BinomialModel(option_type, params)
+    assert abs(model.calculate_price() - loop_binomial_price(model, option_type)) < 1e-10
+
+
+def american_params(**overrides) -> dict:
+    params = {
+        PARAMETERS.STOCK_PRICE.value: 100,
+        PARAMETERS.STRIKE_PRICE.value: 100,
+        PARAMETERS.DAYS_TO_EXPIRY.value: 365,
+        PARAMETERS.INTEREST_RATE.value: 0.05,
+        PARAMETERS.VOLATILITY.value: 0.2,
+        PARAMETERS.TIME_STEPS.value: 2000,
+        PARAMETERS.EXERCISE_STYLE.value: EXERCISE_STYLE.AMERICAN.value,
+    }
+    params.update(overrides)
+    return params
+
+
+def test_american_put_reference_value():
+    # Reference American put value for S=X=100, T=1, r=5%, sigma=20% is ~6.0903
+    price = BinomialModel(OPTION_TYPE.PUT.value, american_params()).calculate_price()
+    european = BinomialModel(OPTION_TYPE.PUT.value, american_params(exercise_style=EXERCISE_STYLE.EUROPEAN.value)).calculate_price()
+    assert abs(price - 6.0903) < 2e-3
+    assert price > european
+
+
+def test_american_exercise_boundary():
+    put = BinomialModel(OPTION_TYPE.PUT.value, american_params(time_steps=500))
+    price, boundary = put.calculate_price_and_boundary()
+    assert price == put.calculate_price()
+    assert boundary.shape == (501,)
+    assert boundary[-1] <= 100
+    # put boundary rises towards the strike as expiry approaches
+    exercised = boundary[~np.isnan(boundary)]
+    assert np.all(exercised < 100) and exercised[-1] > exercised[0]
+
+    call = BinomialModel(OPTION_TYPE.CALL.value, american_params(time_steps=500, dividend_yield=0.08))
+    _, call_boundary = call.calculate_price_and_boundary()
+    assert np.nanmin(call_boundary) > 100
+
+    with pytest.raises(ValueError):
+        BinomialModel(OPTION_TYPE.PUT.value, american_params(exercise_style=EXERCISE_STYLE.EUROPEAN.value)).calculate_price_and_boundary()
+
+
+def test_american_batch_matches_single_trees():
+    S = np.array([80.0, 100.0, 120.0])
+    batch = price_batch(
+        OPTION_MODEL.BINOMIAL_MODEL.value, OPTION_TYPE.PUT.value, S, 100, 365, 0.05, 0.2,
+        N=300, exercise_style=EXERCISE_STYLE.AMERICAN.value
+    )
+    single = [
+        BinomialModel(OPTION_TYPE.PUT.value, american_params(stock_price=s, time_steps=300)).calculate_price()
+        for s in S
+    ]
+    np.testing.assert_allclose(batch, single, rtol=1e-12)
+
+
+@pytest.mark.parametrize("option_type", [OPTION_TYPE.CALL.value, OPTION_TYPE.PUT.value])
+@pytest.mark.parametrize(
+    "tree_method, steps, tol",
+    [
+        (TREE_METHOD.CRR.value, 1000, 2e-3),
+        (TREE_METHOD.TIAN.value, 1000, 2e-3),
+        (TREE_METHOD.LEISEN_REIMER.value, 51, 2e-4),
+        (TREE_METHOD.BBSR.value, 100, 2e-4),
+    ]
+)
+def test_tree_methods_converge_to_black_scholes(option_type, tree_method, steps, tol):
+    params = american_params(
+        strike_price=110, dividend_yield=0.01, time_steps=steps,
+        exercise_style=EXERCISE_STYLE.EUROPEAN.value, tree_method=tree_method
+    )
+    price = BinomialModel(option_type, params).calculate_price()
+    assert abs(price - BlackScholesModel(option_type, params).calculate_price()) < tol
+
+
+def test_leisen_reimer_rounds_to_odd_steps():
+    model = BinomialModel(OPTION_TYPE.CALL.value, american_params(time_steps=100, tree_method=TREE_METHOD.LEISEN_REIMER.value))
+    assert model.N == 101
+    with pytest.raises(ValueError):
+        BinomialModel(OPTION_TYPE.CALL.value, american_params(tree_method="unknown"))
+
+
+@pytest.mark.parametrize("tree_method", [TREE_METHOD.LEISEN_REIMER.value, TREE_METHOD.BBSR.value])
+def test_american_tree_methods_agree_with_fine_crr(tree_method):
+    reference = BinomialModel(OPTION_TYPE.PUT.value, american_params()).calculate_price()
+    price = BinomialModel(OPTION_TYPE.PUT.value, american_params(time_steps=201, tree_method=tree_method)).calculate_price()
+    assert abs(price - reference) < 2e-3
+
+
+@pytest.mark.parametrize("option_type", [OPTION_TYPE.CALL.value, OPTION_TYPE.PUT.value])
+@pytest.mark.parametrize(
+    "exercise_style, tree_method",
+    [
+        (EXERCISE_STYLE.EUROPEAN.value, TREE_METHOD.CRR.value),
+        (EXERCISE_STYLE.EUROPEAN.value, TREE_METHOD.TIAN.value),
+        (EXERCISE_STYLE.EUROPEAN.value, TREE_METHOD.BBS.value),
+        (EXERCISE_STYLE.EUROPEAN.value, TREE_METHOD.BBSR.value),
+        (EXERCISE_STYLE.EUROPEAN.value, TREE_METHOD.LEISEN_REIMER.value),
+        (EXERCISE_STYLE.AMERICAN.value, TREE_METHOD.CRR.value),
+    ]
+)
+def test_price_curve_matches_batched_trees(option_type, exercise_style, tree_method):
+    S = np.linspace(60, 140, 41)
+    params = american_params(
+        stock_price=S, dividend_yield=0.02, time_steps=300,
+        exercise_style=exercise_style, tree_method=tree_method
+    )
+    curve = BinomialModel(option_type, params).calculate_price_curve()
+    batch = price_batch(
+        OPTION_MODEL.BINOMIAL_MODEL.value, option_type, S, 100, 365, 0.05, 0.2, 0.02,
+        N=300, exercise_style=exercise_style, tree_method=tree_method
+    )
+    assert curve.shape == S.shape
+    np.testing.assert_allclose(curve, batch, rtol=1e-9, atol=1e-10)
@@ -0,0 +1,61 @@
+import numpy as np
+import pytest
+
+from option_valuation.batch_pricing import greeks_batch, price_batch
+from option_valuation.black_scholes_model import BlackScholesModel
+from utils.enums_option import GREEKS, OPTION_MODEL, OPTION_TYPE, PARAMETERS
+
+S = np.array([80.0, 100.0, 120.0, 95.0])
+X = np.array([100.0, 100.0, 100.0, 110.0])
+T = np.array([30.0, 365.0, 180.0, 730.0])  # days
+r = np.array([0.01, 0.05, 0.03, 0.04])
+sigma = np.array([0.4, 0.2, 0.25, 0.6])
+q = np.array([0.0, 0.0, 0.02, 0.01])
+
+
+def bs_prices(option_type, S=S, T=T, r=r, sigma=sigma):
+    return price_batch(OPTION_MODEL.BLACK_SCHOLES_MODEL.value, option_type, S, X, T, r, sigma, q)
+
+
+@pytest.mark.parametrize("option_type", [OPTION_TYPE.CALL.value, OPTION_TYPE.PUT.value])
+def test_greeks_match_finite_differences(option_type):
+    greeks = greeks_batch(option_type, S, X, T, r, sigma, q, higher_order=True)
+    h = 1e-4
+    np.testing.assert_allclose(greeks["price"], bs_prices(option_type), rtol=1e-12)
+
+    delta_fd = (bs_prices(option_type, S=S + h) - bs_prices(option_type, S=S - h)) / (2 * h)
+    gamma_fd = (bs_prices(option_type, S=S + h) - 2 * bs_prices(option_type) + bs_prices(option_type, S=S - h)) / h**2
+    vega_fd = (bs_prices(option_type, sigma=sigma + h) - bs_prices(option_type, sigma=sigma - h)) / (2 * h)
+    rho_fd = (bs_prices(option_type, r=r + h) - bs_prices(option_type, r=r - h)) / (2 * h)
+    # theta is the derivative w.r.t. calendar time, i.e. minus the derivative w.r.t. time to expiry (years)
+    theta_fd = -(bs_prices(option_type, T=T + h * 365) - bs_prices(option_type, T=T - h * 365)) / (2 * h)
+
+    np.testing.assert_allclose(greeks[GREEKS.DELTA.value], delta_fd, atol=1e-6)
+    np.testing.assert_allclose(greeks[GREEKS.GAMMA.value], gamma_fd, atol=1e-4)
+    np.testing.assert_allclose(greeks[GREEKS.VEGA.value], vega_fd, atol=1e-5)
+    np.testing.assert_allclose(greeks[GREEKS.RHO.value], rho_fd, atol=1e-5)
+    np.testing.assert_allclose(greeks[GREEKS.THETA.value], theta_fd, atol=1e-4)
+
+    vega = lambda s: greeks_batch(option_type, S, X, T, r, s, q)[GREEKS.VEGA.value]
+    delta = lambda s: greeks_batch(option_type, S, X, T, r, s, q)[GREEKS.DELTA.value]
+    np.testing.assert_allclose(greeks[GREEKS.VOLGA.value], (vega(sigma + h) - vega(sigma - h)) / (2 * h), atol=1e-4)
+    np.testing.assert_allclose(greeks[GREEKS.VANNA.value], (delta(sigma + h) - delta(sigma - h)) / (2 * h), atol=1e-5)
+
+
+def test_greeks_batch_mixed_types_matches_model():
+    option_types = np.array([OPTION_TYPE.CALL.value, OPTION_TYPE.PUT.value] * 2)
+    greeks = greeks_batch(option_types, S, X, T, r, sigma, q)
+    assert GREEKS.VANNA.value not in greeks
+
+    for i, option_type in enumerate(option_types):
+        params = {
+            PARAMETERS.STOCK_PRICE.value: S[i],
+            PARAMETERS.STRIKE_PRICE.value: X[i],
+            PARAMETERS.DAYS_TO_EXPIRY.value: T[i],
+            PARAMETERS.INTEREST_RATE.value: r[i],
+            PARAMETERS.VOLATILITY.value: sigma[i],
+            PARAMETERS.DIVIDEND_YIELD.value: q[i],
+        }
+        expected = BlackScholesModel(option_type, params).calculate_greeks()
+        for key, value in expected.items():
+            assert abs(greeks[key][i] - value) < 1e-12
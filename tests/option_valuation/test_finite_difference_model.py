@@ -0,0 +1,40 @@
+import numpy as np
+import pytest
+
+from option_valuation.binomial_model import BinomialModel
+from option_valuation.finite_difference_model import FiniteDifferenceModel
+from utils.enums_option import EXERCISE_STYLE, OPTION_TYPE, PARAMETERS
+
+
+def fd_params(**overrides) -> dict:
+    params = {
+        PARAMETERS.STOCK_PRICE.value: 100,
+        PARAMETERS.STRIKE_PRICE.value: 100,
+        PARAMETERS.DAYS_TO_EXPIRY.value: 365,
+        PARAMETERS.INTEREST_RATE.value: 0.05,
+        PARAMETERS.VOLATILITY.value: 0.2,
+        PARAMETERS.TIME_STEPS.value: 400,
+        PARAMETERS.PRICE_STEPS.value: 400,
+        PARAMETERS.EXERCISE_STYLE.value: EXERCISE_STYLE.AMERICAN.value,
+    }
+    params.update(overrides)
+    return params
+
+
+def test_row_of_spots_from_one_solve():
+    S = np.linspace(60, 140, 17)
+    prices = FiniteDifferenceModel(OPTION_TYPE.PUT.value, fd_params(stock_price=S)).calculate_price()
+    reference = BinomialModel(OPTION_TYPE.PUT.value, fd_params(stock_price=S[:, None], time_steps=2000)).calculate_price()
+    assert prices.shape == S.shape
+    np.testing.assert_allclose(prices, reference, atol=5e-3)
+    # deep in the money american puts are exercised
+    assert prices[0] == pytest.approx(40.0)
+
+    asset_prices, values = FiniteDifferenceModel(OPTION_TYPE.PUT.value, fd_params()).calculate_price_grid()
+    assert asset_prices.shape == values.shape == (401,)
+    assert np.all(values >= np.maximum(100 - asset_prices, 0.0) - 1e-12)
+
+
+def test_invalid_grid():
+    with pytest.raises(ValueError):
+        FiniteDifferenceModel(OPTION_TYPE.PUT.value, fd_params(price_steps=2))
@@ -0,0 +1,28 @@
+import subprocess
+import sys
+
+import numpy as np
+import pytest
+from scipy.stats import norm
+
+from utils.normal_distribution import norm_cdf, norm_pdf
+
+# Loaded on first use by the pricing core, never by importing it
+HEAVY_MODULES = ["scipy", "pandas", "matplotlib", "streamlit", "dotenv", "alpaca"]
+
+
+@pytest.mark.parametrize(
+    "module",
+    ["option_valuation.batch_pricing", "utils.options_formulas", "utils.common_formulas", "pricing_service.server"],
+)
+def test_pricing_core_imports_only_numpy(module):
+    code = f"import sys; import {module}; print(*[m for m in {HEAVY_MODULES!r} if m in sys.modules])"
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+    assert result.stdout.split() == []
+
+
+def test_normal_distribution_matches_scipy():
+    x = np.linspace(-40, 40, 8001)
+    np.testing.assert_allclose(norm_pdf(x), norm.pdf(x), rtol=1e-13, atol=1e-300)
+    np.testing.assert_array_equal(norm_cdf(x), norm.cdf(x))
+    assert norm_cdf(0.3) == norm.cdf(0.3)
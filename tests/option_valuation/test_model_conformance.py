@@ -0,0 +1,77 @@
+import pytest
+
+from option_valuation.binomial_model import BinomialModel
+from option_valuation.black_scholes_model import BlackScholesModel
+from option_valuation.finite_difference_model import FiniteDifferenceModel
+from option_valuation.trinomial_model import TrinomialModel
+from utils.enums_option import EXERCISE_STYLE, OPTION_TYPE, PARAMETERS, TREE_METHOD
+
+# Lattice and grid models with American exercise, each with the resolution its checks run at
+LATTICE_MODELS = {
+    BinomialModel: {PARAMETERS.TIME_STEPS.value: 2000},
+    TrinomialModel: {PARAMETERS.TIME_STEPS.value: 1000},
+    FiniteDifferenceModel: {PARAMETERS.TIME_STEPS.value: 400, PARAMETERS.PRICE_STEPS.value: 400},
+}
+
+# Models checked against Black-Scholes and a fine binomial tree
+APPROXIMATING_MODELS = [TrinomialModel, FiniteDifferenceModel]
+
+
+def model_params(model_cls, **overrides) -> dict:
+    params = {
+        PARAMETERS.STOCK_PRICE.value: 100,
+        PARAMETERS.STRIKE_PRICE.value: 100,
+        PARAMETERS.DAYS_TO_EXPIRY.value: 365,
+        PARAMETERS.INTEREST_RATE.value: 0.05,
+        PARAMETERS.VOLATILITY.value: 0.2,
+        PARAMETERS.EXERCISE_STYLE.value: EXERCISE_STYLE.AMERICAN.value,
+        **LATTICE_MODELS[model_cls],
+    }
+    params.update(overrides)
+    return params
+
+
+@pytest.mark.parametrize("model_cls", APPROXIMATING_MODELS)
+@pytest.mark.parametrize("option_type", [OPTION_TYPE.CALL.value, OPTION_TYPE.PUT.value])
+@pytest.mark.parametrize(
+    "S, X, T, r, sigma, q",
+    [
+        (100, 100, 365, 0.05, 0.2, 0.0),
+        (100, 120, 90, 0.03, 0.35, 0.01),
+        (50, 40, 730, 0.0, 0.6, 0.02),
+    ]
+)
+def test_european_converges_to_black_scholes(model_cls, option_type, S, X, T, r, sigma, q):
+    params = model_params(
+        model_cls, stock_price=S, strike_price=X, days_to_expiry=T, interest_rate=r, volatility=sigma,
+        dividend_yield=q, exercise_style=EXERCISE_STYLE.EUROPEAN.value
+    )
+    price = model_cls(option_type, params).calculate_price()
+    assert abs(price - BlackScholesModel(option_type, params).calculate_price()) < 2e-3
+
+
+@pytest.mark.parametrize("model_cls", APPROXIMATING_MODELS)
+@pytest.mark.parametrize(
+    "option_type, q",
+    [(OPTION_TYPE.PUT.value, 0.0), (OPTION_TYPE.PUT.value, 0.03), (OPTION_TYPE.CALL.value, 0.06)]
+)
+def test_american_agrees_with_fine_binomial(model_cls, option_type, q):
+    reference = BinomialModel(
+        option_type,
+        model_params(BinomialModel, dividend_yield=q, time_steps=4000, tree_method=TREE_METHOD.BBSR.value)
+    ).calculate_price()
+    price = model_cls(option_type, model_params(model_cls, dividend_yield=q)).calculate_price()
+    european = model_cls(
+        option_type, model_params(model_cls, dividend_yield=q, exercise_style=EXERCISE_STYLE.EUROPEAN.value)
+    ).calculate_price()
+    assert abs(price - reference) < 1e-3
+    assert price > european
+
+
+@pytest.mark.parametrize("model_cls", list(LATTICE_MODELS))
+def test_american_call_without_dividend_equals_european(model_cls):
+    american = model_cls(OPTION_TYPE.CALL.value, model_params(model_cls)).calculate_price()
+    european = model_cls(
+        OPTION_TYPE.CALL.value, model_params(model_cls, exercise_style=EXERCISE_STYLE.EUROPEAN.value)
+    ).calculate_price()
+    assert american == pytest.approx(european, abs=1e-10)
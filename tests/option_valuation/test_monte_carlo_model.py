@@ -0,0 +1,92 @@
+import numpy as np
+import pytest
+
+from option_valuation.black_scholes_model import BlackScholesModel
+from option_valuation.monte_carlo_model import MonteCarloModel
+from utils.enums_option import OPTION_TYPE, PARAMETERS
+
+
+def mc_params(**overrides) -> dict:
+    params = {
+        PARAMETERS.STOCK_PRICE.value: 100,
+        PARAMETERS.STRIKE_PRICE.value: 105,
+        PARAMETERS.DAYS_TO_EXPIRY.value: 365,
+        PARAMETERS.INTEREST_RATE.value: 0.05,
+        PARAMETERS.VOLATILITY.value: 0.25,
+        PARAMETERS.DIVIDEND_YIELD.value: 0.01,
+        PARAMETERS.NUM_PATHS.value: 200_000,
+    }
+    params.update(overrides)
+    return params
+
+
+def arithmetic_asian_call(paths, X):
+    return np.maximum(paths.mean(axis=1) - X, 0.0)
+
+
+@pytest.mark.parametrize("option_type", [OPTION_TYPE.CALL.value, OPTION_TYPE.PUT.value])
+def test_european_within_standard_errors_of_black_scholes(option_type):
+    model = MonteCarloModel(option_type, mc_params(), control_variate=False, seed=11, chunk_size=30_000)
+    price, std_error = model.calculate_price_and_std_error()
+    exact = BlackScholesModel(option_type, mc_params()).calculate_price()
+    assert abs(price - exact) < 4 * std_error
+    assert model.paths_simulated == 200_000
+
+
+def test_antithetic_reduces_standard_error():
+    plain = MonteCarloModel(OPTION_TYPE.CALL.value, mc_params(), antithetic=False, control_variate=False, seed=1)
+    antithetic = MonteCarloModel(OPTION_TYPE.CALL.value, mc_params(), control_variate=False, seed=1)
+    plain.calculate_price()
+    antithetic.calculate_price()
+    assert antithetic.std_error < plain.std_error
+
+
+def test_control_variate_reduces_vanilla_and_asian_error():
+    # the vanilla control is the terminal price, the error bar is a real one
+    plain = MonteCarloModel(OPTION_TYPE.CALL.value, mc_params(), control_variate=False, seed=2)
+    vanilla = MonteCarloModel(OPTION_TYPE.CALL.value, mc_params(), seed=2)
+    plain.calculate_price()
+    price, std_error = vanilla.calculate_price_and_std_error()
+    exact = BlackScholesModel(OPTION_TYPE.CALL.value, mc_params()).calculate_price()
+    assert 0 < std_error < 0.7 * plain.std_error
+    assert abs(price - exact) < 4 * std_error
+
+    params = mc_params(time_steps=12, num_paths=50_000)
+    plain = MonteCarloModel(OPTION_TYPE.CALL.value, params, payoff=arithmetic_asian_call, control_variate=False, seed=3)
+    controlled = MonteCarloModel(OPTION_TYPE.CALL.value, params, payoff=arithmetic_asian_call, seed=3)
+    plain_price, plain_error = plain.calculate_price_and_std_error()
+    controlled_price, controlled_error = controlled.calculate_price_and_std_error()
+    assert controlled_error < 0.7 * plain_error
+    assert abs(controlled_price - plain_price) < 4 * plain_error
+    # averaging lowers the option value below the European one
+    assert controlled_price < BlackScholesModel(OPTION_TYPE.CALL.value, params).calculate_price()
+
+
+def test_seeded_runs_are_reproducible_across_workers():
+    kwargs = {"control_variate": False, "seed": 5, "chunk_size": 20_000}
+    serial = MonteCarloModel(OPTION_TYPE.CALL.value, mc_params(num_paths=100_000), **kwargs).calculate_price()
+    again = MonteCarloModel(OPTION_TYPE.CALL.value, mc_params(num_paths=100_000), **kwargs).calculate_price()
+    parallel = MonteCarloModel(OPTION_TYPE.CALL.value, mc_params(num_paths=100_000), workers=2, **kwargs).calculate_price()
+    assert serial == again
+    assert parallel == pytest.approx(serial, rel=1e-12)
+
+
+def test_target_std_error_stops_early():
+    model = MonteCarloModel(
+        OPTION_TYPE.CALL.value, mc_params(num_paths=2_000_000), control_variate=False,
+        seed=7, chunk_size=10_000, target_std_error=0.05
+    )
+    price = model.calculate_price()
+    assert model.std_error <= 0.05
+    assert model.paths_simulated < 2_000_000
+
+    # the target is checked chunk by chunk in chunk order, not per wave of workers
+    parallel = MonteCarloModel(
+        OPTION_TYPE.CALL.value, mc_params(num_paths=2_000_000), control_variate=False,
+        seed=7, chunk_size=10_000, target_std_error=0.05, workers=3
+    )
+    assert parallel.calculate_price() == pytest.approx(price, rel=1e-12)
+    assert parallel.paths_simulated == model.paths_simulated
+
+    with pytest.raises(ValueError):
+        MonteCarloModel(OPTION_TYPE.CALL.value, mc_params(num_paths=1))
@@ -0,0 +1,42 @@
+import numpy as np
+import pytest
+
+from option_valuation.batch_pricing import price_batch
+from option_valuation.parallel_pricing import price_batch_parallel
+from utils.enums_option import EXERCISE_STYLE, OPTION_MODEL, OPTION_TYPE, TREE_METHOD
+
+rng = np.random.default_rng(3)
+n_contracts = 101
+option_type = rng.choice([OPTION_TYPE.CALL.value, OPTION_TYPE.PUT.value], n_contracts)
+S = rng.uniform(50, 150, n_contracts)
+X = rng.uniform(50, 150, n_contracts)
+T = rng.integers(1, 730, n_contracts)
+sigma = rng.uniform(0.05, 0.8, n_contracts)
+
+
+@pytest.mark.parametrize(
+    "option_model, model_kwargs",
+    [
+        (OPTION_MODEL.BLACK_SCHOLES_MODEL.value, {}),
+        (OPTION_MODEL.BINOMIAL_MODEL.value, {"N": 150, "exercise_style": EXERCISE_STYLE.AMERICAN.value}),
+        (OPTION_MODEL.BINOMIAL_MODEL.value, {"N": 51, "tree_method": TREE_METHOD.LEISEN_REIMER.value}),
+    ]
+)
+def test_parallel_matches_serial_batch(option_model, model_kwargs):
+    serial = price_batch(option_model, option_type, S, X, T, 0.04, sigma, 0.01, **model_kwargs)
+    parallel = price_batch_parallel(option_model, option_type, S, X, T, 0.04, sigma, 0.01, workers=2, shard_size=17, **model_kwargs)
+    np.testing.assert_array_equal(parallel, serial)
+
+
+def test_parallel_keeps_broadcast_shape_and_raises_worker_errors():
+    grid = price_batch_parallel(
+        OPTION_MODEL.BLACK_SCHOLES_MODEL.value, OPTION_TYPE.CALL.value,
+        S[:10, None], X[None, :5], 365, 0.04, 0.2, workers=2
+    )
+    assert grid.shape == (10, 5)
+
+    with pytest.raises(ValueError):
+        price_batch_parallel(
+            OPTION_MODEL.BLACK_SCHOLES_MODEL.value, OPTION_TYPE.CALL.value, S, X, T, 0.04, sigma,
+            exercise_style=EXERCISE_STYLE.AMERICAN.value, workers=2
+        )
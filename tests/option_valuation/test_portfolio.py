@@ -0,0 +1,162 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from option_valuation.batch_pricing import greeks_batch, price_batch
+from option_valuation.portfolio import TOTAL_KEYS, VALUE, VALUE_KEYS, Portfolio
+from utils.enums_option import EXERCISE_STYLE, OPTION_MODEL, OPTION_TYPE, PARAMETERS
+
+UNDERLYINGS = ["AAPL", "MSFT", "SPY", "TSLA"]
+SPOTS = {"AAPL": 190.0, "MSFT": 410.0, "SPY": 520.0, "TSLA": 180.0}
+
+
+def random_book(n: int = 400, seed: int = 0) -> dict:
+    rng = np.random.default_rng(seed)
+    underlying = rng.choice(UNDERLYINGS, n)
+    S = np.array([SPOTS[symbol] for symbol in underlying])
+    return {
+        "underlying": underlying,
+        "option_type": rng.choice([OPTION_TYPE.CALL.value, OPTION_TYPE.PUT.value], n),
+        "S": S,
+        "X": S * rng.uniform(0.8, 1.2, n),
+        "T": rng.integers(7, 365, n).astype(float),
+        "r": 0.04,
+        "sigma": rng.uniform(0.15, 0.6, n),
+        "q": 0.01,
+        "quantity": rng.integers(-20, 21, n).astype(float),
+    }
+
+
+def expected_totals(book: dict, mask=None) -> np.ndarray:
+    greeks = greeks_batch(book["option_type"], book["S"], book["X"], book["T"], book["r"], book["sigma"], book["q"])
+    weights = book["quantity"] if mask is None else book["quantity"] * mask
+    return np.array([greeks[key] @ weights for key in VALUE_KEYS])
+
+
+def test_book_totals_match_batch_greeks():
+    book = random_book()
+    portfolio = Portfolio(**book)
+    assert len(portfolio) == 400
+    np.testing.assert_allclose(list(portfolio.greeks().values()), expected_totals(book))
+    assert list(portfolio.greeks()) == list(TOTAL_KEYS)
+    assert portfolio.value() == pytest.approx(expected_totals(book)[0])
+
+    for symbol, totals in portfolio.exposures().items():
+        np.testing.assert_allclose(list(totals.values()), expected_totals(book, book["underlying"] == symbol))
+
+
+def test_market_update_revalues_only_that_underlying():
+    book = random_book()
+    portfolio = Portfolio(**book)
+    before = portfolio.value()
+    untouched = portfolio.exposures("MSFT")
+    priced = portfolio.revalued
+
+    change = portfolio.update_market("AAPL", S=200.0, sigma=0.35)
+    affected = book["underlying"] == "AAPL"
+    assert portfolio.revalued - priced == affected.sum()
+
+    book["S"] = np.where(affected, 200.0, book["S"])
+    book["sigma"] = np.where(affected, 0.35, book["sigma"])
+    np.testing.assert_allclose(list(portfolio.greeks().values()), expected_totals(book))
+    assert change == pytest.approx(portfolio.value() - before)
+    assert portfolio.exposures("MSFT") == untouched
+
+    portfolio.update_market("SPY", r=0.05, q=0.0)
+    book["r"] = np.where(book["underlying"] == "SPY", 0.05, book["r"])
+    book["q"] = np.where(book["underlying"] == "SPY", 0.0, book["q"])
+    np.testing.assert_allclose(list(portfolio.greeks().values()), expected_totals(book))
+
+    with pytest.raises(KeyError):
+        portfolio.update_market("NVDA", S=100.0)
+
+
+def test_add_positions_prices_only_new_positions():
+    book = random_book()
+    portfolio = Portfolio(**book)
+    portfolio.add_positions("NVDA", OPTION_TYPE.CALL.value, 120.0, [110.0, 130.0], 30, 0.04, 0.5, quantity=[5, -5])
+    assert portfolio.revalued == 402
+    assert list(portfolio.underlyings) == sorted(UNDERLYINGS + ["NVDA"])
+
+    nvda = greeks_batch(OPTION_TYPE.CALL.value, 120.0, np.array([110.0, 130.0]), 30, 0.04, 0.5)
+    np.testing.assert_allclose(portfolio.exposures("NVDA")[VALUE], 5 * (nvda["price"][0] - nvda["price"][1]))
+    # existing underlyings keep their groups after the codes are rebuilt
+    np.testing.assert_allclose(list(portfolio.exposures("TSLA").values()), expected_totals(book, book["underlying"] == "TSLA"))
+
+
+def test_rejected_add_leaves_book_unchanged():
+    book = random_book(n=20)
+    portfolio = Portfolio(**book)
+    value = portfolio.value()
+    with pytest.raises(ValueError):
+        portfolio.add_positions("NVDA", "straddle", 120.0, [110.0, 130.0], 30, 0.04, 0.5)
+    assert len(portfolio) == 20
+    assert "NVDA" not in portfolio.underlyings
+    assert portfolio.value() == pytest.approx(value)
+
+    change = portfolio.update_market("TSLA", S=300.0)
+    book["S"] = np.where(book["underlying"] == "TSLA", 300.0, book["S"])
+    assert portfolio.value() == pytest.approx(value + change)
+    np.testing.assert_allclose(list(portfolio.greeks().values()), expected_totals(book))
+
+
+def test_advance_reprices_with_less_time():
+    book = random_book(n=50)
+    portfolio = Portfolio(**book)
+    value = portfolio.value()
+    change = portfolio.advance(5)
+    book["T"] = book["T"] - 5
+    assert portfolio.value() == pytest.approx(value + change)
+    np.testing.assert_allclose(list(portfolio.greeks().values()), expected_totals(book))
+
+    # moving as far as the nearest expiry is rejected and leaves the book as it was
+    with pytest.raises(ValueError):
+        portfolio.advance(book["T"].min())
+    np.testing.assert_allclose(portfolio.fields[PARAMETERS.DAYS_TO_EXPIRY.value], book["T"])
+
+
+def test_tree_book_uses_bumped_greeks():
+    book = random_book(n=40)
+    portfolio = Portfolio(**book, option_model=OPTION_MODEL.BINOMIAL_MODEL.value, N=200, exercise_style=EXERCISE_STYLE.AMERICAN.value)
+    prices = price_batch(
+        OPTION_MODEL.BINOMIAL_MODEL.value, book["option_type"], book["S"], book["X"], book["T"], book["r"], book["sigma"], book["q"],
+        N=200, exercise_style=EXERCISE_STYLE.AMERICAN.value
+    )
+    assert portfolio.value() == pytest.approx(prices @ book["quantity"])
+
+    european = greeks_batch(book["option_type"], book["S"], book["X"], book["T"], book["r"], book["sigma"], book["q"])
+    frame = portfolio.to_frame()
+    calls = book["option_type"] == OPTION_TYPE.CALL.value
+    # american puts are worth at least their european counterpart, q = 1% makes early call exercise rare
+    assert np.all(frame["price"].to_numpy()[~calls] >= european["price"][~calls] - 1e-2)
+    np.testing.assert_allclose(frame["delta"].to_numpy()[calls], european["delta"][calls], atol=0.02)
+
+
+def test_from_frame_and_to_frame():
+    book = random_book(n=20)
+    positions = pd.DataFrame({
+        "underlying": book["underlying"],
+        "option_type": book["option_type"],
+        PARAMETERS.STOCK_PRICE.value: book["S"],
+        PARAMETERS.STRIKE_PRICE.value: book["X"],
+        PARAMETERS.DAYS_TO_EXPIRY.value: book["T"],
+        PARAMETERS.INTEREST_RATE.value: book["r"],
+        PARAMETERS.VOLATILITY.value: book["sigma"],
+        PARAMETERS.DIVIDEND_YIELD.value: book["q"],
+        "quantity": book["quantity"],
+    })
+    portfolio = Portfolio.from_frame(positions)
+    np.testing.assert_allclose(list(portfolio.greeks().values()), expected_totals(book))
+
+    frame = portfolio.to_frame()
+    assert len(frame) == 20
+    pd.testing.assert_frame_equal(frame[positions.columns], positions, check_dtype=False)
+    assert frame[VALUE].sum() == pytest.approx(portfolio.value())
+
+
+def test_invalid_book():
+    book = random_book(n=10)
+    with pytest.raises(ValueError):
+        Portfolio(**{**book, "option_type": "straddle"})
+    with pytest.raises(ValueError):
+        Portfolio(**book, exercise_style=EXERCISE_STYLE.AMERICAN.value)
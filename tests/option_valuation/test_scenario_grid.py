@@ -0,0 +1,118 @@
+import numpy as np
+import pytest
+
+from option_valuation.batch_pricing import greeks_batch, price_batch
+from option_valuation.scenario_grid import MAX_TREE_GREEK_SCENARIOS, MAX_TREE_SCENARIOS, PNL, PRICE, max_grid_points, scenario_grid
+from utils.enums_option import EXERCISE_STYLE, GREEKS, OPTION_MODEL, OPTION_TYPE, PARAMETERS, TREE_METHOD
+
+CONTRACT = (100.0, 105.0, 120, 0.04, 0.25, 0.01)
+SPOT_SHOCKS = np.linspace(-0.3, 0.3, 7)
+VOL_SHOCKS = np.array([-0.1, 0.0, 0.15])
+TIME_SHOCKS = np.array([0, 30, 90])
+
+
+@pytest.mark.parametrize("option_model", [OPTION_MODEL.BLACK_SCHOLES_MODEL.value, OPTION_MODEL.TRINOMIAL_MODEL.value])
+@pytest.mark.parametrize("option_type", [OPTION_TYPE.CALL.value, OPTION_TYPE.PUT.value])
+def test_grid_matches_pointwise_prices(option_model, option_type):
+    S, X, T, r, sigma, q = CONTRACT
+    grid = scenario_grid(
+        option_model, option_type, *CONTRACT, spot_shocks=SPOT_SHOCKS, vol_shocks=VOL_SHOCKS, time_shocks=TIME_SHOCKS, N=50
+    )
+    assert grid.dims == (PARAMETERS.STOCK_PRICE.value, PARAMETERS.VOLATILITY.value, PARAMETERS.DAYS_TO_EXPIRY.value)
+    assert grid.shape == grid[PRICE].shape == (7, 3, 3)
+    np.testing.assert_allclose(grid.coords[PARAMETERS.DAYS_TO_EXPIRY.value], T - TIME_SHOCKS)
+
+    for i, j, k in [(0, 0, 0), (3, 1, 0), (6, 2, 2), (2, 0, 1)]:
+        expected = price_batch(
+            option_model, option_type, S * (1 + SPOT_SHOCKS[i]), X, T - TIME_SHOCKS[k], r, sigma + VOL_SHOCKS[j], q, N=50
+        )
+        assert grid[PRICE][i, j, k] == pytest.approx(expected, rel=1e-12)
+    assert grid[PNL][3, 1, 0] == pytest.approx(0.0, abs=1e-12)
+    np.testing.assert_allclose(grid[PNL], grid[PRICE] - grid.base_price)
+
+
+@pytest.mark.parametrize("exercise_style", [EXERCISE_STYLE.EUROPEAN.value, EXERCISE_STYLE.AMERICAN.value])
+@pytest.mark.parametrize("tree_method", [TREE_METHOD.CRR.value, TREE_METHOD.BBSR.value, TREE_METHOD.LEISEN_REIMER.value])
+def test_binomial_spot_rows_match_batched_trees(exercise_style, tree_method):
+    S, X, T, r, sigma, q = CONTRACT
+    grid = scenario_grid(
+        OPTION_MODEL.BINOMIAL_MODEL.value, OPTION_TYPE.PUT.value, *CONTRACT,
+        spot_shocks=SPOT_SHOCKS, vol_shocks=VOL_SHOCKS, N=101, exercise_style=exercise_style, tree_method=tree_method
+    )
+    expected = price_batch(
+        OPTION_MODEL.BINOMIAL_MODEL.value, OPTION_TYPE.PUT.value,
+        S * (1 + SPOT_SHOCKS[:, None]), X, T, r, sigma + VOL_SHOCKS, q,
+        N=101, exercise_style=exercise_style, tree_method=tree_method
+    )
+    np.testing.assert_allclose(grid[PRICE], expected, rtol=1e-10, atol=1e-12)
+
+
+def test_black_scholes_greeks_are_closed_form():
+    S, X, T, r, sigma, q = CONTRACT
+    grid = scenario_grid(
+        OPTION_MODEL.BLACK_SCHOLES_MODEL.value, OPTION_TYPE.CALL.value, *CONTRACT,
+        spot_shocks=SPOT_SHOCKS, vol_shocks=VOL_SHOCKS, greeks=True
+    )
+    expected = greeks_batch(OPTION_TYPE.CALL.value, S * (1 + SPOT_SHOCKS[:, None]), X, T, r, sigma + VOL_SHOCKS, q)
+    assert list(grid.values) == [PRICE, PNL] + [key for key in expected if key != "price"]
+    for key, values in expected.items():
+        np.testing.assert_allclose(grid[key], values)
+
+
+@pytest.mark.parametrize("option_type", [OPTION_TYPE.CALL.value, OPTION_TYPE.PUT.value])
+def test_bumped_tree_greeks_match_black_scholes(option_type):
+    S, X, T, r, sigma, q = CONTRACT
+    shocks = {"spot_shocks": [-0.1, 0.0, 0.1], "time_shocks": [0, 60]}
+    tree = scenario_grid(
+        OPTION_MODEL.BINOMIAL_MODEL.value, option_type, *CONTRACT, greeks=True, N=2000,
+        tree_method=TREE_METHOD.BBSR.value, **shocks
+    )
+    closed_form = scenario_grid(OPTION_MODEL.BLACK_SCHOLES_MODEL.value, option_type, *CONTRACT, greeks=True, **shocks)
+    for greek in GREEKS.DELTA, GREEKS.GAMMA, GREEKS.VEGA, GREEKS.THETA, GREEKS.RHO:
+        np.testing.assert_allclose(tree[greek.value], closed_form[greek.value], rtol=2e-3, atol=1e-3)
+
+
+def test_grid_frames():
+    grid = scenario_grid(
+        OPTION_MODEL.BLACK_SCHOLES_MODEL.value, OPTION_TYPE.CALL.value, *CONTRACT, spot_shocks=SPOT_SHOCKS, vol_shocks=VOL_SHOCKS
+    )
+    table = grid.to_frame(PNL)
+    assert table.shape == (7, 3)
+    assert table.index.name == PARAMETERS.STOCK_PRICE.value
+    assert table.columns.name == PARAMETERS.VOLATILITY.value
+    np.testing.assert_allclose(table.to_numpy(), grid[PNL])
+
+    scenarios = grid.to_frame()
+    assert list(scenarios.columns) == [PRICE, PNL]
+    assert len(scenarios) == 21
+    assert scenarios.loc[(grid.coords[PARAMETERS.STOCK_PRICE.value][6], grid.coords[PARAMETERS.VOLATILITY.value][2]), PRICE] == grid[PRICE][6, 2]
+
+    time_grid = scenario_grid(OPTION_MODEL.BLACK_SCHOLES_MODEL.value, OPTION_TYPE.CALL.value, *CONTRACT, time_shocks=TIME_SHOCKS)
+    assert time_grid.dims == (PARAMETERS.DAYS_TO_EXPIRY.value,)
+    with pytest.raises(ValueError):
+        time_grid.to_frame(PRICE)
+
+
+def test_max_grid_points():
+    american = EXERCISE_STYLE.AMERICAN.value
+    # closed form and shared curve binomial grids are unbounded
+    assert max_grid_points(OPTION_MODEL.BLACK_SCHOLES_MODEL.value, 10, greeks=True) is None
+    assert max_grid_points(OPTION_MODEL.BINOMIAL_MODEL.value, 10, greeks=True) is None
+    assert max_grid_points(OPTION_MODEL.BINOMIAL_MODEL.value, 1, tree_method=TREE_METHOD.LEISEN_REIMER.value) is not None
+
+    points = max_grid_points(OPTION_MODEL.BINOMIAL_MODEL.value, 4, exercise_style=american)
+    assert points**2 * 4 <= MAX_TREE_SCENARIOS < (points + 1)**2 * 4
+    points = max_grid_points(OPTION_MODEL.TRINOMIAL_MODEL.value, 1, greeks=True)
+    assert points**2 <= MAX_TREE_GREEK_SCENARIOS < (points + 1)**2
+    # tree cost grows with N^2
+    assert max_grid_points(OPTION_MODEL.TRINOMIAL_MODEL.value, 1, N=200) == max_grid_points(OPTION_MODEL.TRINOMIAL_MODEL.value, 4)
+    assert max_grid_points(OPTION_MODEL.TRINOMIAL_MODEL.value, 10, greeks=True, N=1000) == 2
+
+
+@pytest.mark.parametrize(
+    "shocks",
+    [{}, {"spot_shocks": [-1.0, 0.0]}, {"vol_shocks": [-0.25]}, {"time_shocks": [0, 120]}, {"spot_shocks": [[0.1]]}],
+)
+def test_invalid_shocks(shocks):
+    with pytest.raises(ValueError):
+        scenario_grid(OPTION_MODEL.BLACK_SCHOLES_MODEL.value, OPTION_TYPE.CALL.value, *CONTRACT, **shocks)
@@ -0,0 +1,52 @@
+import numpy as np
+import pytest
+
+from db.sqlite.db_utils import generate_unique_code
+from option_valuation.batch_pricing import price_batch
+from option_valuation.trinomial_model import TrinomialModel
+from utils.enums_option import EXERCISE_STYLE, OPTION_MODEL, OPTION_TYPE, PARAMETERS
+
+
+def trinomial_params(**overrides) -> dict:
+    params = {
+        PARAMETERS.STOCK_PRICE.value: 100,
+        PARAMETERS.STRIKE_PRICE.value: 100,
+        PARAMETERS.DAYS_TO_EXPIRY.value: 365,
+        PARAMETERS.INTEREST_RATE.value: 0.05,
+        PARAMETERS.VOLATILITY.value: 0.2,
+        PARAMETERS.TIME_STEPS.value: 1000,
+        PARAMETERS.EXERCISE_STYLE.value: EXERCISE_STYLE.AMERICAN.value,
+    }
+    params.update(overrides)
+    return params
+
+
+def test_probabilities_are_risk_neutral():
+    model = TrinomialModel(OPTION_TYPE.CALL.value, trinomial_params(dividend_yield=0.02, time_steps=50))
+    assert model.p_u + model.p_m + model.p_d == pytest.approx(1.0)
+    assert min(model.p_u, model.p_m, model.p_d) > 0
+    # one step expectation grows at r - q
+    growth = model.p_u * model.u + model.p_m + model.p_d / model.u
+    assert growth == pytest.approx(np.exp((0.05 - 0.02) * model.delta_t), rel=1e-12)
+
+
+def test_american_batch_matches_single_trees():
+    S = np.array([80.0, 100.0, 120.0])
+    batch = price_batch(
+        OPTION_MODEL.TRINOMIAL_MODEL.value, OPTION_TYPE.PUT.value, S, 100, 365, 0.05, 0.2,
+        N=300, exercise_style=EXERCISE_STYLE.AMERICAN.value
+    )
+    single = [
+        TrinomialModel(OPTION_TYPE.PUT.value, trinomial_params(stock_price=s, time_steps=300)).calculate_price()
+        for s in S
+    ]
+    np.testing.assert_allclose(batch, single, rtol=1e-12)
+
+
+def test_unique_code_records_steps_and_exercise_style():
+    code = generate_unique_code(
+        OPTION_MODEL.TRINOMIAL_MODEL.value,
+        {**trinomial_params(time_steps=200), "option_type": OPTION_TYPE.PUT.value}
+    )
+    assert code.startswith("TM_")
+    assert code.endswith("_200N_A")
@@ -0,0 +1,83 @@
+from unittest.mock import patch
+
+import pytest
+
+from db.sqlite.db_utils import close_connections, init_db, insert_run_to_db
+from option_valuation.binomial_model import BinomialModel
+from option_valuation.black_scholes_model import BlackScholesModel
+from utils.enums_option import EXERCISE_STYLE, OPTION_MODEL, OPTION_TYPE, PARAMETERS
+from utils.pricing_cache import PricingCache
+
+params = {
+    PARAMETERS.STOCK_PRICE.value: 100,
+    PARAMETERS.STRIKE_PRICE.value: 100,
+    PARAMETERS.DAYS_TO_EXPIRY.value: 365,
+    PARAMETERS.INTEREST_RATE.value: 0.05,
+    PARAMETERS.VOLATILITY.value: 0.2,
+    PARAMETERS.DIVIDEND_YIELD.value: 0.0,
+    PARAMETERS.TIME_STEPS.value: 200,
+}
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_cache_hits_near_identical_queries():
+    cache = PricingCache()
+    price = cache.price(OPTION_MODEL.BLACK_SCHOLES_MODEL.value, OPTION_TYPE.CALL.value, params)
+    assert price == BlackScholesModel(OPTION_TYPE.CALL.value, params).calculate_price()
+
+    near = {**params, PARAMETERS.VOLATILITY.value: 0.200001, PARAMETERS.STOCK_PRICE.value: 100.00001}
+    assert cache.price(OPTION_MODEL.BLACK_SCHOLES_MODEL.value, OPTION_TYPE.CALL.value, near) == price
+    assert cache.stats()["hits"] == 1 and cache.stats()["misses"] == 1
+
+    # option type and binomial only inputs are part of the key
+    put = cache.price(OPTION_MODEL.BLACK_SCHOLES_MODEL.value, OPTION_TYPE.PUT.value, params)
+    assert put != price
+    european = cache.price(OPTION_MODEL.BINOMIAL_MODEL.value, OPTION_TYPE.PUT.value, params)
+    american_params = {**params, PARAMETERS.EXERCISE_STYLE.value: EXERCISE_STYLE.AMERICAN.value}
+    american = cache.price(OPTION_MODEL.BINOMIAL_MODEL.value, OPTION_TYPE.PUT.value, american_params)
+    assert american == BinomialModel(OPTION_TYPE.PUT.value, american_params).calculate_price()
+    assert american > european
+    assert cache.stats()["misses"] == 4
+
+
+def test_cache_lru_eviction_and_ttl():
+    clock = FakeClock()
+    cache = PricingCache(max_size=2, ttl_seconds=10, clock=clock)
+    for key, price in [("a", 1.0), ("b", 2.0)]:
+        cache.put(key, price)
+    assert cache.get("a") == 1.0  # a becomes most recently used
+    cache.put("c", 3.0)
+    assert cache.get("b") is None
+    assert cache.stats()["evictions"] == 1
+
+    clock.now = 11
+    assert cache.get("a") is None
+    assert cache.stats()["expirations"] == 1
+
+
+def test_cache_second_tier_reads_options_calcs(tmp_path):
+    db_path = str(tmp_path / "options_calcs.db")
+    init_db(db_path)
+    insert_run_to_db(OPTION_MODEL.BLACK_SCHOLES_MODEL.value, {**params, "option_type": OPTION_TYPE.CALL.value}, 42.0, db_path)
+
+    cache = PricingCache(db_path=db_path)
+    assert cache.price(OPTION_MODEL.BLACK_SCHOLES_MODEL.value, OPTION_TYPE.CALL.value, params) == 42.0
+    assert cache.price(OPTION_MODEL.BLACK_SCHOLES_MODEL.value, OPTION_TYPE.CALL.value, params) == 42.0
+    assert cache.stats()["db_hits"] == 1 and cache.stats()["hits"] == 1
+
+    # other option type is not served from the call row, the lookup reuses this thread's pooled connection
+    with patch("sqlite3.connect") as connect:
+        assert cache.price(OPTION_MODEL.BLACK_SCHOLES_MODEL.value, OPTION_TYPE.PUT.value, params) != 42.0
+    connect.assert_not_called()
+
+    # missing db behaves as a miss
+    missing = PricingCache(db_path=str(tmp_path / "missing" / "none.db"))
+    assert missing.price(OPTION_MODEL.BLACK_SCHOLES_MODEL.value, OPTION_TYPE.CALL.value, params) == pytest.approx(10.4506, abs=1e-4)
+    close_connections(db_path)
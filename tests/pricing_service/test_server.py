@@ -0,0 +1,154 @@
+import asyncio
+import json
+
+import numpy as np
+import pytest
+
+from option_valuation.batch_pricing import greeks_batch, price_batch
+from pricing_service import server
+from pricing_service.micro_batcher import MicroBatcher
+from utils.enums_option import EXERCISE_STYLE, OPTION_MODEL, OPTION_TYPE
+
+CONTRACT = {
+    "option_type": OPTION_TYPE.PUT.value,
+    "stock_price": 100,
+    "strike_price": 105,
+    "days_to_expiry": 180,
+    "interest_rate": 0.04,
+    "volatility": 0.25,
+    "dividend_yield": 0.01,
+}
+
+
+# Helper to send one request straight to the ASGI app, returns (status, decoded JSON body)
+async def call(method: str, path: str, payload=None) -> tuple:
+    body = b"" if payload is None else json.dumps(payload).encode()
+    messages = [{"type": "http.request", "body": body, "more_body": False}]
+    sent = []
+
+    async def receive():
+        return messages.pop(0)
+
+    async def send(message):
+        sent.append(message)
+
+    await server.app({"type": "http", "method": method, "path": path}, receive, send)
+    return sent[0]["status"], json.loads(sent[1]["body"])
+
+
+def request(method: str, path: str, payload=None) -> tuple:
+    return asyncio.run(call(method, path, payload))
+
+
+def test_single_price_matches_batch_pricing():
+    payload = {
+        **CONTRACT, "option_model": OPTION_MODEL.BINOMIAL_MODEL.value,
+        "time_steps": 200, "exercise_style": EXERCISE_STYLE.AMERICAN.value
+    }
+    status, body = request("POST", "/price", payload)
+    expected = price_batch(
+        OPTION_MODEL.BINOMIAL_MODEL.value, OPTION_TYPE.PUT.value, 100, 105, 180, 0.04, 0.25, 0.01,
+        N=200, exercise_style=EXERCISE_STYLE.AMERICAN.value
+    )
+    assert status == 200
+    assert body["price"] == pytest.approx(float(expected), rel=1e-12)
+
+
+def test_batch_endpoints_broadcast_lists():
+    S = [90.0, 100.0, 110.0]
+    status, body = request("POST", "/price/batch", {**CONTRACT, "stock_price": S, "option_model": OPTION_MODEL.BLACK_SCHOLES_MODEL.value})
+    assert status == 200
+    np.testing.assert_allclose(body["prices"], price_batch(OPTION_MODEL.BLACK_SCHOLES_MODEL.value, OPTION_TYPE.PUT.value, S, 105, 180, 0.04, 0.25, 0.01))
+
+    status, body = request("POST", "/greeks/batch", {**CONTRACT, "stock_price": S})
+    expected = greeks_batch(OPTION_TYPE.PUT.value, S, 105, 180, 0.04, 0.25, 0.01)
+    assert status == 200
+    np.testing.assert_allclose(body["delta"], expected["delta"])
+
+    prices = body["price"]
+    status, body = request("POST", "/iv/batch", {**CONTRACT, "stock_price": S, "option_price": prices + [200.0]})
+    assert status == 400  # 3 spots against 4 prices do not broadcast
+
+    status, body = request("POST", "/iv/batch", {**CONTRACT, "stock_price": S, "option_price": prices})
+    assert status == 200
+    np.testing.assert_allclose(body["implied_volatility"], 0.25, rtol=1e-6)
+    assert body["status"] == ["converged"] * 3
+
+
+def test_concurrent_single_requests_share_one_vectorized_call():
+    strikes = np.linspace(80, 120, 50)
+
+    async def burst():
+        batches_before = server.price_batcher.batches
+        responses = await asyncio.gather(*(
+            call("POST", "/price", {**CONTRACT, "strike_price": X, "option_model": OPTION_MODEL.BLACK_SCHOLES_MODEL.value})
+            for X in strikes
+        ))
+        return responses, server.price_batcher.batches - batches_before
+
+    responses, batches = asyncio.run(burst())
+    prices = [body["price"] for _, body in responses]
+    np.testing.assert_allclose(prices, price_batch(OPTION_MODEL.BLACK_SCHOLES_MODEL.value, OPTION_TYPE.PUT.value, 100, strikes, 180, 0.04, 0.25, 0.01))
+    assert batches == 1
+
+
+def test_single_iv_and_greeks():
+    status, body = request("POST", "/greeks", {**CONTRACT, "higher_order": True})
+    assert status == 200
+    assert {"price", "delta", "vanna", "volga"} <= set(body)
+
+    status, body = request("POST", "/iv", {**CONTRACT, "option_price": body["price"]})
+    assert status == 200
+    assert body["implied_volatility"] == pytest.approx(0.25, rel=1e-6)
+
+    # below intrinsic value is unsolvable, NaN comes back as null
+    status, body = request("POST", "/iv", {**CONTRACT, "option_type": OPTION_TYPE.CALL.value, "option_price": 1e6})
+    assert body == {"implied_volatility": None, "status": "failed"}
+
+
+@pytest.mark.parametrize(
+    "method, path, payload, expected_status",
+    [
+        ("POST", "/price", {**CONTRACT, "option_model": "unknown"}, 400),
+        ("POST", "/price", {**CONTRACT, "option_model": OPTION_MODEL.BLACK_SCHOLES_MODEL.value, "exercise_style": EXERCISE_STYLE.AMERICAN.value}, 400),
+        ("POST", "/price", {"option_model": OPTION_MODEL.BLACK_SCHOLES_MODEL.value, "option_type": OPTION_TYPE.CALL.value}, 400),
+        ("POST", "/greeks", {**CONTRACT, "option_type": "straddle"}, 400),
+        ("POST", "/greeks", {**CONTRACT, "volatility": "high"}, 400),
+        ("POST", "/greeks", {**CONTRACT, "volatility": 0.0}, 400),
+        ("POST", "/price", {**CONTRACT, "option_model": OPTION_MODEL.BLACK_SCHOLES_MODEL.value, "days_to_expiry": 0}, 400),
+        ("POST", "/price", {**CONTRACT, "option_model": OPTION_MODEL.BINOMIAL_MODEL.value, "stock_price": -100.0}, 400),
+        ("POST", "/price/batch", {**CONTRACT, "option_model": OPTION_MODEL.BLACK_SCHOLES_MODEL.value, "stock_price": [100.0, 0.0]}, 400),
+        ("POST", "/iv", {**CONTRACT, "option_price": 5.0, "strike_price": -1.0}, 400),
+        ("POST", "/price", {**CONTRACT, "option_model": OPTION_MODEL.BINOMIAL_MODEL.value, "time_steps": 1_000_000}, 400),
+        ("POST", "/unknown", {}, 404),
+        ("GET", "/price", None, 405),
+        ("GET", "/health", None, 200),
+    ]
+)
+def test_routing_and_validation(method, path, payload, expected_status):
+    status, body = request(method, path, payload)
+    assert status == expected_status
+    if expected_status != 200:
+        assert "error" in body
+
+
+def test_micro_batcher_flushes_full_batches_and_propagates_errors():
+    calls = []
+
+    def double(key, rows):
+        calls.append(len(rows))
+        if any(row < 0 for row in rows):
+            raise ValueError("negative row")
+        return [2 * row for row in rows]
+
+    async def run():
+        batcher = MicroBatcher(double, max_batch=4, max_delay=10.0)
+        results = await asyncio.gather(*(batcher.submit("key", row) for row in range(8)))
+        errors = await asyncio.gather(*(MicroBatcher(double, max_delay=0.0).submit("key", -1) for _ in range(1)), return_exceptions=True)
+        return results, errors, batcher.stats()
+
+    results, errors, stats = asyncio.run(run())
+    assert results == [2 * row for row in range(8)]
+    assert calls[:2] == [4, 4]  # full batches flushed without waiting for max_delay
+    assert isinstance(errors[0], ValueError)
+    assert stats == {"requests": 8, "batches": 2, "mean_batch_size": 4.0}
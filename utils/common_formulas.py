@@ -1,20 +1,28 @@
-from scipy.optimize import brentq
+from typing import TYPE_CHECKING
+
 import numpy as np
-import pandas as pd
 
 from option_valuation.black_scholes_model import BlackScholesModel
 from utils.enums_market import SAMPLING_FREQ
-from utils.enums_option import OPTION_TYPE, PARAMETERS
+from utils.enums_option import IV_STATUS, OPTION_TYPE, PARAMETERS
+from utils.normal_distribution import norm_pdf
 from utils.options_formulas import call_blackscholes
+from utils.volatility_estimators import ANNUALIZATION_FACTOR
+from utils.yield_curve import default_yield_curve
+
+if TYPE_CHECKING:
+    import pandas as pd
 
 """
 Adjust price series based on sampling frequency.
 Frequency of data sampling: (daily, weekly, momnthly).
 """
 def price_sampling_adjustment(
-        prices: pd.Series,  # pandas series of daily closing prices
+        prices: "pd.Series",  # pandas series of daily closing prices
         sampling_freq: str
-) -> pd.Series:
+) -> "pd.Series":
+    import pandas as pd
+
     if not isinstance(prices.index, pd.DatetimeIndex):
         raise ValueError("Price series must have a DateTimeIndex.")
 
@@ -35,29 +43,24 @@ def price_sampling_adjustment(
 """
 Volatility (sigma) of single stock in stock market.
 Formula: Sample standard deviation (an unbiased estimator of the log returns over specified period.
-sigma = sqrt[(1/n-1) * sum((log(r) - E(r))^2)] * sqrt
+sigma = sqrt[(1/n-1) * sum((log(r) - E(r))^2)] * sqrt(annualization factor)
 
-Rolling window basis depending on:
-1. Option window (default)
-3. Frequency of data sampling: (daily, weekly, momnthly)
+Single full sample estimate over every price given, annualized by the frequency of data sampling:
+(daily, weekly, momnthly). For rolling/ streaming estimates (close to close, EWMA, range based)
+see utils.volatility_estimators.
 """
 def annualized_volatility(
-    prices: pd.Series,  # pandas series of daily closing prices
+    prices: "pd.Series",  # pandas series of daily closing prices
     sampling_freq: str
 ):
+    if sampling_freq not in ANNUALIZATION_FACTOR:
+        raise ValueError(f"Unsupported sampling frequency: {sampling_freq}")
+
     log_returns = np.log(prices/prices.shift(1)).dropna()
     daily_vol = log_returns.std(ddof=1)  # since sample estimate, ddof=1 i.e. division of N-1
-    annualization_factor = {
-        SAMPLING_FREQ.DAILY.value: 252,
-        SAMPLING_FREQ.WEEKLY.value: 52,
-        SAMPLING_FREQ.MONTHLY.value: 12
-    }
 
-    if sampling_freq not in annualization_factor:
-        raise ValueError(f"Unsupported sampling frequency: {sampling_freq}")
-    
     # Annualize volatility
-    annual_vol = daily_vol * np.sqrt(annualization_factor[sampling_freq])
+    annual_vol = daily_vol * np.sqrt(ANNUALIZATION_FACTOR[sampling_freq])
     return annual_vol
 
 
@@ -100,6 +103,8 @@ def BS_brent_implied_volatility(
         BS_price = model.calculate_price()
         return BS_price - option_price
 
+    from scipy.optimize import brentq
+
     # to attempt root-finding within reasonable sigma bandwidth
     try:
         return brentq(price_diff, sigma_lower, sigma_upper)
@@ -107,30 +112,133 @@ def BS_brent_implied_volatility(
         return None
     
 
+"""
+Vectorized implied volatility for a whole chain of options solved simultaneously.
+Same inputs as BS_brent_implied_volatility but each may be an array (broadcast against each other).
+
+Core idea:
+    - puts are mapped to calls through put-call parity so one Black-Scholes call evaluation per
+      iteration prices every live contract (no per contract model/ params allocation)
+    - start from the Corrado-Miller rational approximation, then safeguarded Newton steps with vega
+    - every element keeps its own [sigma_lower, sigma_upper] bracket, any Newton step leaving it
+      (or with vanishing vega) is replaced by bisection of the bracket for that element only
+    - converged elements drop out of the live set each iteration
+
+Returns (implied_volatility, status) arrays, status holds IV_STATUS values per element.
+Matching the scalar solver, prices at/ below intrinsic give 0.0 and unsolvable ones give NaN.
+"""
+def BS_vectorized_implied_volatility(
+    option_price,
+    S,
+    X,
+    T,  # days to expiry
+    r,
+    option_type,  # OPTION_TYPE value or array of them
+    q=0.0,
+    sigma_tol: float = 1e-10,  # on the Newton step/ bracket width, flat vega makes a price tolerance unreliable
+    max_iter: int = 100
+) -> tuple:
+    sigma_lower = 1e-6
+    sigma_upper = 5.0
+
+    option_type, option_price, S, X, T, r, q = np.broadcast_arrays(
+        np.asarray(option_type), *(np.asarray(arg, dtype=float) for arg in (option_price, S, X, T, r, q))
+    )
+    shape = S.shape
+    option_type, option_price, S, X, T, r, q = (arg.ravel() for arg in (option_type, option_price, S, X, T, r, q))
+
+    is_call = option_type == OPTION_TYPE.CALL.value
+    years = T / 365
+    forward_S = S * np.exp(-q * years)  # dividend discounted stock price
+    discounted_X = X * np.exp(-r * years)
+
+    iv = np.full(S.size, np.nan)
+    status = np.full(S.size, IV_STATUS.FAILED.value)
+
+    # payout | immediate exercise value
+    intrinsic_value = np.maximum(0.0, np.where(is_call, S - X, X - S))
+    at_intrinsic = option_price <= intrinsic_value + 1e-8
+    iv[at_intrinsic] = 0.0
+    status[at_intrinsic] = IV_STATUS.INTRINSIC.value
+
+    # solve every contract as a call, put-call parity: C = P + S*e^(-qT) - X*e^(-rT)
+    call_price = np.where(is_call, option_price, option_price + forward_S - discounted_X)
+
+    def call_price_vega(idx, sigma):
+        params = {
+            PARAMETERS.STOCK_PRICE.value: S[idx],
+            PARAMETERS.STRIKE_PRICE.value: X[idx],
+            PARAMETERS.DAYS_TO_EXPIRY.value: T[idx],
+            PARAMETERS.INTEREST_RATE.value: r[idx],
+            PARAMETERS.VOLATILITY.value: sigma,
+            PARAMETERS.DIVIDEND_YIELD.value: q[idx],
+        }
+        model = BlackScholesModel(OPTION_TYPE.CALL.value, params)
+        vega = forward_S[idx] * norm_pdf(model.d1) * np.sqrt(years[idx])
+        return model.calculate_call_price(), vega
+
+    # only prices inside the attainable range (BS price at sigma_lower, sigma_upper) have a root
+    idx = np.flatnonzero(~at_intrinsic)
+    lower_price, _ = call_price_vega(idx, np.full(idx.size, sigma_lower))
+    upper_price, _ = call_price_vega(idx, np.full(idx.size, sigma_upper))
+    idx = idx[(call_price[idx] > lower_price) & (call_price[idx] < upper_price)]
+
+    # Corrado-Miller initial guess, falling back to the bracket midpoint where it is undefined
+    target = call_price[idx]
+    moneyness_gap = forward_S[idx] - discounted_X[idx]
+    centred = target - moneyness_gap / 2
+    radicand = np.maximum(centred**2 - moneyness_gap**2 / np.pi, 0.0)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        sigma = np.sqrt(2 * np.pi / years[idx]) / (forward_S[idx] + discounted_X[idx]) * (centred + np.sqrt(radicand))
+    sigma = np.where(np.isfinite(sigma) & (sigma > sigma_lower) & (sigma < sigma_upper), sigma, 0.5)
+
+    lower = np.full(idx.size, sigma_lower)
+    upper = np.full(idx.size, sigma_upper)
+    used_bisection = np.zeros(idx.size, dtype=bool)
+
+    for _ in range(max_iter):
+        if idx.size == 0:
+            break
+        price, vega = call_price_vega(idx, sigma)
+        diff = price - target
+        with np.errstate(divide="ignore", invalid="ignore"):
+            newton = sigma - diff / vega
+
+        small_step = np.abs(newton - sigma) < sigma_tol  # False for NaN steps
+        converged = (diff == 0) | small_step | (upper - lower < sigma_tol)
+        sigma = np.where(small_step, newton, sigma)
+        iv[idx[converged]] = sigma[converged]
+        status[idx[converged]] = np.where(used_bisection[converged], IV_STATUS.BISECTION.value, IV_STATUS.CONVERGED.value)
+
+        # shrink each element's bracket around the root (BS price increases with sigma)
+        upper = np.where(diff > 0, sigma, upper)
+        lower = np.where(diff < 0, sigma, lower)
+
+        bisect = ~((newton > lower) & (newton < upper))  # also catches NaN/ inf from vanishing vega
+        used_bisection |= bisect
+        sigma = np.where(bisect, (lower + upper) / 2, newton)
+
+        live = ~converged
+        idx, sigma, target, lower, upper, used_bisection = (
+            arr[live] for arr in (idx, sigma, target, lower, upper, used_bisection)
+        )
+
+    return iv.reshape(shape), status.reshape(shape)
+
+
 # todo: update to access data from actual API
 """
 Calculates risk free rates for specified periods (in years).
-Returns current risk-free rate (i.e. 3-month rate)
+Returns current risk-free rate (i.e. 3-month rate) when no period is given.
 
-Currently:
-function uses known set of rates for common maturities and find the closes match to requested period
+Rates are interpolated on utils.yield_curve.default_yield_curve (built once at import), so the rate moves
+continuously with the period and period may be an array (e.g. every expiry of a chain at once).
 """
 def get_risk_free_rate(
-    period: float = None  # in years
-) -> float:
-    risk_free_rates = {
-        0.25: 0.0415,  # 3 months
-        0.5: 0.0420,   # 6 months
-        1.0: 0.0430,   # 1 year
-        2.0: 0.0450,   # 2 years
-        5.0: 0.0480    # 5 years
-    }
-    
-    if not period:
+    period=None  # in years, float or array
+):
+    if period is None or (np.isscalar(period) and not period):
         # return current 3 month rate
-        return risk_free_rates[0.25]
-
-    # find closest maturity
-    closest_mat = min(risk_free_rates.keys(), key=lambda x: abs(x-period))
+        return default_yield_curve.zero_rate(0.25)
 
-    return risk_free_rates[closest_mat]
\ No newline at end of file
+    return default_yield_curve.zero_rate(period)
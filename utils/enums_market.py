@@ -4,3 +4,17 @@ class SAMPLING_FREQ(Enum):
     DAILY = "daily"
     WEEKLY = "weekly"
     MONTHLY = "monthly"
+
+
+class VOL_ESTIMATOR(Enum):
+    CLOSE_TO_CLOSE = "close to close"
+    EWMA = "ewma"
+    PARKINSON = "parkinson"
+    GARMAN_KLASS = "garman klass"
+    YANG_ZHANG = "yang zhang"
+
+
+class CURVE_INTERPOLATION(Enum):
+    LINEAR_ZERO = "linear zero"
+    LOG_DISCOUNT = "log discount"
+    MONOTONE_CUBIC = "monotone cubic"
@@ -4,12 +4,14 @@ class OPTION_MODEL(Enum):
     BINOMIAL_MODEL = "binomial model"
     BLACK_SCHOLES_MODEL = "black scholes model"
     SIMPLE_BINOMIAL_MODEL = "simple binomial model"
+    TRINOMIAL_MODEL = "trinomial model"
 
 
 class OPTION_MODEL_ABBR(Enum):
     BINOMIAL_MODEL = "BM"
     BLACK_SCHOLES_MODEL = "BSM"
     SIMPLE_BINOMIAL_MODEL = "SBM"
+    TRINOMIAL_MODEL = "TM"
 
 
 class OPTION_TYPE(Enum):
@@ -24,4 +26,38 @@ class PARAMETERS(Enum):
     VOLATILITY = "volatility"
     DAYS_TO_EXPIRY = "days_to_expiry"
     DIVIDEND_YIELD = "dividend_yield"
-    TIME_STEPS = "time_steps"
\ No newline at end of file
+    TIME_STEPS = "time_steps"
+    EXERCISE_STYLE = "exercise_style"
+    TREE_METHOD = "tree_method"
+    NUM_PATHS = "num_paths"
+    PRICE_STEPS = "price_steps"
+
+
+class EXERCISE_STYLE(Enum):
+    EUROPEAN = "european"
+    AMERICAN = "american"
+
+
+class TREE_METHOD(Enum):
+    CRR = "crr"  # Cox-Ross-Rubinstein
+    TIAN = "tian"  # Tian moment matching
+    LEISEN_REIMER = "leisen reimer"
+    BBS = "bbs"  # CRR with Black-Scholes smoothing at the penultimate step
+    BBSR = "bbsr"  # BBS with two-point Richardson extrapolation
+
+
+class GREEKS(Enum):
+    DELTA = "delta"
+    GAMMA = "gamma"
+    VEGA = "vega"
+    THETA = "theta"
+    RHO = "rho"
+    VANNA = "vanna"
+    VOLGA = "volga"
+
+
+class IV_STATUS(Enum):
+    CONVERGED = 0  # safeguarded Newton converged
+    BISECTION = 1  # converged after falling back to bracketed bisection
+    INTRINSIC = 2  # price at/ below intrinsic value, implied volatility set to 0.0
+    FAILED = 3  # price outside no-arbitrage bounds or no convergence, implied volatility is NaN
@@ -0,0 +1,24 @@
+import math
+
+import numpy as np
+
+"""
+Standard normal pdf/ cdf for the closed-form models, without importing scipy.stats at startup.
+
+scipy.stats alone takes about a second to import, while pricing only needs two of its functions:
+    - pdf: exp(-x^2/2)/ sqrt(2 pi), plain NumPy
+    - cdf: scipy.special.ndtr, the same routine behind scipy.stats.norm.cdf, imported on first call
+Both take scalars or arrays and return the type norm.pdf/ norm.cdf would.
+"""
+# 1/ sqrt(2 pi)
+INV_SQRT_2PI = 1 / math.sqrt(2 * math.pi)
+
+
+def norm_pdf(x):
+    return INV_SQRT_2PI * np.exp(-0.5 * np.square(x))
+
+
+def norm_cdf(x):
+    from scipy.special import ndtr
+
+    return ndtr(x)
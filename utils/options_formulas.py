@@ -1,13 +1,13 @@
 import numpy as np
 
+from option_valuation.batch_pricing import price_batch
 from option_valuation.binomial_model import BinomialModel
-from option_valuation.black_scholes_model import BlackScholesModel
-from option_valuation.simple_binomial_model import SimpleBinomialModel
-from utils.enums_option import PARAMETERS
+from utils.enums_option import EXERCISE_STYLE, OPTION_MODEL, PARAMETERS, TREE_METHOD
 
 """
 Formulas meant to plug into app.components for graphical plots.
 Return list of premium pricing: floats for plotting.
+Each curve is priced in one vectorized call over the whole stock price range, params is never mutated.
 """
 
 def call_blackscholes(
@@ -15,14 +15,7 @@ def call_blackscholes(
         S: np.ndarray,
         params: dict,
     ) -> list:
-    # Init Model
-    option_premiums = []
-    for price in S:
-        params[PARAMETERS.STOCK_PRICE.value] = price
-        BSM = BlackScholesModel(option_type, params)
-        option_premiums.append(BSM.calculate_price())
-    
-    return option_premiums
+    return _call_batch(OPTION_MODEL.BLACK_SCHOLES_MODEL.value, option_type, S, params)
 
 
 def call_binomial(
@@ -30,14 +23,17 @@ def call_binomial(
         S: np.ndarray,  # stock_price range
         params: list,
 ) -> list:
-    # Init Model
-    option_premiums = []
-    for price in S:
-        params[PARAMETERS.STOCK_PRICE.value] = price
-        BM = BinomialModel(option_type, params)
-        option_premiums.append(BM.calculate_price())
-    
-    return option_premiums
+    # whole curve from a single tree's terminal distribution, see BinomialModel.calculate_price_curve
+    BM = BinomialModel(option_type, {**params, PARAMETERS.STOCK_PRICE.value: np.asarray(S, dtype=float)})
+    return BM.calculate_price_curve().tolist()
+
+
+def call_trinomial(
+        option_type: str,
+        S: np.ndarray,  # stock_price range
+        params: list,
+) -> list:
+    return _call_batch(OPTION_MODEL.TRINOMIAL_MODEL.value, option_type, S, params)
 
 
 def call_simple_binomial(
@@ -45,11 +41,26 @@ def call_simple_binomial(
         S: np.ndarray,  # stock_price range
         params: list,
 ) -> list:
-    # Init Model
-    option_premiums = []
-    for price in S:
-        params[PARAMETERS.STOCK_PRICE.value] = price
-        SBM = SimpleBinomialModel(option_type, params)
-        option_premiums.append(SBM.calculate_price())
-    
-    return option_premiums
\ No newline at end of file
+    return _call_batch(OPTION_MODEL.SIMPLE_BINOMIAL_MODEL.value, option_type, S, params)
+
+
+def _call_batch(
+        option_model: str,
+        option_type: str,
+        S: np.ndarray,
+        params: dict,
+) -> list:
+    option_premiums = price_batch(
+        option_model,
+        option_type,
+        S,
+        params.get(PARAMETERS.STRIKE_PRICE.value),
+        params.get(PARAMETERS.DAYS_TO_EXPIRY.value, np.nan),
+        params.get(PARAMETERS.INTEREST_RATE.value),
+        params.get(PARAMETERS.VOLATILITY.value),
+        params.get(PARAMETERS.DIVIDEND_YIELD.value) or 0.0,
+        N=params.get(PARAMETERS.TIME_STEPS.value, 100),
+        exercise_style=params.get(PARAMETERS.EXERCISE_STYLE.value, EXERCISE_STYLE.EUROPEAN.value),
+        tree_method=params.get(PARAMETERS.TREE_METHOD.value, TREE_METHOD.CRR.value),
+    )
+    return option_premiums.tolist()
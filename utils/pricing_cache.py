@@ -0,0 +1,130 @@
+from collections import OrderedDict
+import sqlite3
+import threading
+import time
+
+from db.sqlite.db_utils import generate_unique_code, get_connection
+from option_valuation.batch_pricing import MODELS
+
+"""
+Memoizing pricing cache in front of every option model.
+
+Keys are db_utils.generate_unique_code of the model and parameters, which rounds stock price, rates,
+volatility and dividend to 4 decimals and strike to 1/1000, so repeated and near-identical queries
+share one entry.
+
+Lookup order:
+    1. in-process LRU with per entry TTL
+    2. optional SQLite second tier: latest options_calcs row with the same unique_code
+    3. model calculation, stored back into the LRU
+Counters for hits, misses, evictions, expirations and second tier hits are kept per cache.
+"""
+class PricingCache:
+    def __init__(
+            self,
+            max_size: int = 1024,  # LRU capacity, least recently used entry evicted beyond this
+            ttl_seconds: float = 3600.0,  # entry lifetime, None to never expire
+            db_path: str = None,  # options_calcs database for the second tier, None to disable
+            clock=time.monotonic
+    ):
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        self.db_path = db_path
+        self._clock = clock
+        self._entries = OrderedDict()  # key -> (price, expires_at)
+        self._lock = threading.Lock()  # streamlit sessions run on separate threads
+        self.reset_stats()
+
+    def price(
+            self,
+            option_model: str,  # OPTION_MODEL value
+            option_type: str,  # OPTION_TYPE value
+            params: dict
+    ) -> float:
+        """
+        Cached equivalent of MODELS[option_model](option_type, params).calculate_price().
+        """
+        key = self.key(option_model, option_type, params)
+        price = self.get(key)
+        if price is not None:
+            return price
+
+        price = self._get_from_db(key)
+        if price is None:
+            price = MODELS[option_model](option_type, params).calculate_price()
+        self.put(key, price)
+        return price
+
+    def key(self, option_model: str, option_type: str, params: dict) -> str:
+        return generate_unique_code(option_model, {**params, "option_type": option_type})
+
+    def get(self, key: str):
+        """
+        Returns the cached price or None, counting a hit or miss.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                price, expires_at = entry
+                if expires_at is not None and self._clock() >= expires_at:
+                    del self._entries[key]
+                    self.expirations += 1
+                else:
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return price
+            self.misses += 1
+            return None
+
+    def put(self, key: str, price: float) -> None:
+        expires_at = None if self.ttl_seconds is None else self._clock() + self.ttl_seconds
+        with self._lock:
+            self._entries[key] = (price, expires_at)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def reset_stats(self) -> None:
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self.db_hits = 0
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "size": len(self._entries),
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "expirations": self.expirations,
+                "db_hits": self.db_hits,
+            }
+
+    def _get_from_db(self, key: str):
+        if self.db_path is None:
+            return None
+        try:
+            # this thread's pooled WAL connection, not a connect per miss
+            row = get_connection(self.db_path).execute(
+                "SELECT option_price FROM options_calcs WHERE unique_code = ? ORDER BY id DESC LIMIT 1",
+                (key,)
+            ).fetchone()
+        except sqlite3.Error:  # missing db/ table behaves as a second tier miss
+            return None
+
+        if row is None or row[0] is None:
+            return None
+        with self._lock:
+            self.db_hits += 1
+        return row[0]
+
+
+# Shared cache used by the app tabs, second tier reads the app's options_calcs history
+pricing_cache = PricingCache(db_path="options_calcs.db")
@@ -0,0 +1,289 @@
+from abc import ABC, abstractmethod
+from collections import deque
+import math
+
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+from utils.enums_market import SAMPLING_FREQ, VOL_ESTIMATOR
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+"""
+Historical volatility estimators, streaming and vectorized.
+
+Streaming estimators take one bar at a time through update() and keep O(1) state per bar
+(running sums/ Welford moments over a fixed window of bars), so a live feed never recomputes
+the full history. rolling_volatility produces the same estimates for a whole bar history at once.
+Every estimate is annualized with ANNUALIZATION_FACTOR of the bars' sampling frequency.
+
+Per bar estimators (with o/ h/ l/ c the log open/ high/ low/ close):
+    - close to close: sample std of log returns c_t - c_{t-1} (Welford)
+    - ewma: RiskMetrics var_t = lambda * var_{t-1} + (1 - lambda) * r_t^2, seeded with r_1^2
+    - parkinson: mean of (h - l)^2 / (4 ln 2)
+    - garman klass: mean of 0.5 (h - l)^2 - (2 ln 2 - 1)(c - o)^2
+    - yang zhang: var(o_t - c_{t-1}) + k var(c - o) + (1 - k) mean((h - c)(h - o) + (l - c)(l - o)),
+      k = 0.34 / (1.34 + (n + 1) / (n - 1)), robust to opening gaps and drift
+"""
+ANNUALIZATION_FACTOR = {
+    SAMPLING_FREQ.DAILY.value: 252,
+    SAMPLING_FREQ.WEEKLY.value: 52,
+    SAMPLING_FREQ.MONTHLY.value: 12
+}
+
+# RiskMetrics decay for daily returns
+EWMA_LAMBDA = 0.94
+
+
+class StreamingVolatility(ABC):
+    """
+    Base for streaming estimators: update() consumes one bar and returns the current annualized
+    volatility (NaN until the window has enough bars).
+    """
+    def __init__(
+            self,
+            window: int = None,  # bars per estimate, None for an expanding window
+            sampling_freq: str = SAMPLING_FREQ.DAILY.value
+    ):
+        if sampling_freq not in ANNUALIZATION_FACTOR:
+            raise ValueError(f"Unsupported sampling frequency: {sampling_freq}")
+        self.window = window
+        self.sampling_freq = sampling_freq
+        self.prev_close = None
+
+    @property
+    def volatility(self) -> float:
+        variance = self.variance
+        if math.isnan(variance):
+            return math.nan
+        return math.sqrt(max(variance, 0.0) * ANNUALIZATION_FACTOR[self.sampling_freq])
+
+    @property
+    @abstractmethod
+    def variance(self) -> float:
+        pass
+
+    @abstractmethod
+    def update(self, close: float, open: float = None, high: float = None, low: float = None) -> float:
+        pass
+
+
+class CloseToCloseVolatility(StreamingVolatility):
+    def __init__(self, window: int = None, sampling_freq: str = SAMPLING_FREQ.DAILY.value):
+        super().__init__(window, sampling_freq)
+        self._returns = _RollingMoments(window)
+
+    @property
+    def variance(self) -> float:
+        return self._returns.variance()
+
+    def update(self, close, open=None, high=None, low=None) -> float:
+        if self.prev_close is not None:
+            self._returns.add(math.log(close / self.prev_close))
+        self.prev_close = close
+        return self.volatility
+
+
+class EWMAVolatility(StreamingVolatility):
+    def __init__(self, lam: float = EWMA_LAMBDA, sampling_freq: str = SAMPLING_FREQ.DAILY.value):
+        super().__init__(None, sampling_freq)
+        self.lam = lam
+        self._variance = math.nan
+
+    @property
+    def variance(self) -> float:
+        return self._variance
+
+    def update(self, close, open=None, high=None, low=None) -> float:
+        if self.prev_close is not None:
+            squared_return = math.log(close / self.prev_close) ** 2
+            if math.isnan(self._variance):
+                self._variance = squared_return
+            else:
+                self._variance = self.lam * self._variance + (1 - self.lam) * squared_return
+        self.prev_close = close
+        return self.volatility
+
+
+class ParkinsonVolatility(StreamingVolatility):
+    def __init__(self, window: int = 20, sampling_freq: str = SAMPLING_FREQ.DAILY.value):
+        super().__init__(window, sampling_freq)
+        self._terms = _RollingMoments(window)
+
+    @property
+    def variance(self) -> float:
+        return self._terms.mean() if self._terms.full() else math.nan
+
+    def update(self, close, open=None, high=None, low=None) -> float:
+        self._terms.add(_parkinson_term(math.log(high / low)))
+        self.prev_close = close
+        return self.volatility
+
+
+class GarmanKlassVolatility(StreamingVolatility):
+    def __init__(self, window: int = 20, sampling_freq: str = SAMPLING_FREQ.DAILY.value):
+        super().__init__(window, sampling_freq)
+        self._terms = _RollingMoments(window)
+
+    @property
+    def variance(self) -> float:
+        return self._terms.mean() if self._terms.full() else math.nan
+
+    def update(self, close, open=None, high=None, low=None) -> float:
+        self._terms.add(_garman_klass_term(math.log(high / low), math.log(close / open)))
+        self.prev_close = close
+        return self.volatility
+
+
+class YangZhangVolatility(StreamingVolatility):
+    def __init__(self, window: int = 20, sampling_freq: str = SAMPLING_FREQ.DAILY.value):
+        if window is None or window < 2:
+            raise ValueError("Yang-Zhang volatility needs a window of at least 2 bars.")
+        super().__init__(window, sampling_freq)
+        self.k = _yang_zhang_k(window)
+        self._overnight = _RollingMoments(window)
+        self._open_to_close = _RollingMoments(window)
+        self._rogers_satchell = _RollingMoments(window)
+
+    @property
+    def variance(self) -> float:
+        if not self._overnight.full():
+            return math.nan
+        return (
+            self._overnight.variance()
+            + self.k * self._open_to_close.variance()
+            + (1 - self.k) * self._rogers_satchell.mean()
+        )
+
+    def update(self, close, open=None, high=None, low=None) -> float:
+        # the first bar only provides the previous close for the overnight return
+        if self.prev_close is not None:
+            self._overnight.add(math.log(open / self.prev_close))
+            self._open_to_close.add(math.log(close / open))
+            self._rogers_satchell.add(_rogers_satchell_term(
+                math.log(high / close), math.log(high / open), math.log(low / close), math.log(low / open)
+            ))
+        self.prev_close = close
+        return self.volatility
+
+
+STREAMING_ESTIMATORS = {
+    VOL_ESTIMATOR.CLOSE_TO_CLOSE.value: CloseToCloseVolatility,
+    VOL_ESTIMATOR.EWMA.value: EWMAVolatility,
+    VOL_ESTIMATOR.PARKINSON.value: ParkinsonVolatility,
+    VOL_ESTIMATOR.GARMAN_KLASS.value: GarmanKlassVolatility,
+    VOL_ESTIMATOR.YANG_ZHANG.value: YangZhangVolatility,
+}
+
+
+def rolling_volatility(
+        bars,  # Series of closes, or DataFrame with close (and open/ high/ low for range estimators)
+        estimator: str = VOL_ESTIMATOR.CLOSE_TO_CLOSE.value,  # VOL_ESTIMATOR value
+        window: int = 20,  # None for an expanding window (not yang zhang)
+        sampling_freq: str = SAMPLING_FREQ.DAILY.value,
+        lam: float = EWMA_LAMBDA  # ewma only
+) -> "pd.Series":
+    """
+    Annualized volatility after every bar of the history, vectorized.
+    Value at bar t matches the streaming estimator after update() with bars up to t.
+    """
+    if sampling_freq not in ANNUALIZATION_FACTOR:
+        raise ValueError(f"Unsupported sampling frequency: {sampling_freq}")
+    import pandas as pd
+
+    if isinstance(bars, pd.Series):
+        bars = bars.to_frame("close")
+
+    log_close = np.log(bars["close"])
+    if estimator == VOL_ESTIMATOR.CLOSE_TO_CLOSE.value:
+        variance = _window(log_close.diff(), window).var(ddof=1)
+    elif estimator == VOL_ESTIMATOR.EWMA.value:
+        variance = (log_close.diff() ** 2).ewm(alpha=1 - lam, adjust=False, ignore_na=True).mean()
+    elif estimator == VOL_ESTIMATOR.PARKINSON.value:
+        variance = _window(_parkinson_term(np.log(bars["high"] / bars["low"])), window).mean()
+    elif estimator == VOL_ESTIMATOR.GARMAN_KLASS.value:
+        variance = _window(_garman_klass_term(
+            np.log(bars["high"] / bars["low"]), np.log(bars["close"] / bars["open"])
+        ), window).mean()
+    elif estimator == VOL_ESTIMATOR.YANG_ZHANG.value:
+        if window is None or window < 2:
+            raise ValueError("Yang-Zhang volatility needs a window of at least 2 bars.")
+        log_open, log_high, log_low = (np.log(bars[col]) for col in ("open", "high", "low"))
+        # drop the first bar so all three windows cover the same bars as the streaming estimator
+        overnight = (log_open - log_close.shift(1)).iloc[1:]
+        open_to_close = (log_close - log_open).iloc[1:]
+        rogers_satchell = _rogers_satchell_term(
+            log_high - log_close, log_high - log_open, log_low - log_close, log_low - log_open
+        ).iloc[1:]
+        k = _yang_zhang_k(window)
+        variance = (
+            overnight.rolling(window).var(ddof=1)
+            + k * open_to_close.rolling(window).var(ddof=1)
+            + (1 - k) * rogers_satchell.rolling(window).mean()
+        ).reindex(bars.index)
+    else:
+        raise ValueError(f"Unsupported volatility estimator: {estimator}")
+
+    return np.sqrt(variance.clip(lower=0.0) * ANNUALIZATION_FACTOR[sampling_freq]).rename(estimator)
+
+
+"""
+Helper for O(1) windowed mean/ sample variance: Welford updates on add, reversed on removal of the
+value leaving the window. window=None keeps every value (expanding).
+"""
+class _RollingMoments:
+    def __init__(self, window: int = None):
+        self.window = window
+        self._values = deque()
+        self.count = 0
+        self._mean = 0.0
+        self._m2 = 0.0
+
+    def add(self, value: float) -> None:
+        self.count += 1
+        delta = value - self._mean
+        self._mean += delta / self.count
+        self._m2 += delta * (value - self._mean)
+        if self.window is not None:
+            self._values.append(value)
+            if len(self._values) > self.window:
+                self._remove(self._values.popleft())
+
+    def _remove(self, value: float) -> None:
+        self.count -= 1
+        delta = value - self._mean
+        self._mean -= delta / self.count
+        self._m2 -= delta * (value - self._mean)
+
+    def full(self) -> bool:
+        return self.count > 0 and (self.window is None or self.count == self.window)
+
+    def mean(self) -> float:
+        return self._mean if self.count else math.nan
+
+    def variance(self) -> float:
+        if self.count < 2 or (self.window is not None and self.count < self.window):
+            return math.nan
+        return self._m2 / (self.count - 1)
+
+
+def _window(series: "pd.Series", window: int):
+    return series.expanding() if window is None else series.rolling(window)
+
+
+def _parkinson_term(log_high_low):
+    return log_high_low ** 2 / (4 * math.log(2))
+
+
+def _garman_klass_term(log_high_low, log_close_open):
+    return 0.5 * log_high_low ** 2 - (2 * math.log(2) - 1) * log_close_open ** 2
+
+
+def _rogers_satchell_term(log_high_close, log_high_open, log_low_close, log_low_open):
+    return log_high_close * log_high_open + log_low_close * log_low_open
+
+
+def _yang_zhang_k(window: int) -> float:
+    return 0.34 / (1.34 + (window + 1) / (window - 1))
@@ -0,0 +1,108 @@
+import os
+
+import numpy as np
+
+from utils.enums_market import CURVE_INTERPOLATION
+
+"""
+Risk free yield curve built once from zero rates at a few tenors.
+
+Rates are continuously compounded zero rates (the convention of every model's e^(-rT)), maturities in years.
+Interpolation is set up once in __init__ and every query is a vectorized evaluation, so arrays of
+maturities (a whole chain) are priced in one call and rates move continuously with maturity:
+    - linear zero: linear in the zero rate
+    - log discount: linear in log discount factor r*t, i.e. piecewise flat forward rates
+    - monotone cubic: PCHIP through the zero rates, smooth and without overshoot between tenors
+Beyond the quoted tenors the zero rate is held flat at the first/ last tenor's rate.
+
+CSV files hold one row per tenor with columns maturity (years) and rate (decimal zero rate).
+"""
+# Current reference zero rates per maturity (years)
+DEFAULT_ZERO_RATES = {
+    0.25: 0.0415,  # 3 months
+    0.5: 0.0420,   # 6 months
+    1.0: 0.0430,   # 1 year
+    2.0: 0.0450,   # 2 years
+    5.0: 0.0480    # 5 years
+}
+
+
+class YieldCurve:
+    def __init__(
+            self,
+            maturities,  # years, increasing
+            zero_rates,  # continuously compounded, one per maturity
+            interpolation: str = CURVE_INTERPOLATION.LINEAR_ZERO.value  # CURVE_INTERPOLATION value
+    ):
+        self.maturities = np.asarray(maturities, dtype=float)
+        self.zero_rates = np.asarray(zero_rates, dtype=float)
+        self.interpolation = interpolation
+
+        if self.maturities.ndim != 1 or self.maturities.shape != self.zero_rates.shape or self.maturities.size == 0:
+            raise ValueError("Yield curve needs one zero rate per maturity.")
+        if np.any(self.maturities <= 0) or np.any(np.diff(self.maturities) <= 0):
+            raise ValueError("Yield curve maturities must be positive and strictly increasing.")
+
+        if interpolation == CURVE_INTERPOLATION.MONOTONE_CUBIC.value:
+            if self.maturities.size < 2:
+                self._pchip = None
+            else:
+                from scipy.interpolate import PchipInterpolator
+                self._pchip = PchipInterpolator(self.maturities, self.zero_rates, extrapolate=False)
+        elif interpolation not in (CURVE_INTERPOLATION.LINEAR_ZERO.value, CURVE_INTERPOLATION.LOG_DISCOUNT.value):
+            raise ValueError(f"Unsupported yield curve interpolation: {interpolation}")
+
+    @classmethod
+    def from_csv(cls, path: str, interpolation: str = CURVE_INTERPOLATION.LINEAR_ZERO.value) -> "YieldCurve":
+        import pandas as pd
+
+        tenors = pd.read_csv(path).sort_values("maturity")
+        return cls(tenors["maturity"].to_numpy(), tenors["rate"].to_numpy(), interpolation)
+
+    @classmethod
+    def from_dict(cls, zero_rates: dict, interpolation: str = CURVE_INTERPOLATION.LINEAR_ZERO.value) -> "YieldCurve":
+        maturities = sorted(zero_rates)
+        return cls(maturities, [zero_rates[t] for t in maturities], interpolation)
+
+    def zero_rate(self, t):
+        """
+        Zero rate(s) for maturity/ maturities t in years.
+        """
+        t = np.asarray(t, dtype=float)
+        clamped = np.clip(t, self.maturities[0], self.maturities[-1])
+
+        if self.interpolation == CURVE_INTERPOLATION.LOG_DISCOUNT.value:
+            log_discount = np.interp(clamped, self.maturities, self.zero_rates * self.maturities)
+            rates = log_discount / clamped
+        elif self.interpolation == CURVE_INTERPOLATION.MONOTONE_CUBIC.value and self._pchip is not None:
+            rates = self._pchip(clamped)
+        else:
+            rates = np.interp(clamped, self.maturities, self.zero_rates)
+        return rates[()]
+
+    def discount_factor(self, t):
+        """
+        e^(-r(t) t) for maturity/ maturities t in years.
+        """
+        t = np.asarray(t, dtype=float)
+        return np.exp(-self.zero_rate(t) * t)[()]
+
+    def forward_rate(self, t1, t2):
+        """
+        Continuously compounded forward rate(s) between maturities t1 < t2.
+        """
+        t1, t2 = np.asarray(t1, dtype=float), np.asarray(t2, dtype=float)
+        return ((self.zero_rate(t2) * t2 - self.zero_rate(t1) * t1) / (t2 - t1))[()]
+
+
+"""
+Curve used by get_risk_free_rate, from the CSV at YIELD_CURVE_CSV when set.
+"""
+def load_default_curve() -> YieldCurve:
+    path = os.getenv("YIELD_CURVE_CSV")
+    if path:
+        return YieldCurve.from_csv(path, os.getenv("YIELD_CURVE_INTERPOLATION", CURVE_INTERPOLATION.LINEAR_ZERO.value))
+    return YieldCurve.from_dict(DEFAULT_ZERO_RATES)
+
+
+default_yield_curve = load_default_curve()